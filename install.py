@@ -289,6 +289,8 @@ def permissions():
     """Configura permissões para acesso a dispositivos de input (hotplug)."""
     import grp
 
+    from src.input.udev import UDEV_RULE
+
     print("=== Configuração de Permissões para Hotplug ===\n")
 
     running_as_root = is_running_as_root()
@@ -338,6 +340,7 @@ def permissions():
     udev_rule += (
         'SUBSYSTEM=="input", ENV{ID_INPUT_JOYSTICK}=="1", MODE="0660", GROUP="input"\n'
     )
+    udev_rule += UDEV_RULE
     udev_rules_path = "/etc/udev/rules.d/99-input-permissions.rules"
 
     if os.path.exists(udev_rules_path):
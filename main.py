@@ -2,44 +2,62 @@ import os
 import signal
 import sys
 from logging import Logger, getLogger
+from types import FrameType
 
-from PySide6.QtWidgets import QApplication
-
-from src.gui.app import AppMainWindow
 from src.instance import (
-    check_pid_exist,
+    SHOW_COMMAND,
+    InstanceLock,
     get_current_pid,
-    read_pid_file,
-    write_pid_file,
+    notify_running_instance,
 )
-from src.log import setup_logging
 
 DEBUG_MODE = not getattr(sys, "frozen", False)
-setup_logging(debug=DEBUG_MODE)
 logger: Logger = getLogger(__name__)
 
 os.environ.setdefault("QT_QPA_PLATFORM", "xcb")
 
-app = QApplication(sys.argv)
+
+def sigterm_handler(signum: int, frame: FrameType | None) -> None:
+    from PySide6.QtWidgets import QApplication
+
+    QApplication.quit()
 
 
-def sigterm_handler(signum, frame):
-    app.quit()
+def sigusr1_handler(signum: int, frame: FrameType | None) -> None:
+    from src.input import get_latency_tracker
+
+    tracker = get_latency_tracker()
+    if not tracker.enabled:
+        logger.info("Input latency tracing is off (settings: input.latency_tracing)")
+        return
+    logger.info(f"Input latency:\n{tracker.dump()}")
 
 
 if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     signal.signal(signal.SIGTERM, sigterm_handler)
+    signal.signal(signal.SIGUSR1, sigusr1_handler)
+
+    instance_lock = InstanceLock()
+    if not instance_lock.acquire():
+        if notify_running_instance(SHOW_COMMAND):
+            logger.debug("Another instance is running, asked it to show")
+            sys.exit(0)
+        logger.error("Another instance holds the lock but did not answer")
+        sys.exit(1)
+
+    # Imported only once the lock is held: a second launch never loads
+    # Qt, nor the settings and pydantic behind logging.
+    from src.log import setup_logging
+
+    setup_logging(debug=DEBUG_MODE)
+
+    from PySide6.QtWidgets import QApplication
+
+    from src.gui.app import AppMainWindow
 
-    loaded_pid: int = read_pid_file()
-    if loaded_pid:
-        if check_pid_exist(loaded_pid):
-            logger.debug(
-                f"Another instancie running with PID: {loaded_pid}",
-            )
-            sys.exit(1)
     logger.info(f"Started with PID: {get_current_pid()}")
-    write_pid_file()
-    app_window = AppMainWindow()
+    app = QApplication(sys.argv)
+    app_window = AppMainWindow(instance_lock=instance_lock)
     app_window.show_ui()
     sys.exit(app.exec())
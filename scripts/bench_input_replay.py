@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Replay an input trace through the input pipeline and report latency.
+
+Usage:
+    python scripts/bench_input_replay.py [TRACE] [--synthetic SECONDS]
+        [--speed X | --virtual] [--gui-interval MS] [--output results.json]
+
+Without hardware or uinput, each traced device becomes a replay device
+read by a ``DeviceEventWorker`` on an ``InputMultiplexer``; actions go
+through the ``ActionQueue`` to a thread standing in for the GUI, which
+drains it every ``--gui-interval`` ms (0 drains as soon as woken).
+``--speed`` replays faster than recorded (``inf`` back to back);
+``--virtual`` replays deterministically on a virtual clock instead and
+only reports the actions produced. ``--synthetic`` generates a trace of
+taps, holds and stick sweeps when no recorded trace is at hand, and
+``--save`` writes the trace that was replayed.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from evdev import ecodes as e  # noqa: E402
+
+from src.input import Action, ActionQueue, InputMultiplexer, RepeatGate  # noqa: E402
+from src.input.latency import LatencyTracker, get_latency_tracker  # noqa: E402
+from src.input.trace import (  # noqa: E402
+    Trace,
+    TraceDevice,
+    TraceEvent,
+    TraceReplayer,
+    read_trace,
+    write_trace,
+)
+
+SEED = 1337
+PAD = TraceDevice(
+    "Microsoft X-Box 360 pad",
+    "/dev/input/event-replay0",
+    (e.BTN_A, e.BTN_B, e.BTN_MODE),
+    {
+        e.ABS_X: (-32768, 32767, 0),
+        e.ABS_Y: (-32768, 32767, 0),
+        e.ABS_HAT0X: (-1, 1, 0),
+        e.ABS_HAT0Y: (-1, 1, 0),
+    },
+)
+
+
+def synthetic_trace(seconds: float, seed: int = SEED) -> Trace:
+    """Taps, held D-pad directions and stick sweeps on one pad."""
+    rng = random.Random(seed)
+    events: list[TraceEvent] = []
+    now = 0.0
+
+    def frame(*changes: tuple[int, int, int]) -> None:
+        time_ns = int(now * 1e9)
+        for ev_type, code, value in changes:
+            events.append(TraceEvent(time_ns, 0, ev_type, code, value))
+        events.append(TraceEvent(time_ns, 0, e.EV_SYN, e.SYN_REPORT, 0))
+
+    while now < seconds:
+        kind = rng.choice(("tap", "hat", "hold", "stick"))
+        if kind == "tap":
+            frame((e.EV_KEY, e.BTN_A, 1))
+            now += 0.08
+            frame((e.EV_KEY, e.BTN_A, 0))
+        elif kind in ("hat", "hold"):
+            axis = rng.choice((e.ABS_HAT0X, e.ABS_HAT0Y))
+            frame((e.EV_ABS, axis, rng.choice((-1, 1))))
+            now += 0.9 if kind == "hold" else 0.06
+            frame((e.EV_ABS, axis, 0))
+        else:
+            axis = rng.choice((e.ABS_X, e.ABS_Y))
+            sign = rng.choice((-1, 1))
+            for step in range(1, 11):  # ~250 Hz sweep out and back
+                frame((e.EV_ABS, axis, sign * 3000 * step))
+                now += 0.004
+            for step in range(9, -1, -1):
+                frame((e.EV_ABS, axis, sign * 3000 * step))
+                now += 0.004
+        now += rng.uniform(0.05, 0.3)
+    return Trace([PAD], events)
+
+
+class RecordingSink:
+    """Keeps every action as dispatched; an ``ActionQueue`` drained only at
+    the end would coalesce moves across the whole replay."""
+
+    def __init__(self) -> None:
+        self.actions: list[Action] = []
+
+    def put(
+        self,
+        actions: list[Action],
+        repeat: bool = False,
+        timestamp: float | None = None,
+    ) -> None:
+        self.actions.extend(actions)
+
+
+def replay_virtual(trace: Trace) -> dict:
+    sink = RecordingSink()
+    replayer = TraceReplayer(trace, sink)
+    started = time.perf_counter()
+    frames = replayer.run_virtual()
+    elapsed = time.perf_counter() - started
+    replayer.close()
+    actions = sink.actions
+    return {
+        "frames": frames,
+        "actions": len(actions),
+        "by_action": {
+            action.name.lower(): actions.count(action)
+            for action in sorted(set(actions))
+        },
+        "replay_s": elapsed,
+    }
+
+
+def replay_realtime(trace: Trace, speed: float, gui_interval: float) -> dict:
+    tracker = get_latency_tracker()
+    tracker.enabled = True
+    tracker.reset()
+    wake = threading.Event()
+    queue = ActionQueue(on_ready=wake.set)
+    gate = RepeatGate()
+    done = threading.Event()
+    handled = 0
+    actions: list[Action] = []
+    timestamps: list[float | None] = []
+
+    def gui() -> None:
+        nonlocal handled
+        while not done.is_set() or queue.depth:
+            wake.wait(0.05)
+            wake.clear()
+            if gui_interval:
+                time.sleep(gui_interval)
+            gate.release()
+            actions.clear()
+            timestamps.clear()
+            queue.drain_into(actions, timestamps)
+            for timestamp in timestamps:
+                if timestamp is not None:
+                    tracker.record("queue", timestamp)
+            handled += len(actions)
+
+    gui_thread = threading.Thread(target=gui, name="FakeGui")
+    gui_thread.start()
+    multiplexer = InputMultiplexer()
+    replayer = TraceReplayer(trace, queue, gate)
+    started = time.monotonic()
+    frames = replayer.run(multiplexer, speed)
+    time.sleep(0.05)
+    elapsed = time.monotonic() - started
+    multiplexer.stop()
+    replayer.close(multiplexer)
+    done.set()
+    wake.set()
+    gui_thread.join()
+    return {
+        "frames": frames,
+        "actions": handled,
+        "replay_s": elapsed,
+        "queue": asdict(queue.stats()),
+        "repeats_skipped": gate.skipped,
+        "latency_us": latency_summary(tracker),
+    }
+
+
+def latency_summary(tracker: LatencyTracker) -> dict[str, dict[str, float]]:
+    return {
+        stage: {
+            "count": histogram.count,
+            "mean": histogram.mean_us,
+            "p50": histogram.percentile(0.5),
+            "p95": histogram.percentile(0.95),
+            "p99": histogram.percentile(0.99),
+            "max": histogram.max_us,
+        }
+        for stage, histogram in tracker.histograms().items()
+        if histogram.count
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("trace", type=Path, nargs="?")
+    parser.add_argument("--synthetic", type=float, metavar="SECONDS")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--virtual", action="store_true")
+    parser.add_argument("--gui-interval", type=float, default=0.0, metavar="MS")
+    parser.add_argument("--save", type=Path, help="write the replayed trace")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.trace:
+        with args.trace.open("rb") as stream:
+            trace = read_trace(stream)
+    else:
+        trace = synthetic_trace(args.synthetic or 10.0)
+    if args.save:
+        with args.save.open("wb") as stream:
+            write_trace(stream, trace)
+    print(
+        f"{len(trace.events)} events, {len(trace.devices)} device(s), "
+        f"{trace.duration:.1f}s",
+        file=sys.stderr,
+    )
+
+    if args.virtual:
+        results = replay_virtual(trace)
+    else:
+        results = replay_realtime(trace, args.speed, args.gui_interval / 1000)
+    results["speed"] = "virtual" if args.virtual else args.speed
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(json.dumps(results, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Benchmark process lookups against synthetic ``/proc`` trees.
+
+Usage:
+    python scripts/bench_process_lookup.py [--sizes 100 1000 10000]
+        [--iterations N] [--output results.json]
+        [--save-baseline] [--compare [BASELINE]] [--threshold 0.25]
+
+Builds process tables of each size in a temporary directory, with a
+realistic mix of kernel threads, daemons, shells and long desktop
+cmdlines, and measures the hot paths ``check_running_processes`` and
+``focus_process`` through ``ProcfsScanner``.
+Every case reports per-call latency (min, median, p95) and the peak memory
+allocated during one call (``tracemalloc``). Comparisons use the minimum,
+which is the least sensitive to scheduling noise.
+
+``--save-baseline`` writes the results to ``scripts/baselines/``;
+``--compare`` prints a report against a stored baseline and exits with
+status 1 when a case got slower or allocates more than ``--threshold``.
+Baselines are machine specific and not versioned: save one on the machine
+that runs the comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.default_settings import DEFAULT_BLOCK_IF_RUNNING  # noqa: E402
+from src.process.scanner import ProcfsScanner  # noqa: E402
+from src.utils import check_running_processes, focus_process  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "process_lookup.json"
+DEFAULT_SIZES = [100, 1000, 10000]
+SEED = 1337
+
+KERNEL_THREADS = ["kworker/0:1", "ksoftirqd/0", "rcu_sched", "migration/0", "kthreadd"]
+DAEMONS = [
+    ["/sbin/init", "splash"],
+    ["/usr/lib/systemd/systemd-journald"],
+    ["/usr/sbin/NetworkManager", "--no-daemon"],
+    ["/usr/bin/dbus-daemon", "--system", "--address=systemd:", "--nofork"],
+    ["/usr/bin/pipewire"],
+    ["/usr/lib/xorg/Xorg", "-core", ":0", "-seat", "seat0", "vt7", "-nolisten", "tcp"],
+]
+USER_PROCESSES = [
+    ["bash"],
+    ["/usr/bin/python3", "/usr/lib/update-notifier/apt-check", "--human-readable"],
+    [
+        "/opt/google/chrome/chrome",
+        "--type=renderer",
+        "--crashpad-handler-pid=2211",
+        "--enable-crash-reporter=,",
+        "--lang=en-US",
+        "--num-raster-threads=4",
+        "--enable-main-frame-before-activation",
+        "--renderer-client-id=7",
+        "--shared-files=v8_context_snapshot_data:100",
+    ],
+    [
+        "/usr/share/code/code",
+        "--type=utility",
+        "--utility-sub-type=node.mojom.NodeService",
+    ],
+    ["/usr/bin/gnome-shell"],
+    ["sleep", "infinity"],
+]
+
+
+def build_proc_tree(root: str, size: int, target: str | None = None) -> list[int]:
+    """Fill *root* with *size* fake processes; *target* runs on the last PID."""
+    rng = random.Random(SEED + size)
+    pids = list(range(1, size + 1))
+    for pid in pids:
+        if target is not None and pid == pids[-1]:
+            args = [f"/usr/bin/{target}", "--standalone"]
+            name = target[:15]
+        elif pid == 1:
+            args, name = DAEMONS[0], "systemd"
+        else:
+            kind = rng.random()
+            if kind < 0.3:
+                name, args = rng.choice(KERNEL_THREADS), []
+            elif kind < 0.5:
+                args = rng.choice(DAEMONS)
+                name = os.path.basename(args[0])[:15]
+            else:
+                args = rng.choice(USER_PROCESSES)
+                name = os.path.basename(args[0])[:15]
+        ppid = 0 if pid == 1 else rng.randint(1, max(1, pid - 1))
+        write_process(root, pid, name, args, ppid)
+    return pids
+
+
+def write_process(root: str, pid: int, name: str, args: list[str], ppid: int) -> None:
+    entry = Path(root, str(pid))
+    entry.mkdir()
+    entry.joinpath("comm").write_bytes(name.encode() + b"\n")
+    cmdline = b"\0".join(a.encode() for a in args)
+    entry.joinpath("cmdline").write_bytes(cmdline + b"\0" if args else b"")
+    entry.joinpath("stat").write_bytes(
+        f"{pid} ({name}) S {ppid} {pid} {pid} 0 -1 4194560 0 0\n".encode()
+    )
+
+
+def measure(func: Callable[[], object], iterations: int) -> dict[str, float]:
+    func()
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "min_us": samples[0] * 1e6,
+        "median_us": statistics.median(samples) * 1e6,
+        "p95_us": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1e6,
+        "peak_alloc_bytes": float(peak - before),
+        "iterations": float(iterations),
+    }
+
+
+def bench_size(size: int, iterations: int) -> dict[str, dict[str, float]]:
+    target = "emulationstation"
+    terms = list(DEFAULT_BLOCK_IF_RUNNING)
+    results: dict[str, dict[str, float]] = {}
+    with (
+        tempfile.TemporaryDirectory(prefix="bench-proc-") as miss_root,
+        tempfile.TemporaryDirectory(prefix="bench-proc-") as hit_root,
+    ):
+        build_proc_tree(miss_root, size)
+        build_proc_tree(hit_root, size, target=target)
+        miss = ProcfsScanner(root=miss_root)
+        hit = ProcfsScanner(root=hit_root)
+        cases: dict[str, Callable[[], object]] = {
+            "check_running_processes[miss]": lambda: check_running_processes(
+                terms, scanner=miss
+            ),
+            "check_running_processes[hit]": lambda: check_running_processes(
+                [*terms, target], scanner=hit
+            ),
+            "focus_process[miss]": lambda: focus_process(target, scanner=miss),
+            "focus_process[hit]": lambda: focus_process(target, scanner=hit),
+        }
+        # Only the lookup is measured; the xdotool/wmctrl fallback is not
+        # spawned.
+        with mock.patch("src.utils.subprocess.run"):
+            for name, func in cases.items():
+                results[f"{name}/{size}"] = measure(func, iterations)
+    return results
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Print a comparison table and return the regressed cases."""
+    regressions: list[str] = []
+    print(
+        f"{'case':<42} {'base us':>10} {'now us':>10} {'delta':>8}"
+        f" {'base KiB':>9} {'now KiB':>9}  status"
+    )
+    for case, now in current.items():
+        base = baseline.get(case)
+        if base is None:
+            print(f"{case:<42} {'-':>10} {now['min_us']:>10.1f}  (new case)")
+            continue
+        delta = now["min_us"] / base["min_us"] - 1 if base["min_us"] else 0.0
+        alloc_base = base["peak_alloc_bytes"]
+        alloc_delta = (
+            now["peak_alloc_bytes"] / alloc_base - 1
+            if alloc_base
+            else float(now["peak_alloc_bytes"] > 0)
+        )
+        status = "ok"
+        if delta > threshold or alloc_delta > threshold:
+            status = "REGRESSED"
+            regressions.append(case)
+        elif delta < -threshold:
+            status = "improved"
+        print(
+            f"{case:<42} {base['min_us']:>10.1f} {now['min_us']:>10.1f}"
+            f" {delta:>+7.0%} {alloc_base / 1024:>9.1f}"
+            f" {now['peak_alloc_bytes'] / 1024:>9.1f}  {status}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--compare", type=Path, nargs="?", const=BASELINE_PATH, metavar="BASELINE"
+    )
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+    if args.compare and not args.compare.exists():
+        parser.error(f"no baseline at {args.compare}, run --save-baseline first")
+
+    results: dict[str, dict[str, float]] = {}
+    for size in args.sizes:
+        print(f"Building {size} processes...", file=sys.stderr)
+        results.update(bench_size(size, args.iterations))
+
+    document = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Baseline saved to {BASELINE_PATH}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) regressed over {args.threshold:.0%}")
+            sys.exit(1)
+        return
+
+    for case, stats in results.items():
+        print(
+            f"  {case:<42} min={stats['min_us']:10.1f}us"
+            f"  median={stats['median_us']:10.1f}us"
+            f"  p95={stats['p95_us']:10.1f}us"
+            f"  peak={stats['peak_alloc_bytes'] / 1024:8.1f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark process scanners against the live process table.
+
+Usage:
+    python scripts/bench_process_scan.py [--iterations N] [--terms T ...]
+
+Compares the psutil and /proc backends for ``check_running_processes``.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.default_settings import DEFAULT_BLOCK_IF_RUNNING  # noqa: E402
+from src.process.scanner import ProcfsScanner, PsutilScanner  # noqa: E402
+from src.types.protocols.process import ProcessScannerProtocol  # noqa: E402
+from src.utils import check_running_processes  # noqa: E402
+
+
+def measure(func: Callable[[], object], iterations: int) -> list[float]:
+    func()
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    mean = statistics.fmean(samples) * 1e6
+    median = statistics.median(samples) * 1e6
+    worst = max(samples) * 1e6
+    print(
+        f"  {label:<28} mean={mean:10.1f}us  median={median:10.1f}us"
+        f"  max={worst:10.1f}us"
+    )
+
+
+def bench_scanner(
+    scanner: ProcessScannerProtocol, terms: list[str], iterations: int
+) -> None:
+    report(
+        "check_running_processes",
+        measure(lambda: check_running_processes(terms, scanner=scanner), iterations),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--terms", nargs="*", default=DEFAULT_BLOCK_IF_RUNNING)
+    args = parser.parse_args()
+
+    print(f"Processes: {sum(1 for n in os.listdir('/proc') if n.isdigit())}")
+    print(f"Terms: {len(args.terms)}, iterations: {args.iterations}")
+    for label, scanner in (("psutil", PsutilScanner()), ("procfs", ProcfsScanner())):
+        print(f"[{label}]")
+        bench_scanner(scanner, args.terms, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
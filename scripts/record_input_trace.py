@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Record input from real controllers into a binary trace.
+
+Usage:
+    python scripts/record_input_trace.py OUTPUT [DEVICE ...] [--duration S]
+
+Without DEVICE paths, every ``/dev/input/event*`` node whose name matches
+``settings.mappings`` is recorded. Recording stops after ``--duration``
+seconds or on Ctrl-C. Events are stamped with ``CLOCK_MONOTONIC`` when the
+kernel allows it; the trace keeps them relative to the first event.
+Replay with ``scripts/bench_input_replay.py``.
+"""
+
+import argparse
+import selectors
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from evdev.device import InputDevice  # noqa: E402
+from evdev.util import list_devices  # noqa: E402
+
+from src.input.registry import MappingIndex  # noqa: E402
+from src.input.trace import TraceDevice, TraceWriter  # noqa: E402
+from src.input.worker import _use_monotonic_clock  # noqa: E402
+from src.settings import get_settings  # noqa: E402
+
+
+def mapped_devices() -> list[str]:
+    index = MappingIndex(get_settings().mappings)
+    paths = []
+    for path in list_devices():
+        try:
+            device = InputDevice(path)
+        except OSError:
+            continue
+        if index.resolve(device.name):
+            paths.append(path)
+        device.close()
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("output", type=Path)
+    parser.add_argument("devices", nargs="*", help="event node paths")
+    parser.add_argument("--duration", type=float, default=None)
+    args = parser.parse_args()
+
+    paths = args.devices or mapped_devices()
+    if not paths:
+        print("No input devices to record", file=sys.stderr)
+        sys.exit(1)
+    devices = [InputDevice(path) for path in paths]
+    for device in devices:
+        if not _use_monotonic_clock(device.fd):
+            print(f"{device.path}: realtime timestamps", file=sys.stderr)
+
+    selector = selectors.DefaultSelector()
+    for index, device in enumerate(devices):
+        selector.register(device, selectors.EVENT_READ, index)
+
+    count = 0
+    deadline = time.monotonic() + args.duration if args.duration else None
+    with args.output.open("wb") as stream:
+        writer = TraceWriter(
+            stream, [TraceDevice.from_input_device(d) for d in devices]
+        )
+        print(f"Recording {len(devices)} device(s), Ctrl-C to stop", file=sys.stderr)
+        try:
+            while selector.get_map() and (
+                deadline is None or time.monotonic() < deadline
+            ):
+                timeout = None if deadline is None else deadline - time.monotonic()
+                for key, _ in selector.select(timeout):
+                    device = devices[key.data]
+                    try:
+                        for event in device.read():
+                            writer.write(key.data, event)
+                            count += 1
+                    except BlockingIOError:
+                        pass
+                    except OSError as e:
+                        print(f"{device.path}: {e}, stopped", file=sys.stderr)
+                        selector.unregister(device)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            selector.close()
+            for device in devices:
+                try:
+                    device.close()
+                except OSError:
+                    pass
+    print(f"{count} events written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Stress the input layer with many virtual gamepads and keyboards.
+
+Usage:
+    python scripts/stress_input.py [--pads 8] [--keyboards 2] [--rate 250]
+        [--duration 5] [--source auto|uinput|fake] [--handler-cost MS]
+        [--output results.json]
+
+Each virtual device fires frames (button taps, D-pad moves, stick sweeps;
+key taps for keyboards) at ``--rate`` frames per second. Devices are UInput
+nodes when ``/dev/uinput`` is writable, in-process pipe-backed fakes
+otherwise. They are read through the real ``DeviceMonitor`` path
+(``DeviceEventWorker`` on the ``InputMultiplexer``, ``ActionQueue``
+drained on the Qt main thread). Actions then take the path of
+``AppMainWindow.actions_handler`` on the offscreen platform: one blocked
+check per batch against a ``ProcessSnapshot``, and moves on a real
+``AppGrid`` built from ``settings.apps`` (focus change and repaint).
+``enter`` and ``toggle_view`` are counted but not run, so nothing is
+launched; ``--handler-cost`` adds a busy-wait per action on top, to model
+a slower target.
+
+The report lists per-device throughput, frames lost (not read, or dropped
+by the kernel with ``SYN_DROPPED``), queue drops, the process thread count
+and GUI-thread latency: per-stage input latency plus the lag of a 10 ms
+timer on the Qt event loop.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from evdev import ecodes as e  # noqa: E402
+from evdev.events import InputEvent  # noqa: E402
+from PySide6.QtCore import QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication, QLabel, QWidget  # noqa: E402
+
+from src.gui.action_manager import ActionManager  # noqa: E402
+from src.gui.components.device_monitor import DeviceMonitor  # noqa: E402
+from src.gui.components.grid import AppGrid  # noqa: E402
+from src.gui.launch_service import LaunchService  # noqa: E402
+from src.input import Action, get_latency_tracker  # noqa: E402
+from src.input.latency import LatencyHistogram  # noqa: E402
+from src.input.trace import ReplayDevice, TraceDevice  # noqa: E402
+from src.process.snapshot import ProcessSnapshot  # noqa: E402
+from src.settings import get_settings  # noqa: E402
+
+PAD_NAME = "Microsoft X-Box 360 pad"
+KEYBOARD_NAME = "Stress Keyboard"
+STICK_RANGE = (-32768, 32767, 0)
+
+
+def pad_frames() -> list[list[tuple[int, int, int]]]:
+    """One cycle of pad frames: taps, D-pad moves and a stick sweep."""
+    frames: list[list[tuple[int, int, int]]] = [
+        [(e.EV_KEY, e.BTN_A, 1)],
+        [(e.EV_KEY, e.BTN_A, 0)],
+    ]
+    for axis in (e.ABS_HAT0X, e.ABS_HAT0Y):
+        for value in (1, 0, -1, 0):
+            frames.append([(e.EV_ABS, axis, value)])
+    for step in range(40):
+        value = int(32767 * math.sin(step / 40 * 2 * math.pi))
+        frames.append([(e.EV_ABS, e.ABS_X, value), (e.EV_ABS, e.ABS_Y, value // 2)])
+    return frames
+
+
+def keyboard_frames() -> list[list[tuple[int, int, int]]]:
+    return [
+        [(e.EV_KEY, code, value)]
+        for code in (e.KEY_LEFT, e.KEY_RIGHT, e.KEY_ENTER)
+        for value in (1, 0)
+    ]
+
+
+def describe(name: str, keyboard: bool, index: int) -> TraceDevice:
+    if keyboard:
+        keys = (e.KEY_LEFT, e.KEY_RIGHT, e.KEY_ENTER)
+        return TraceDevice(f"{name} {index}", f"/dev/input/stress-kbd{index}", keys)
+    return TraceDevice(
+        f"{name} {index}",
+        f"/dev/input/stress-pad{index}",
+        (e.BTN_A, e.BTN_B, e.BTN_MODE),
+        {
+            e.ABS_X: STICK_RANGE,
+            e.ABS_Y: STICK_RANGE,
+            e.ABS_HAT0X: (-1, 1, 0),
+            e.ABS_HAT0Y: (-1, 1, 0),
+        },
+    )
+
+
+class FakeSource:
+    """Pipe-backed device fed in-process."""
+
+    def __init__(self, trace_device: TraceDevice) -> None:
+        self.device = ReplayDevice(trace_device)
+
+    def send(self, frame: list[tuple[int, int, int]]) -> None:
+        # A pipe refuses EVIOCSCLOCKID, so the worker expects realtime.
+        now = time.time()
+        sec, usec = int(now), int((now % 1) * 1_000_000)
+        events = [InputEvent(sec, usec, *change) for change in frame]
+        events.append(InputEvent(sec, usec, e.EV_SYN, e.SYN_REPORT, 0))
+        self.device.push(events)
+
+    def close(self) -> None:
+        pass
+
+
+class UInputSource:
+    """A real ``/dev/input/event*`` node created through uinput."""
+
+    def __init__(self, trace_device: TraceDevice) -> None:
+        from evdev import AbsInfo, InputDevice, UInput
+
+        capabilities: dict[int, list] = {e.EV_KEY: list(trace_device.keys)}
+        if trace_device.axes:
+            capabilities[e.EV_ABS] = [
+                (code, AbsInfo(value, minimum, maximum, 0, 0, 0))
+                for code, (minimum, maximum, value) in trace_device.axes.items()
+            ]
+        self.uinput = UInput(capabilities, name=trace_device.name)
+        time.sleep(0.05)  # let udev create the node
+        self.device = InputDevice(self.uinput.device.path)
+
+    def send(self, frame: list[tuple[int, int, int]]) -> None:
+        for change in frame:
+            self.uinput.write(*change)
+        self.uinput.syn()
+
+    def close(self) -> None:
+        self.uinput.close()
+
+
+def feed(
+    sources: list, cycles: list, rate: float, stop: threading.Event, sent: list[int]
+) -> None:
+    """Send one frame per device every ``1 / rate`` s, staggered."""
+    period = 1.0 / rate
+    started = time.monotonic()
+    tick = 0
+    while not stop.is_set():
+        for index, source in enumerate(sources):
+            cycle = cycles[index]
+            source.send(cycle[tick % len(cycle)])
+            sent[index] += 1
+        tick += 1
+        delay = started + tick * period - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def busy_wait(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def summary(histogram: LatencyHistogram) -> dict[str, float]:
+    return {
+        "count": histogram.count,
+        "mean_us": histogram.mean_us,
+        "p50_us": histogram.percentile(0.5),
+        "p99_us": histogram.percentile(0.99),
+        "max_us": histogram.max_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pads", type=int, default=8)
+    parser.add_argument("--keyboards", type=int, default=2)
+    parser.add_argument("--rate", type=float, default=250.0, help="frames/s/device")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--source", choices=("auto", "uinput", "fake"), default="auto")
+    parser.add_argument("--handler-cost", type=float, default=0.0, metavar="MS")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    source_kind = args.source
+    if source_kind == "auto":
+        source_kind = "uinput" if os.access("/dev/uinput", os.W_OK) else "fake"
+    source_type = UInputSource if source_kind == "uinput" else FakeSource
+
+    app = QApplication(sys.argv)
+    settings = get_settings()
+    window = QWidget()
+    label = QLabel()
+    grid = AppGrid(row_limit=settings.window.apps_per_row)
+    window.setLayout(grid.plot_app_grid(settings.apps, label.setText, LaunchService()))
+    window.show()
+    moves = {
+        Action.LEFT: grid.left,
+        Action.RIGHT: grid.right,
+        Action.UP: grid.up,
+        Action.DOWN: grid.down,
+    }
+    monitor = DeviceMonitor()
+    tracker = get_latency_tracker()
+    tracker.enabled = True
+    tracker.reset()
+
+    descriptions = [describe(PAD_NAME, False, i) for i in range(args.pads)]
+    descriptions += [describe(KEYBOARD_NAME, True, i) for i in range(args.keyboards)]
+    cycles = [
+        keyboard_frames() if d.name.startswith(KEYBOARD_NAME) else pad_frames()
+        for d in descriptions
+    ]
+    sources = [source_type(d) for d in descriptions]
+    workers = []
+    for source in sources:
+        info = monitor.registry.describe(source.device)
+        if info.mapping_key is None:
+            # Unmapped devices are still read, they just produce no actions.
+            info = replace(info, mapping_key=info.name)
+        monitor.registry.add(info)
+        monitor.create_new_treaded_device(source.device, info)
+        workers.append(monitor._workers[info.path])
+
+    handled = 0
+    handler_cost = args.handler_cost / 1000
+
+    def action_handler(actions: list[Action], timestamps: list[float | None]) -> None:
+        nonlocal handled
+        blocked = ActionManager.is_blocked(ProcessSnapshot())
+        for action, timestamp in zip(actions, timestamps, strict=True):
+            tracker.begin(timestamp)
+            move = moves.get(action)
+            if move is not None and not blocked:
+                move()
+            busy_wait(handler_cost)
+            tracker.end()
+            handled += 1
+
+    monitor.on_actions = action_handler
+
+    lag = LatencyHistogram()
+    probe = QTimer()
+    probe.setInterval(10)
+    expected = [time.monotonic() + 0.01]
+
+    def on_probe() -> None:
+        now = time.monotonic()
+        lag.record(max(0.0, now - expected[0]) * 1e6)
+        expected[0] = now + 0.01
+
+    probe.timeout.connect(on_probe)
+    probe.start()
+
+    stop = threading.Event()
+    sent = [0] * len(sources)
+    feeder = threading.Thread(
+        target=feed, args=(sources, cycles, args.rate, stop, sent), name="Feeder"
+    )
+    threads: dict[str, int] = {}
+
+    def finish() -> None:
+        threads["python"] = threading.active_count()
+        threads["os"] = len(os.listdir("/proc/self/task"))
+        stop.set()
+        QTimer.singleShot(200, app.quit)
+
+    started = time.monotonic()
+    feeder.start()
+    QTimer.singleShot(int(args.duration * 1000), finish)
+    app.exec()
+    elapsed = time.monotonic() - started
+    feeder.join()
+    monitor.multiplexer.stop()
+    for source in sources:
+        source.close()
+
+    devices = {}
+    for description, worker, frames_sent in zip(
+        descriptions, workers, sent, strict=True
+    ):
+        devices[description.name] = {
+            "sent_frames": frames_sent,
+            "read_frames": worker.frames,
+            "lost_frames": max(0, frames_sent - worker.frames),
+            "syn_dropped": worker.dropped_frames,
+            "frames_per_s": worker.frames / elapsed,
+        }
+    histograms = tracker.histograms()
+    results = {
+        "source": source_kind,
+        "devices": devices,
+        "total_frames_per_s": sum(d["frames_per_s"] for d in devices.values()),
+        "actions_handled": handled,
+        "queue": asdict(monitor.action_queue.stats()),
+        "repeats_skipped": monitor.repeat_gate.skipped,
+        "threads": threads,
+        "gui_latency": {
+            stage: summary(histograms[stage]) for stage in ("queue", "action_handler")
+        },
+        "event_loop_lag": summary(lag),
+    }
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
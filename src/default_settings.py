@@ -2,7 +2,10 @@ from src.types.schemas import (
     AppsModel,
     DeviceMappingsModel,
     IconsModel,
+    InputModel,
     MenuModel,
+    ProcessMonitorModel,
+    ProcessScannerBackend,
     WindowMode,
     WindowModel,
 )
@@ -91,3 +94,25 @@ DEFAULT_BLOCK_IF_RUNNING: list[str] = [
     "retropie",
     "retroarch",
 ]
+
+DEFAULT_PROCESS_MONITOR = ProcessMonitorModel(
+    refresh_interval=1.0,
+    max_staleness=3.0,
+    use_proc_connector=True,
+    scanner=ProcessScannerBackend.PROCFS,
+)
+
+DEFAULT_INPUT = InputModel(
+    stick_navigation=True,
+    stick_deadzone=0.5,
+    stick_hysteresis=0.15,
+    repeat_navigation=True,
+    repeat_delay=0.4,
+    repeat_interval=0.15,
+    repeat_min_interval=0.05,
+    repeat_acceleration=0.85,
+    queue_size=32,
+    repeat_latency_budget=0.15,
+    latency_tracing=False,
+    hotplug_debounce=0.25,
+)
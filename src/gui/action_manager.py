@@ -1,18 +1,35 @@
 import logging
 
-from src.settings import get_settings
-from src.utils import check_running_processes
+from src.process.index import get_process_index
+from src.process.matcher import compile_matcher
+from src.process.snapshot import ProcessSnapshot
 
 logger = logging.getLogger(__name__)
 
 
 class ActionManager:
     @staticmethod
-    def _is_blocked() -> bool:
-        block_list = get_settings().block_if_running
-        if block_list:
-            running = check_running_processes(block_list)
-            if running:
-                logger.debug(f"_is_blocked: {running}")
-                return True
-        return False
+    def is_blocked(snapshot: ProcessSnapshot | None = None) -> bool:
+        """Return whether a ``block_if_running`` process is alive.
+
+        The answer is memoized on *snapshot* so every stage of one user
+        action agrees and only the first one pays for it. A stale index is
+        answered from the snapshot's process table, which later stages
+        (e.g. focusing) reuse instead of scanning again.
+        """
+        if snapshot is not None and snapshot.blocked is not None:
+            return snapshot.blocked
+
+        index = get_process_index()
+        if snapshot is not None and index.is_stale() and index.watch_list:
+            matcher = compile_matcher(tuple(index.watch_list))
+            running = sorted(matcher.terms_for(snapshot.find(matcher)))
+        else:
+            running = index.running() if index.is_blocked() else []
+
+        blocked = bool(running)
+        if blocked:
+            logger.debug(f"is_blocked: {running}")
+        if snapshot is not None:
+            snapshot.blocked = blocked
+        return blocked
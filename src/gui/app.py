@@ -1,6 +1,8 @@
 import logging
+import time
+from collections.abc import Callable
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QSize, QSocketNotifier, Qt
 from PySide6.QtGui import QColor, QFont, QKeySequence, QPalette, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
@@ -19,20 +21,37 @@ from src.gui.components.device_monitor import DeviceMonitor
 from src.gui.components.grid import AppGrid
 from src.gui.components.tray_icon import TrayIcon
 from src.gui.icons.cache_loader import get_icon
-from src.instance import destroy_pid_file
+from src.gui.launch_service import LaunchService
+from src.input import Action, get_latency_tracker
+from src.instance import SHOW_COMMAND, InstanceLock
+from src.process.index import get_process_index
+from src.process.snapshot import ProcessSnapshot
+from src.process.windows import get_window_index
 from src.settings import Settings, get_settings
 from src.types.schemas import AppsModel, WindowMode
+from src.wakeup import SHUTDOWN_BUDGET
 
 logger: logging.Logger = logging.getLogger(__name__)
 settings: Settings = get_settings()
 
 
 class AppMainWindow(QMainWindow, ActionManager):
-    def __init__(self) -> None:
+    def __init__(self, instance_lock: InstanceLock | None = None) -> None:
         super().__init__()
+        self.instance_lock = instance_lock
+        self.instance_notifier: QSocketNotifier | None = None
+        self.connection_notifiers: dict[int, QSocketNotifier] = {}
         self.setWindowIcon(get_icon(settings.tray.standby))
         self._apply_window_mode(settings.window.window_mode)
         self.app_grid = AppGrid(row_limit=settings.window.apps_per_row)
+        # Built once: input actions dispatch through this instead of getattr.
+        self._grid_actions: dict[Action, Callable[[ProcessSnapshot], None]] = {
+            Action.LEFT: lambda _snapshot: self.app_grid.left(),
+            Action.RIGHT: lambda _snapshot: self.app_grid.right(),
+            Action.UP: lambda _snapshot: self.app_grid.up(),
+            Action.DOWN: lambda _snapshot: self.app_grid.down(),
+            Action.ENTER: self.app_grid.enter,
+        }
         self.info_label = QLabel("Select an app")
         self.info_label.setFont(QFont("Arial", 12, weight=QFont.Weight.Bold))
 
@@ -42,8 +61,11 @@ class AppMainWindow(QMainWindow, ActionManager):
             settings.window.height,
         )
 
+        self.launch_service = LaunchService()
         self.tray_icon = TrayIcon(parent=self)
         self.device_monitor_worker = DeviceMonitor()
+        self.process_index = get_process_index()
+        self.window_index = get_window_index()
 
         self._init_ui()
         logger.info("Starting AppLauncher interface")
@@ -56,9 +78,12 @@ class AppMainWindow(QMainWindow, ActionManager):
         self.setAutoFillBackground(True)
 
         self._set_signals()
+        self.process_index.start()
+        self.window_index.start()
         self.device_monitor_worker.start_monitor()
 
         self._setup_tab_shortcut()
+        self._setup_instance_notifier()
         app_instance = QApplication.instance()
         if app_instance:
             app_instance.aboutToQuit.connect(self._on_about_to_quit)
@@ -67,6 +92,40 @@ class AppMainWindow(QMainWindow, ActionManager):
         shortcut = QShortcut(QKeySequence(Qt.Key.Key_Tab), self)
         shortcut.activated.connect(self._cycle_window_mode)
 
+    def _setup_instance_notifier(self) -> None:
+        if self.instance_lock is None or not self.instance_lock.is_acquired:
+            return
+        self.instance_notifier = QSocketNotifier(
+            self.instance_lock.fileno(), QSocketNotifier.Type.Read, self
+        )
+        self.instance_notifier.activated.connect(self._on_instance_command)
+
+    def _on_instance_command(self) -> None:
+        if self.instance_lock is None:
+            return
+        for command in self.instance_lock.receive():
+            if command == SHOW_COMMAND:
+                self.show_ui()
+                self.raise_()
+                self.activateWindow()
+            else:
+                logger.debug(f"Unknown instance command: {command}")
+        self._watch_instance_connections()
+
+    def _watch_instance_connections(self) -> None:
+        """Follow clients that connected before sending their command."""
+        if self.instance_lock is None:
+            return
+        pending = set(self.instance_lock.pending_filenos())
+        for fd in self.connection_notifiers.keys() - pending:
+            notifier = self.connection_notifiers.pop(fd)
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        for fd in pending - self.connection_notifiers.keys():
+            notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+            notifier.activated.connect(self._on_instance_command)
+            self.connection_notifiers[fd] = notifier
+
     def _set_signals(self) -> None:
         self.tray_icon.tray_action.connect(self._tray_handler)
 
@@ -78,12 +137,27 @@ class AppMainWindow(QMainWindow, ActionManager):
             self.tray_icon.handle_connection_status
         )
 
-        self.device_monitor_worker.action.connect(self.action_handler)
+        self.device_monitor_worker.on_actions = self.actions_handler
+
+        self.launch_service.progress.connect(self._change_label_text)
+        self.launch_service.launched.connect(self._on_app_launched)
+
+        self.process_index.blocked_changed.connect(self._on_blocked_changed)
 
     def _tray_handler(self, action_name: str) -> None:
         if action_name == "toggle_view":
             self.toggle_view()
 
+    def _on_app_launched(self, app_name: str) -> None:
+        logger.debug(f"App launched: {app_name}")
+        self.hide()
+
+    def _on_blocked_changed(self, blocked: bool) -> None:
+        if blocked:
+            self._change_label_text("Blocked by running process")
+        else:
+            self._change_label_text("Select an app")
+
     def _set_on_center(self) -> None:
         self.move(CentralizedAppResolution(app=self).centralized_resolution())
 
@@ -103,7 +177,7 @@ class AppMainWindow(QMainWindow, ActionManager):
         created_app_grid: QGridLayout = self.app_grid.plot_app_grid(
             apps=self._get_apps_list(),
             label_changer=self._change_label_text,
-            hide_window=self.hide,
+            launch_service=self.launch_service,
         )
 
         main_layout.addLayout(created_app_grid)
@@ -146,26 +220,40 @@ class AppMainWindow(QMainWindow, ActionManager):
         self.setVisible(True)
         return None
 
-    def action_handler(self, action_name: str) -> None:
-        logger.debug(f"action_handler: {action_name}")
-
-        if ActionManager._is_blocked():
-            logger.debug(f"action_handler: blocked ({action_name})")
+    def actions_handler(
+        self, actions: list[Action], timestamps: list[float | None]
+    ) -> None:
+        """Handle one drained batch of input actions with a shared snapshot."""
+        snapshot = ProcessSnapshot()
+        latency = get_latency_tracker()
+        for action, timestamp in zip(actions, timestamps, strict=True):
+            latency.begin(timestamp)
+            try:
+                self.action_handler(action, snapshot)
+            finally:
+                latency.end()
+
+    def action_handler(
+        self, action: Action, snapshot: ProcessSnapshot | None = None
+    ) -> None:
+        logger.debug(f"action_handler: {action.name}")
+
+        snapshot = snapshot or ProcessSnapshot()
+        if ActionManager.is_blocked(snapshot):
+            logger.debug(f"action_handler: blocked ({action.name})")
             return
 
-        if action_name == "toggle_view":
+        if action is Action.TOGGLE_VIEW:
             self.toggle_view()
             return
 
         if not self.isVisible():
-            logger.debug(f"action_handler: not visible ({action_name})")
+            logger.debug(f"action_handler: not visible ({action.name})")
             return
 
-        method = getattr(self.app_grid, action_name, None)
-        if callable(method):
-            method()
-        else:
-            logger.debug(f"action_handler: no method {action_name}")
+        handler = self._grid_actions.get(action)
+        if handler is not None:
+            handler(snapshot)
 
     def _apply_window_mode(self, mode: WindowMode | None = None) -> None:
         mode = mode or settings.window.window_mode
@@ -196,5 +284,17 @@ class AppMainWindow(QMainWindow, ActionManager):
         logger.info(f"Window mode changed to: {next_mode.value}")
 
     def _on_about_to_quit(self) -> None:
+        started = time.monotonic()
+        self.launch_service.stop(timeout=SHUTDOWN_BUDGET)
+        self.process_index.stop()
+        self.window_index.stop()
         self.device_monitor_worker.stop_all()
-        destroy_pid_file()
+        if self.instance_notifier is not None:
+            self.instance_notifier.setEnabled(False)
+        for notifier in self.connection_notifiers.values():
+            notifier.setEnabled(False)
+        if self.instance_lock is not None:
+            self.instance_lock.release()
+        elapsed = time.monotonic() - started
+        level = logging.WARNING if elapsed > SHUTDOWN_BUDGET else logging.INFO
+        logger.log(level, f"Shutdown took {elapsed * 1000:.1f} ms")
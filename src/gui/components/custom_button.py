@@ -1,10 +1,11 @@
 import typing
 
 from PySide6.QtCore import QEvent, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QEnterEvent, QFocusEvent, QKeyEvent
+from PySide6.QtGui import QColor, QEnterEvent, QFocusEvent, QKeyEvent, QPaintEvent
 from PySide6.QtWidgets import QGraphicsColorizeEffect, QPushButton
 
 from src.gui.icons.cache_loader import get_icon
+from src.input.latency import get_latency_tracker
 
 ICO_PADDING = 16
 
@@ -17,7 +18,7 @@ class CustomButton(QPushButton):
         self,
         label: str | None = None,
         icon: str | None = None,
-        on_click: typing.Callable[[list[str] | str], None] | None = None,
+        on_click: typing.Callable[..., None] | None = None,
         on_success: typing.Callable[[], None] | None = None,
         on_error: typing.Callable[[str], None] | None = None,
         name: str | None = None,
@@ -25,6 +26,7 @@ class CustomButton(QPushButton):
         icon_size: QSize | None = None,
     ) -> None:
         self.name = name or ""
+        self.on_click = on_click
         self.on_success = on_success
         self.on_error = on_error
         self.disable_animation = False
@@ -112,6 +114,11 @@ class CustomButton(QPushButton):
         self._update_visuals(self.underMouse())
         super().focusOutEvent(arg__1)
 
+    def paintEvent(self, arg__1: QPaintEvent) -> None:
+        super().paintEvent(arg__1)
+        if self.hasFocus():
+            get_latency_tracker().paint()
+
     def keyPressEvent(self, arg__1: QKeyEvent) -> None:
         if arg__1.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
             self.click()
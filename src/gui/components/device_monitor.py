@@ -2,137 +2,114 @@
 # dos blocos e importações eles suprimem erros de importação
 
 import logging
+from collections.abc import Callable
 from typing import cast
 
 import pyudev  # type: ignore[import]
-from evdev import ecodes
 from evdev.device import InputDevice
-from evdev.events import InputEvent  # type: ignore[import]
-from evdev.util import categorize, list_devices  # type: ignore[    import]
-from PySide6.QtCore import Slot  # type: ignore[import]
 from PySide6.QtCore import (  # type: ignore[import]
     QObject,
-    QRunnable,
-    QThread,
-    QThreadPool,
+    QSocketNotifier,
+    QTimer,
     Signal,
+    Slot,  # type: ignore[import]
 )
 from pyudev.pyside6 import MonitorObserver  # type: ignore[import]
 
+from src.input import (
+    Action,
+    ActionQueue,
+    DeviceEventWorker,
+    DeviceInfo,
+    DeviceRegistry,
+    InputMultiplexer,
+    InputReader,
+    RepeatGate,
+    get_latency_tracker,
+    has_navigation_capabilities,
+)
+from src.input.hotplug import HotplugBatch
+from src.input.udev import (
+    configure_monitor,
+    is_navigation_node,
+    list_navigation_nodes,
+    udev_tag_installed,
+)
 from src.settings import Settings, get_settings
 from src.types.protocols.device import (
     InputDeviceEvDevProtocol,
     InputDevicePyDevProtocol,
-    InputEventProtocol,
-    KeyEventProtocol,
 )
-from src.types.schemas import DeviceMappingsModel
+from src.wakeup import Waker
 
 logger: logging.Logger = logging.getLogger(__name__)
 settings: Settings = get_settings()
 
-
-class Signals(QObject):
-    started = Signal(str)
-    completed = Signal(str)
-
-    action = Signal(str)
-    tray_action = Signal(str)
-    connection_status = Signal(str)
-
-
-class DeviceEventWorker(QRunnable):
-    def __init__(
-        self,
-        input_device: InputDeviceEvDevProtocol,
-        mapping_key: str,
-    ) -> None:
-        super().__init__()
-        self.input_device: InputDeviceEvDevProtocol = input_device
-        self.signals = Signals()
-        self._stopped = False
-        self._device_mappings: DeviceMappingsModel | None = settings.mappings.get(
-            mapping_key
-        )
-        self._ev_abs_mapping: dict[int, dict[int, str]] = {
-            ecodes.ABS_HAT0X: {-1: "left", 1: "right"},  # type: ignore
-            ecodes.ABS_HAT0Y: {-1: "up", 1: "down"},  # type: ignore
-        }
-
-    def _get_action(self, event: InputEvent) -> str | None:
-        if not self._device_mappings:
-            return None
-        try:
-            key_event: KeyEventProtocol = cast(KeyEventProtocol, categorize(event))
-            if key_event.keystate != 1:
-                return None
-            event_code = str(event.code)
-            action = self._device_mappings.buttons.get(event_code)
-            if action is None:
-                logger.debug(
-                    f"No mapping for code {event_code} on {self.input_device.name}"
-                )
-            return action
-        except AttributeError:
-            return None
-
-    @Slot()
-    def run(self) -> None:
-        logger.debug(f"Worker thread: {QThread.currentThread()}")
-        self.signals.started.emit(self.input_device.path)
-        emit_action = self.signals.action.emit
-        logger.info(f"[DeviceEventWorker] Started for: {self.input_device.name}")
-        try:
-            event: InputEventProtocol
-            for event in self.input_device.read_loop():
-                if event.type == ecodes.EV_KEY:  # type: ignore
-                    action = self._get_action(cast(InputEvent, event))
-                    if action:
-                        logger.debug(f"[ACTION] {action} emitted")
-                        emit_action(action)
-                elif event.type == ecodes.EV_ABS:  # type: ignore
-                    dpad = self._ev_abs_mapping.get(event.code)
-                    if dpad:
-                        direction = dpad.get(event.value)
-                        if direction:
-                            logger.debug(f"[ACTION] {direction} emitted")
-                            emit_action(direction)
-        except OSError:
-            logger.warning(f"Device disconnected: {self.input_device.path}")
-        if not self._stopped:
-            try:
-                self.signals.completed.emit(self.input_device.path)
-            except RuntimeError:
-                pass
+ActionsHandler = Callable[[list[Action], list[float | None]], None]
 
 
 class DeviceMonitor(QObject):
-    action = Signal(str)
     tray_action = Signal(str)
     connection_status = Signal(str)
+    reader_closed = Signal(object)
 
     def __init__(self) -> None:
         super().__init__()
-        self.thread_pool = QThreadPool().globalInstance()
-        self.connected_devices: list[str] = []
+        self.multiplexer = InputMultiplexer(on_reader_closed=self._on_reader_closed)
+        # The input thread wakes the GUI through an eventfd rather than a
+        # queued signal: no per-wake event allocation or argument marshalling.
+        self.action_waker = Waker()
+        self.action_notifier = QSocketNotifier(
+            self.action_waker.fileno(), QSocketNotifier.Type.Read, self
+        )
+        self.action_notifier.activated.connect(self._drain_actions)
+        # Called on the GUI thread with each drained batch: the actions and
+        # their input timestamps. Both lists are reused by the next drain.
+        self.on_actions: ActionsHandler | None = None
+        self._actions: list[Action] = []
+        self._timestamps: list[float | None] = []
+        self.repeat_gate = RepeatGate()
+        self.action_queue = ActionQueue(
+            max_size=settings.input.queue_size,
+            repeat_budget=settings.input.repeat_latency_budget,
+            on_ready=self.action_waker.wake,
+        )
+        self.latency = get_latency_tracker()
+        self.latency.enabled = settings.input.latency_tracing
+        self.registry = DeviceRegistry(settings.mappings)
+        self.hotplug_batch = HotplugBatch()
+        self.hotplug_timer = QTimer(self)
+        self.hotplug_timer.setSingleShot(True)
+        self.hotplug_timer.setInterval(int(settings.input.hotplug_debounce * 1000))
+        self.hotplug_timer.timeout.connect(self._reconcile_devices)
         self._workers: dict[str, DeviceEventWorker] = {}
+        self.reader_closed.connect(self._forget_worker)
 
     def stop_all(self) -> None:
-        for worker in self._workers.values():
-            worker._stopped = True
-        self.thread_pool.waitForDone(3000)
+        self.hotplug_timer.stop()
+        stopped = self.multiplexer.stop()
+        self.action_notifier.setEnabled(False)
+        # A reader still running could wake a descriptor number that has
+        # been reused; leave the eventfd open rather than risk it.
+        if stopped:
+            self.action_waker.close()
+        logger.info(f"Action queue: {self.action_queue.stats()}")
+        if self.latency.enabled:
+            logger.info(f"Input latency:\n{self.latency.dump()}")
+        self._print_connected()
         self._workers.clear()
-        self.connected_devices.clear()
-
-        self._print_detected()
+        self.registry.clear()
         logger.debug("--------------------------------")
         self._print_allowed()
 
     @Slot()
     def start_monitor(self) -> None:
         self.context = pyudev.Context()
+        self.use_udev_tag = udev_tag_installed()
         self.monitor = pyudev.Monitor.from_netlink(self.context)
-        self.monitor.filter_by(subsystem="input")
+        configure_monitor(self.monitor, self.use_udev_tag)
+        if not self.use_udev_tag:
+            logger.info("udev tag rule not installed, filtering hotplug in Python")
         self.observer = MonitorObserver(self.monitor)
         self.observer.deviceEvent.connect(self._refresh_devices)
         logger.info("Device monitor started")
@@ -143,13 +120,11 @@ class DeviceMonitor(QObject):
             logger.error(f"Failed to start udev monitor: {e}")
         self._get_devices_on_start()
 
-    def _print_detected(self) -> None:
-        logger.info("=== DETECTED DEVICES ===")
-        devices = (
-            cast(InputDeviceEvDevProtocol, InputDevice(path)) for path in list_devices()
-        )
-        for item in devices:
-            logger.info(f"  - {item.name} | {item.path}")
+    def _print_connected(self) -> None:
+        # From the registry: reopening every /dev/input node would slow quit.
+        logger.info("=== CONNECTED DEVICES ===")
+        for info in self.registry:
+            logger.info(f"  - {info.name} | {info.path}")
         logger.info("=========================")
 
     def _print_allowed(self) -> None:
@@ -159,114 +134,130 @@ class DeviceMonitor(QObject):
         logger.info("==================================")
 
     def _check_connection_status(self) -> None:
-        has_connected = False
-        for device_path in self.connected_devices:
-            try:
-                name = InputDevice(device_path).name
-            except OSError:
-                continue
-            key = self._find_mapping_key(name)
-            if key and settings.mappings[key].tray:
-                has_connected = True
-                break
-
-        status = "connected" if has_connected else "disconnected"
+        status = "connected" if self.registry.has_tray_device else "disconnected"
         self.connection_status.emit(status)
         logger.debug(f"Connection status: {status}")
 
     def _get_connected_device_names(self) -> set[str]:
-        return {InputDevice(path).name for path in self.connected_devices}
-
-    @staticmethod
-    def _find_mapping_key(device_name: str) -> str | None:
-        device_lower = device_name.lower()
-        for key in settings.mappings:
-            if key.lower() in device_lower:
-                return key
-        return None
+        return {info.name for info in self.registry}
 
-    def _valid_device(self, device_path: str) -> InputDeviceEvDevProtocol | None:
+    def _valid_device(
+        self, device_path: str
+    ) -> tuple[InputDeviceEvDevProtocol, DeviceInfo] | None:
         """
-        Check if device is valid, filtering by /dev/input/event and
-        matching partial name in settings.mappings.
+        Check if device is valid, filtering by /dev/input/event,
+        matching partial name in settings.mappings and requiring mapped
+        keys or D-pad hats among its capabilities.
         """
         if not device_path.startswith("/dev/input/event"):
             return None
         input_device = cast(InputDeviceEvDevProtocol, InputDevice(device_path))
-        if self._find_mapping_key(input_device.name):
-            return input_device
+        try:
+            info = self.registry.describe(input_device)
+            if info.mapping_key and has_navigation_capabilities(
+                input_device, settings.mappings[info.mapping_key], info.capabilities
+            ):
+                return input_device, info
+        except Exception:
+            input_device.close()
+            raise
+        input_device.close()
         return None
 
     def _get_devices_on_start(self) -> None:
-        for device_path in list_devices():
-            valid_device = self._valid_device(device_path)
+        for device_path in list_navigation_nodes(self.context, self.use_udev_tag):
+            try:
+                valid_device = self._valid_device(device_path)
+            except OSError as e:
+                logger.error(f"Failed to open device {device_path}: {e}")
+                continue
             if not valid_device:
                 continue
-            self.connected_devices.append(valid_device.path)
-            self.create_new_treaded_device(valid_device)
-            logger.info(f"Device connected: {(valid_device,)}")
+            input_device, info = valid_device
+            self.registry.add(info)
+            self.create_new_treaded_device(input_device, info)
+            logger.info(f"Device connected: {info}")
         self._check_connection_status()
         return None
 
-    def create_new_treaded_device(self, input_device: InputDeviceEvDevProtocol) -> None:
-        mapping_key = self._find_mapping_key(input_device.name)
+    def create_new_treaded_device(
+        self, input_device: InputDeviceEvDevProtocol, info: DeviceInfo
+    ) -> None:
+        mapping_key = info.mapping_key
         if not mapping_key:
             return
-        worker = DeviceEventWorker(input_device, mapping_key)
-        worker.signals.action.connect(self.action.emit)
-        worker.signals.completed.connect(
-            lambda path, w=worker: (
-                self._workers.pop(path, None) if self._workers.get(path) is w else None
-            )
+        worker = DeviceEventWorker(
+            input_device, mapping_key, self.action_queue, self.repeat_gate
         )
         self._workers[input_device.path] = worker
-        self.thread_pool.start(worker)
+        self.multiplexer.add(worker)
+        logger.info(f"[DeviceEventWorker] Started for: {input_device.name}")
 
-    def _refresh_devices(self, device: InputDevicePyDevProtocol) -> None:
-        device_action = device.action
-        device_name = (
-            device.get("ID_MODEL")
-            or device.get("NAME")
-            or device.get("PHYS")
-            or "Unknown Device"
-        )
-        device_path: str | None = device.device_node
+    def _on_reader_closed(self, reader: InputReader) -> None:
+        # Runs on the input thread; hand the bookkeeping to the GUI thread.
+        self.reader_closed.emit(reader)
 
-        logger.debug(
-            f"Hotplug event: action={device_action}, device={device_name}, "
-            f"path={device_path}"
-        )
+    def _drain_actions(self) -> None:
+        # Runs on the GUI thread once it is free again: hand over everything
+        # queued meanwhile as one coalesced batch and allow the next repeat.
+        # Clearing before draining: a put racing with the drain re-arms it.
+        self.action_waker.clear()
+        self.repeat_gate.release()
+        actions, timestamps = self._actions, self._timestamps
+        actions.clear()
+        timestamps.clear()
+        self.action_queue.drain_into(actions, timestamps)
+        if not actions or self.on_actions is None:
+            return
+        if self.latency.enabled:
+            for timestamp in timestamps:
+                if timestamp is not None:
+                    self.latency.record("queue", timestamp)
+        self.on_actions(actions, timestamps)
+
+    def _forget_worker(self, worker: DeviceEventWorker) -> None:
+        if self._workers.get(worker.path) is worker:
+            self._workers.pop(worker.path)
 
-        if not device_path:
-            logger.warning(f"Hotplug event received but no device_node: {device}")
+    def _refresh_devices(self, device: InputDevicePyDevProtocol) -> None:
+        if not is_navigation_node(device):
             return
+        device_path = cast(str, device.device_node)
+        logger.debug(f"Hotplug event: action={device.action}, path={device_path}")
+        # A window from the first event, not restarted by later ones, so a
+        # flapping pad cannot postpone reconciliation indefinitely.
+        if self.hotplug_batch.record(device.action, device_path):
+            self.hotplug_timer.start()
 
-        if device_action == "add":
-            if device_path in self.connected_devices:
-                logger.debug(f"Device already tracked: {device_path}")
-                return
+    def _reconcile_devices(self) -> None:
+        """Start and stop readers once for a whole burst of hotplug events."""
+        plan = self.hotplug_batch.plan(self.registry)
+        if not plan:
+            return
+        for device_path in plan.stop:
+            info = self.registry.remove(device_path)
+            worker = self._workers.pop(device_path, None)
+            if worker:
+                self.multiplexer.remove(worker)
+            name = info.name if info else "Unknown Device"
+            logger.info(f"Device removed: {name} ({device_path})")
+        connected = False
+        for device_path in plan.start:
             try:
-                input_device: InputDeviceEvDevProtocol | None
-                input_device = self._valid_device(device_path)
+                valid_device = self._valid_device(device_path)
             except Exception as e:
                 logger.error(f"Failed to open device {device_path}: {e}")
-                return
-            if not input_device:
-                logger.debug(f"Device not in mappings: {device_path} ({device_name})")
-                return
-            self.connected_devices.append(input_device.path)
-            self.create_new_treaded_device(input_device)
-            logger.info(f"Device connected: {input_device.name} ({device_path})")
+                continue
+            if not valid_device:
+                logger.debug(f"Device not in mappings: {device_path}")
+                continue
+            input_device, info = valid_device
+            self.registry.add(info)
+            self.create_new_treaded_device(input_device, info)
+            logger.info(f"Device connected: {info.name} ({device_path})")
+            connected = True
+        if connected:
             self.tray_action.emit("connected")
-            self._check_connection_status()
-        elif device_action == "remove":
-            if device_path in self.connected_devices:
-                self.connected_devices.remove(device_path)
-                worker = self._workers.get(device_path)
-                if worker:
-                    worker._stopped = True
-                logger.info(f"Device removed: {device_name} ({device_path})")
-                self.tray_action.emit("disconnected")
-                self._check_connection_status()
-            else:
-                logger.debug(f"Device not in tracked list: {device_path}")
+        elif plan.stop:
+            self.tray_action.emit("disconnected")
+        self._check_connection_status()
@@ -5,11 +5,12 @@ import more_itertools
 from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import QGridLayout, QWidget
 
-from src.command_executor import CommandExecutor
 from src.gui.action_manager import ActionManager
 from src.gui.components.custom_button import CustomButton
+from src.gui.launch_service import LaunchService
+from src.input.latency import get_latency_tracker
+from src.process.snapshot import ProcessSnapshot
 from src.types.schemas import AppsModel
-from src.utils import _extract_process_name, _focus_process
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -31,30 +32,12 @@ class AppGrid(QGridLayout, ActionManager):
     def __button_generator(
         app_name: str,
         app_data: AppsModel,
-        label_changer: typing.Callable[[str], None],
-        hide_window: typing.Callable[[], None] | None = None,
+        launch_service: LaunchService,
     ) -> CustomButton:
-        """Create a button with command based on app name and app data."""
-
-        def on_click(*_: typing.Any) -> None:
-            if ActionManager._is_blocked():
-                label_changer("Blocked by running process")
-                return
-
-            target = _extract_process_name(app_data.cmd)
-            if _focus_process(target):
-                label_changer(f"Focused {target}")
-                return
-
-            def on_success() -> None:
-                if hide_window:
-                    hide_window()
-
-            CommandExecutor().execute(
-                command=app_data.cmd,
-                label_changer=label_changer,
-                on_success=on_success,
-            )
+        """Create a button that asks the launch service to open the app."""
+
+        def on_click(*_: typing.Any, snapshot: ProcessSnapshot | None = None) -> None:
+            launch_service.request(app_name, app_data, snapshot)
 
         return CustomButton(
             icon=app_data.icon,
@@ -65,14 +48,11 @@ class AppGrid(QGridLayout, ActionManager):
     def __rebuild_mapped_grid(
         self,
         apps: dict[str, AppsModel],
-        label_changer: typing.Callable[[str], None],
-        hide_window: typing.Callable[[], None] | None = None,
+        launch_service: LaunchService,
     ) -> None:
         """Rebuild mapped grid dictionary based on settings app list."""
         apps_iter: typing.Generator[CustomButton] = (
-            self.__button_generator(
-                *x, label_changer=label_changer, hide_window=hide_window
-            )
+            self.__button_generator(*x, launch_service=launch_service)
             for x in apps.items()
         )
         self.mapped_grid = list(
@@ -91,14 +71,21 @@ class AppGrid(QGridLayout, ActionManager):
                 return sub_parent_widget.isVisible()
         return False
 
-    def enter(self) -> None:
+    def enter(self, snapshot: ProcessSnapshot | None = None) -> None:
         """
-        Emit clicked signal from CustomButton to open app.
+        Activate the focused CustomButton to open app.
+
+        The action's process *snapshot* is handed to the button callback so
+        the whole press shares a single process scan.
         """
         if not self._is_app_visible():
             return
 
-        self.mapped_grid[self.current_row][self.current_app].clicked.emit()
+        button = self.mapped_grid[self.current_row][self.current_app]
+        if button.on_click is not None:
+            button.on_click(snapshot=snapshot)
+        else:
+            button.clicked.emit()
 
     @Slot()
     def _change_focus_on_hover(self) -> None:
@@ -108,12 +95,10 @@ class AppGrid(QGridLayout, ActionManager):
         self,
         apps: dict[str, AppsModel],
         label_changer: typing.Callable[[str], None],
-        hide_window: typing.Callable[[], None] | None = None,
+        launch_service: LaunchService,
     ) -> "AppGrid":
         """Feed GridWidgets based on a list of apps."""
-        self.__rebuild_mapped_grid(
-            apps=apps, label_changer=label_changer, hide_window=hide_window
-        )
+        self.__rebuild_mapped_grid(apps=apps, launch_service=launch_service)
         for row_index, apps_tuple in enumerate(iterable=self.mapped_grid):
             for app_index, app in enumerate(iterable=apps_tuple):
                 app.focused_change_label.connect(label_changer)
@@ -134,6 +119,7 @@ class AppGrid(QGridLayout, ActionManager):
                         window.activateWindow()
             self.mapped_grid[row_index][app_index].setFocus()
             self._last_position = (self.current_row, self.current_app)
+            get_latency_tracker().focus()
         except IndexError:
             LOGGER.info(
                 f"IndexError on __set_focus - invalid pos ({row_index}, {app_index})"
@@ -0,0 +1,150 @@
+"""Launch or focus apps from a worker thread.
+
+Finding a running app, focusing its window and spawning commands may block
+for seconds (process scans, ``xdotool`` fallbacks), so ``AppGrid`` buttons
+only queue a request here. Progress and results come back as signals that
+Qt delivers on the GUI thread. A new request cancels the one in flight:
+its remaining steps are skipped and its results are not reported.
+"""
+
+import logging
+import threading
+import typing
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, Signal  # type: ignore[import]
+
+from src.command_executor import CommandExecutor
+from src.gui.action_manager import ActionManager
+from src.process.snapshot import ProcessSnapshot
+from src.types.schemas import AppsModel
+from src.utils import extract_process_name, focus_process
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LaunchJob:
+    app_name: str
+    app_data: AppsModel
+    snapshot: ProcessSnapshot | None = None
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+
+class LaunchService(QObject):
+    progress = Signal(str)
+    launched = Signal(str)
+
+    def __init__(
+        self,
+        executor_factory: typing.Callable[[], CommandExecutor] = CommandExecutor,
+    ) -> None:
+        super().__init__()
+        self._executor_factory = executor_factory
+        self._condition = threading.Condition()
+        self._pending: LaunchJob | None = None
+        self._current: LaunchJob | None = None
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def request(
+        self,
+        app_name: str,
+        app_data: AppsModel,
+        snapshot: ProcessSnapshot | None = None,
+    ) -> LaunchJob:
+        """Queue *app_name*, cancelling any request not finished yet."""
+        job = LaunchJob(app_name, app_data, snapshot)
+        with self._condition:
+            self._cancel_locked()
+            self._pending = job
+            self._condition.notify()
+        self._ensure_thread()
+        return job
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._cancel_locked()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the worker; a job still running is cancelled, not awaited
+        beyond *timeout* (the thread is a daemon)."""
+        with self._condition:
+            self._stopped = True
+            self._cancel_locked()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _cancel_locked(self) -> None:
+        for job in (self._pending, self._current):
+            if job is not None and not job.cancelled.is_set():
+                logger.debug(f"Launch request cancelled: {job.app_name}")
+                job.cancelled.set()
+        self._pending = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="LaunchService", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                job = self._pending
+                while job is None and not self._stopped:
+                    self._condition.wait()
+                    job = self._pending
+                if self._stopped or job is None:
+                    return
+                self._pending = None
+                self._current = job
+            try:
+                self.run_job(job)
+            except Exception:
+                logger.exception(f"Launch request failed: {job.app_name}")
+            finally:
+                with self._condition:
+                    self._current = None
+
+    def run_job(self, job: LaunchJob) -> None:
+        """Block check, focus an existing instance, or launch the command."""
+        snapshot = job.snapshot or ProcessSnapshot()
+        if ActionManager.is_blocked(snapshot):
+            self._report(job, "Blocked by running process")
+            return
+        if job.cancelled.is_set():
+            return
+
+        target = extract_process_name(job.app_data.cmd)
+        self._report(job, f"Looking for {target}")
+        if focus_process(target, snapshot=snapshot, app_key=job.app_name):
+            if not job.cancelled.is_set():
+                self._report(job, f"Focused {target}")
+            return
+        if job.cancelled.is_set():
+            return
+
+        launched = False
+
+        def on_success() -> None:
+            nonlocal launched
+            launched = True
+
+        self._report(job, f"Opening {job.app_name}")
+        self._executor_factory().execute(
+            command=job.app_data.cmd,
+            label_changer=lambda text: self._report(job, text),
+            on_success=on_success,
+        )
+        if launched and not job.cancelled.is_set():
+            self.launched.emit(job.app_name)
+
+    def _report(self, job: LaunchJob, text: str) -> None:
+        if not job.cancelled.is_set():
+            self.progress.emit(text)
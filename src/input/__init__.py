@@ -0,0 +1,37 @@
+"""Input layer: device readers and the thread that multiplexes them."""
+
+from src.input.actions import Action, parse_action
+from src.input.capabilities import has_navigation_capabilities
+from src.input.dispatch import (
+    DispatchTable,
+    compile_dispatch_table,
+    dispatch_key,
+)
+from src.input.latency import LatencyTracker, get_latency_tracker
+from src.input.multiplexer import InputMultiplexer, InputReader
+from src.input.queue import ActionQueue, ActionQueueStats, ActionSink
+from src.input.registry import DeviceInfo, DeviceRegistry, MappingIndex
+from src.input.repeat import HoldRepeater, RepeatGate
+from src.input.worker import DeviceEventWorker
+
+__all__ = [
+    "Action",
+    "ActionQueue",
+    "ActionQueueStats",
+    "ActionSink",
+    "DispatchTable",
+    "compile_dispatch_table",
+    "dispatch_key",
+    "has_navigation_capabilities",
+    "HoldRepeater",
+    "DeviceEventWorker",
+    "DeviceInfo",
+    "DeviceRegistry",
+    "InputMultiplexer",
+    "InputReader",
+    "LatencyTracker",
+    "MappingIndex",
+    "parse_action",
+    "get_latency_tracker",
+    "RepeatGate",
+]
@@ -0,0 +1,32 @@
+"""Launcher actions as integer codes.
+
+Mappings name actions in the settings (``"enter"``, ``"toggle_view"``);
+they are resolved to :class:`Action` once, when a device's dispatch table
+is compiled, so the input thread, the action queue and the GUI handler
+pass and compare small interned ints instead of strings, and the GUI
+dispatches through a table built once instead of ``getattr`` per action.
+"""
+
+import enum
+
+
+class Action(enum.IntEnum):
+    LEFT = 1
+    RIGHT = 2
+    UP = 3
+    DOWN = 4
+    ENTER = 5
+    TOGGLE_VIEW = 6
+
+
+MOVES: dict[Action, tuple[int, int]] = {
+    Action.LEFT: (-1, 0),
+    Action.RIGHT: (1, 0),
+    Action.UP: (0, -1),
+    Action.DOWN: (0, 1),
+}
+
+
+def parse_action(name: str) -> Action | None:
+    """Resolve a settings action name (case-insensitive) to its code."""
+    return Action.__members__.get(name.upper())
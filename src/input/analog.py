@@ -0,0 +1,136 @@
+"""Analog stick → discrete navigation, filtered on the input thread.
+
+Sticks report around 250 Hz. Each stick is normalised to ``[-1, 1]`` from
+its ``absinfo`` range and quantised to four directions: a direction is
+entered once the deflection passes the deadzone and left only after it
+falls below ``deadzone - hysteresis``, so noise around the threshold does
+not chatter. The same applies to the angle: a held direction is kept
+until the other axis beats it by ``SWITCH_RATIO``, and switches are at
+most one per ``SWITCH_INTERVAL`` seconds, so a stick resting on a diagonal
+does not alternate between its two neighbours. Only entering a direction
+(or switching to another one) produces an action; everything else stays
+inside the input layer.
+"""
+
+import math
+import typing
+from dataclasses import dataclass
+
+from evdev import ecodes  # type: ignore[import]
+
+from src.input.actions import Action
+from src.types.protocols.device import InputDeviceEvDevProtocol
+
+STICKS: tuple[tuple[int, int], ...] = (
+    (ecodes.ABS_X, ecodes.ABS_Y),  # type: ignore
+    (ecodes.ABS_RX, ecodes.ABS_RY),  # type: ignore
+)
+
+# How much the other axis must exceed the held one to switch direction.
+SWITCH_RATIO = 1.2
+# Minimum time between two direction switches without a release, seconds.
+SWITCH_INTERVAL = 0.15
+HORIZONTAL = frozenset((Action.LEFT, Action.RIGHT))
+
+
+@dataclass(frozen=True)
+class AxisRange:
+    center: float
+    half_range: float
+
+    @classmethod
+    def from_absinfo(cls, minimum: int, maximum: int) -> "AxisRange":
+        return cls((minimum + maximum) / 2, max((maximum - minimum) / 2, 1))
+
+    def normalize(self, value: int) -> float:
+        return max(-1.0, min(1.0, (value - self.center) / self.half_range))
+
+
+class StickNavigator:
+    def __init__(
+        self,
+        x_range: AxisRange,
+        y_range: AxisRange,
+        deadzone: float,
+        hysteresis: float,
+    ) -> None:
+        self.x_range = x_range
+        self.y_range = y_range
+        self.press_threshold = deadzone
+        self.release_threshold = max(0.0, deadzone - hysteresis)
+        self.x = 0.0
+        self.y = 0.0
+        self.direction: Action | None = None
+        self.switched_at = -math.inf
+
+    def set_x(self, value: int) -> None:
+        self.x = self.x_range.normalize(value)
+
+    def set_y(self, value: int) -> None:
+        self.y = self.y_range.normalize(value)
+
+    def update(self, now: float) -> Action | None:
+        """Return a direction when the stick enters or switches to it."""
+        x, y = self.x, self.y
+        held = self.direction
+        if math.hypot(x, y) < (
+            self.release_threshold if held else self.press_threshold
+        ):
+            self.direction = None
+            return None
+        if abs(x) >= abs(y):
+            component, other, direction = (
+                abs(x),
+                abs(y),
+                Action.RIGHT if x > 0 else Action.LEFT,
+            )
+        else:
+            component, other, direction = (
+                abs(y),
+                abs(x),
+                Action.DOWN if y > 0 else Action.UP,
+            )
+        if direction == held:
+            return None
+        if held is not None:
+            # Switching between directions needs a clear push the other way:
+            # past the deadzone, ahead of the held axis by a margin, and not
+            # straight after the previous switch.
+            if (
+                component < self.press_threshold
+                or now - self.switched_at < SWITCH_INTERVAL
+            ):
+                return None
+            if (direction in HORIZONTAL) != (
+                held in HORIZONTAL
+            ) and component < other * SWITCH_RATIO:
+                return None
+        self.direction = direction
+        self.switched_at = now
+        return direction
+
+
+def build_stick_navigators(
+    input_device: InputDeviceEvDevProtocol,
+    axes: typing.Collection[int],
+    deadzone: float,
+    hysteresis: float,
+) -> dict[int, tuple[StickNavigator, bool]]:
+    """Map each stick axis code to its navigator and whether it is X."""
+    navigators: dict[int, tuple[StickNavigator, bool]] = {}
+    for x_code, y_code in STICKS:
+        if x_code not in axes or y_code not in axes:
+            continue
+        x_info = input_device.absinfo(x_code)
+        y_info = input_device.absinfo(y_code)
+        navigator = StickNavigator(
+            AxisRange.from_absinfo(x_info.min, x_info.max),
+            AxisRange.from_absinfo(y_info.min, y_info.max),
+            deadzone,
+            hysteresis,
+        )
+        navigator.set_x(x_info.value)
+        navigator.set_y(y_info.value)
+        navigators[x_code] = (navigator, True)
+        navigators[y_code] = (navigator, False)
+    return navigators
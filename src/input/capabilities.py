@@ -0,0 +1,55 @@
+"""Capability checks deciding which event nodes get a reader.
+
+A controller exposes several event nodes that share its name: on the
+DualSense/DS4 the "Motion Sensors" and "Touchpad" nodes also match a
+"Wireless Controller" mapping by substring, but they only stream axes the
+launcher ignores. Reading them would wake Python hundreds of times per
+second for nothing, so a node needs at least one mapped key or a D-pad hat,
+and accelerometer nodes are never read.
+"""
+
+import logging
+
+from evdev import ecodes  # type: ignore[import]
+
+from src.input.dispatch import HAT_ACTIONS, parse_code
+from src.types.protocols.device import InputDeviceEvDevProtocol
+from src.types.schemas import DeviceMappingsModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def mapped_key_codes(mappings: DeviceMappingsModel | None) -> set[int]:
+    if mappings is None:
+        return set()
+    codes = (parse_code(code) for code in mappings.buttons)
+    return {code for code in codes if code is not None}
+
+
+def has_navigation_capabilities(
+    input_device: InputDeviceEvDevProtocol,
+    mappings: DeviceMappingsModel | None,
+    capabilities: dict[int, list[int]] | None = None,
+) -> bool:
+    """Return ``True`` if *input_device* can produce a mapped action.
+
+    *capabilities* may be passed when already known, to skip the query.
+    """
+    try:
+        props = input_device.input_props()
+        if capabilities is None:
+            capabilities = input_device.capabilities(absinfo=False)
+    except OSError as e:
+        logger.debug(f"Cannot query capabilities of {input_device.path}: {e}")
+        return False
+    if ecodes.INPUT_PROP_ACCELEROMETER in props:  # type: ignore
+        logger.debug(f"Skipping motion sensor node: {input_device.name}")
+        return False
+    keys = capabilities.get(ecodes.EV_KEY, ())  # type: ignore
+    if not mapped_key_codes(mappings).isdisjoint(keys):
+        return True
+    axes = capabilities.get(ecodes.EV_ABS, ())  # type: ignore
+    if not set(HAT_ACTIONS).isdisjoint(axes):
+        return True
+    logger.debug(f"Skipping node without mapped keys or hats: {input_device.name}")
+    return False
@@ -0,0 +1,63 @@
+"""Integer-keyed event → action tables compiled once per device.
+
+A device mapping (``{"304": "enter", ...}``) plus the D-pad hat axes become
+one ``dict`` keyed by the packed ``(type, code, value)`` of the event that
+triggers the action, so the per-event path is a single lookup: no
+``categorize()``, no ``str(code)`` and no pydantic model access. Action
+names are resolved to :class:`Action` codes here too; unknown ones are
+reported once instead of on every press.
+"""
+
+import logging
+
+from evdev import ecodes  # type: ignore[import]
+
+from src.input.actions import Action, parse_action
+from src.types.schemas import DeviceMappingsModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+KEY_PRESS = 1
+
+HAT_ACTIONS: dict[int, dict[int, Action]] = {
+    ecodes.ABS_HAT0X: {-1: Action.LEFT, 1: Action.RIGHT},  # type: ignore
+    ecodes.ABS_HAT0Y: {-1: Action.UP, 1: Action.DOWN},  # type: ignore
+}
+
+DispatchTable = dict[int, Action]
+
+
+def dispatch_key(ev_type: int, code: int, value: int) -> int:
+    """Pack an event into the key used by :data:`DispatchTable`.
+
+    ``value`` keeps its low 20 bits, enough for key states and hat axes
+    (negative values wrap but stay unique).
+    """
+    return (ev_type << 40) | (code << 20) | (value & 0xFFFFF)
+
+
+def parse_code(code: str) -> int | None:
+    """Accept ``"304"`` as well as evdev names such as ``"BTN_SOUTH"``."""
+    if code.lstrip("-").isdigit():
+        return int(code)
+    value = ecodes.ecodes.get(code)  # type: ignore
+    return value if isinstance(value, int) else None
+
+
+def compile_dispatch_table(mappings: DeviceMappingsModel | None) -> DispatchTable:
+    table: DispatchTable = {}
+    buttons = mappings.buttons if mappings is not None else {}
+    for code, name in buttons.items():
+        key_code = parse_code(code)
+        if key_code is None:
+            logger.warning(f"Ignoring unknown key code in mapping: {code}")
+            continue
+        action = parse_action(name)
+        if action is None:
+            logger.warning(f"Ignoring unknown action in mapping: {name}")
+            continue
+        table[dispatch_key(ecodes.EV_KEY, key_code, KEY_PRESS)] = action  # type: ignore
+    for axis, directions in HAT_ACTIONS.items():
+        for value, action in directions.items():
+            table[dispatch_key(ecodes.EV_ABS, axis, value)] = action  # type: ignore
+    return table
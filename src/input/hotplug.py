@@ -0,0 +1,56 @@
+"""Coalescing of udev hotplug bursts into one reconciliation pass.
+
+Connecting one controller emits a burst of udev events, and Bluetooth pads
+flap while pairing. Events are only recorded here; once the debounce
+window closes, :meth:`HotplugBatch.plan` diffs the last known state of
+each node against the running readers, so readers start and stop (and the
+tray updates) once per burst.
+"""
+
+import typing
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ReconcilePlan:
+    stop: list[str] = field(default_factory=list)
+    start: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.stop or self.start)
+
+
+class HotplugBatch:
+    def __init__(self) -> None:
+        # path -> (removed during the burst, present at its end)
+        self._nodes: dict[str, tuple[bool, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def record(self, action: str | None, path: str) -> bool:
+        """Record one udev event; ``True`` if it opened a new batch."""
+        if action not in ("add", "remove"):
+            return False
+        opened = not self._nodes
+        removed, _ = self._nodes.get(path, (False, False))
+        removed = removed or action == "remove"
+        self._nodes[path] = (removed, action == "add")
+        return opened
+
+    def plan(self, running: typing.Container[str]) -> ReconcilePlan:
+        """Take the batch and diff it against the *running* reader paths.
+
+        A node removed and re-added within the burst has a new device
+        behind it, so its reader is restarted.
+        """
+        nodes, self._nodes = self._nodes, {}
+        plan = ReconcilePlan()
+        for path, (removed, present) in nodes.items():
+            is_running = path in running
+            if is_running and (removed or not present):
+                plan.stop.append(path)
+                is_running = False
+            if present and not is_running:
+                plan.start.append(path)
+        return plan
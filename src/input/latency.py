@@ -0,0 +1,153 @@
+"""Optional latency instrumentation, from kernel event timestamp to paint.
+
+Every action carries the ``time.monotonic()`` timestamp of the input frame
+that produced it. When tracing is enabled (``settings.input.latency_tracing``)
+the time elapsed since that timestamp is recorded at each stage:
+
+- ``read``: the events left the kernel (input thread);
+- ``dispatch``: the frame was translated and queued (input thread);
+- ``queue``: the GUI thread drained the action queue;
+- ``action_handler``: the GUI started handling the action;
+- ``focus``: ``AppGrid`` moved the focus;
+- ``paint``: the newly focused ``CustomButton`` was painted.
+
+Each stage keeps a log2 histogram; :meth:`LatencyTracker.dump` formats them
+(sent to the log on ``SIGUSR1`` and on exit).
+"""
+
+import bisect
+import threading
+import time
+
+STAGES: tuple[str, ...] = (
+    "read",
+    "dispatch",
+    "queue",
+    "action_handler",
+    "focus",
+    "paint",
+)
+
+# Bucket upper bounds in microseconds: 16 µs, 32 µs, ... ~1 s, then overflow.
+BUCKET_BOUNDS_US: tuple[int, ...] = tuple(16 << i for i in range(17))
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def record(self, latency_us: float) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_US, latency_us)] += 1
+        self.count += 1
+        self.total_us += latency_us
+        self.max_us = max(self.max_us, latency_us)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the *fraction* quantile (µs)."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(BUCKET_BOUNDS_US, self.buckets, strict=False):
+            seen += bucket
+            if bucket and seen >= target:
+                return min(float(bound), self.max_us)
+        return self.max_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram()
+        clone.buckets = list(self.buckets)
+        clone.count = self.count
+        clone.total_us = self.total_us
+        clone.max_us = self.max_us
+        return clone
+
+
+class LatencyTracker:
+    """Per-stage latency histograms, fed from the input and GUI threads.
+
+    ``begin``/``end``/``focus``/``paint`` follow one action through the GUI
+    thread only; ``record`` may be called from any thread.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self._lock = threading.Lock()
+        self._current: float | None = None
+        self._paint_origin: float | None = None
+
+    def record(self, stage: str, origin: float, now: float | None = None) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic() if now is None else now
+        latency_us = max(0.0, (now - origin) * 1e6)
+        with self._lock:
+            self._histograms[stage].record(latency_us)
+
+    def begin(self, origin: float | None) -> None:
+        """The GUI starts handling an action stamped *origin*."""
+        if not self.enabled or origin is None:
+            return
+        self._current = origin
+        self.record("action_handler", origin)
+
+    def end(self) -> None:
+        self._current = None
+
+    def focus(self) -> None:
+        """The grid moved the focus while handling the current action."""
+        origin = self._current
+        if origin is None:
+            return
+        self.record("focus", origin)
+        # Several moves may land before one paint: measure the oldest.
+        if self._paint_origin is None:
+            self._paint_origin = origin
+
+    def paint(self) -> None:
+        """The focused button was painted."""
+        origin = self._paint_origin
+        if origin is None:
+            return
+        self._paint_origin = None
+        self.record("paint", origin)
+
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        with self._lock:
+            return {stage: h.copy() for stage, h in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self._current = None
+        self._paint_origin = None
+
+    def dump(self) -> str:
+        lines = [
+            f"{'stage':<15}{'count':>8}{'mean':>10}{'p50':>10}"
+            f"{'p95':>10}{'p99':>10}{'max':>10}  (µs)"
+        ]
+        for stage, histogram in self.histograms().items():
+            lines.append(
+                f"{stage:<15}{histogram.count:>8}{histogram.mean_us:>10.0f}"
+                f"{histogram.percentile(0.5):>10.0f}"
+                f"{histogram.percentile(0.95):>10.0f}"
+                f"{histogram.percentile(0.99):>10.0f}"
+                f"{histogram.max_us:>10.0f}"
+            )
+        return "\n".join(lines)
+
+
+_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _tracker
@@ -0,0 +1,206 @@
+"""One thread multiplexing every input device with ``epoll``.
+
+Readers are added and removed through a command queue that wakes the loop
+with an ``eventfd``, and may ask for a timer (``next_deadline``/``tick``);
+a reader that fails is detached on its own without stopping the others.
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+import typing
+from collections import deque
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_ERROR_MASK = select.EPOLLERR | select.EPOLLHUP
+
+
+class InputReader(typing.Protocol):
+    def fileno(self) -> int: ...
+
+    def read(self) -> bool:
+        """Consume pending events; ``False`` when the device is gone."""
+        ...
+
+    def next_deadline(self) -> float | None:
+        """Monotonic time at which :meth:`tick` wants to run, if any."""
+        ...
+
+    def tick(self, now: float) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class InputMultiplexer:
+    def __init__(
+        self,
+        on_reader_closed: typing.Callable[[InputReader], None] | None = None,
+    ) -> None:
+        self.on_reader_closed = on_reader_closed
+        self._readers: dict[int, InputReader] = {}
+        self._commands: deque[tuple[str, InputReader | None]] = deque()
+        self._wake_fd: int | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def reader_count(self) -> int:
+        return len(self._readers)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_running:
+                return
+            self._wake_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            self._thread = threading.Thread(
+                target=self._run, name="InputMultiplexer", daemon=True
+            )
+            self._thread.start()
+        logger.info("Input multiplexer started")
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop the input thread; ``False`` if it is still running."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return True
+            self._post("stop", None)
+        thread.join(timeout)
+        self._thread = None
+        if thread.is_alive():
+            logger.warning("Input multiplexer did not stop in time")
+            return False
+        return True
+
+    def add(self, reader: InputReader) -> None:
+        """Start reading *reader* on the input thread."""
+        self.start()
+        with self._lock:
+            self._post("add", reader)
+
+    def remove(self, reader: InputReader) -> None:
+        """Stop reading *reader* and close it on the input thread."""
+        with self._lock:
+            if not self.is_running:
+                # Nobody would drain the command queue.
+                reader.close()
+                return
+            self._post("remove", reader)
+
+    def _post(self, command: str, reader: InputReader | None) -> None:
+        self._commands.append((command, reader))
+        if self._wake_fd is not None:
+            os.eventfd_write(self._wake_fd, 1)
+
+    def _run(self) -> None:
+        wake_fd = typing.cast(int, self._wake_fd)
+        epoll = select.epoll()
+        epoll.register(wake_fd, select.EPOLLIN)
+        try:
+            while True:
+                for fd, mask in epoll.poll(self._next_timeout()):
+                    if fd == wake_fd:
+                        continue
+                    reader = self._readers.get(fd)
+                    if reader is None:
+                        continue
+                    try:
+                        alive = not mask & _ERROR_MASK and reader.read()
+                    except Exception:
+                        logger.exception(f"Input reader on fd {fd} failed")
+                        alive = False
+                    if not alive:
+                        self._detach(epoll, reader, closed=True)
+                self._run_timers(epoll)
+                if self._commands and not self._apply_commands(epoll, wake_fd):
+                    return
+        except Exception:
+            logger.exception("Input multiplexer stopped unexpectedly")
+        finally:
+            for reader in list(self._readers.values()):
+                self._detach(epoll, reader, closed=False)
+            epoll.close()
+            os.close(wake_fd)
+            self._wake_fd = None
+
+    def _next_timeout(self) -> float:
+        nearest: float | None = None
+        for reader in self._readers.values():
+            try:
+                deadline = reader.next_deadline()
+            except Exception:
+                continue  # detached by _run_timers
+            if deadline is not None and (nearest is None or deadline < nearest):
+                nearest = deadline
+        if nearest is None:
+            return -1
+        return max(0.0, nearest - time.monotonic())
+
+    def _run_timers(self, epoll: select.epoll) -> None:
+        now = time.monotonic()
+        for reader in list(self._readers.values()):
+            try:
+                deadline = reader.next_deadline()
+                if deadline is not None and deadline <= now:
+                    reader.tick(now)
+            except Exception:
+                logger.exception("Input reader timer failed")
+                self._detach(epoll, reader, closed=True)
+
+    def _apply_commands(self, epoll: select.epoll, wake_fd: int) -> bool:
+        """Run queued commands; ``False`` once asked to stop."""
+        try:
+            os.eventfd_read(wake_fd)
+        except BlockingIOError:
+            pass
+        while self._commands:
+            command, reader = self._commands.popleft()
+            if command == "stop":
+                return False
+            if reader is None:
+                continue
+            if command == "add":
+                self._attach(epoll, reader)
+            elif command == "remove":
+                self._detach(epoll, reader, closed=False)
+        return True
+
+    def _attach(self, epoll: select.epoll, reader: InputReader) -> None:
+        try:
+            fd = reader.fileno()
+            if self._readers.get(fd) is reader:
+                return
+            epoll.register(fd, select.EPOLLIN)
+        except Exception:
+            logger.exception("Cannot watch input reader")
+            try:
+                reader.close()
+            except OSError:
+                pass
+            if self.on_reader_closed is not None:
+                self.on_reader_closed(reader)
+            return
+        self._readers[fd] = reader
+
+    def _detach(self, epoll: select.epoll, reader: InputReader, closed: bool) -> None:
+        fd = next((f for f, r in self._readers.items() if r is reader), None)
+        if fd is None:
+            return
+        del self._readers[fd]
+        try:
+            epoll.unregister(fd)
+        except (OSError, ValueError):
+            pass
+        try:
+            reader.close()
+        except OSError:
+            pass
+        if closed and self.on_reader_closed is not None:
+            self.on_reader_closed(reader)
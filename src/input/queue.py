@@ -0,0 +1,147 @@
+"""Bounded, coalescing queue of actions from the input thread to the GUI.
+
+A run of the same move merges into one counted entry, so order is kept
+(at grid edges ``DOWN, RIGHT, DOWN`` and ``RIGHT, DOWN, DOWN`` land on
+different cells). Stale hold repeats and (when full) the oldest moves are
+dropped, and other actions are never dropped.
+"""
+
+import threading
+import time
+import typing
+from collections import deque
+from dataclasses import dataclass
+
+from src.input.actions import MOVES, Action
+
+
+class ActionSink(typing.Protocol):
+    def put(
+        self,
+        actions: list[Action],
+        repeat: bool = False,
+        timestamp: float | None = None,
+    ) -> None: ...
+
+
+@dataclass
+class _Entry:
+    action: Action
+    count: int
+    queued_at: float
+    repeat: bool
+    timestamp: float | None
+
+
+@dataclass(frozen=True)
+class ActionQueueStats:
+    depth: int
+    high_water: int
+    coalesced: int
+    dropped_overflow: int
+    dropped_stale: int
+
+
+class ActionQueue:
+    def __init__(
+        self,
+        max_size: int = 32,
+        repeat_budget: float = 0.15,
+        on_ready: typing.Callable[[], None] | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.repeat_budget = repeat_budget
+        self.on_ready = on_ready
+        self._entries: deque[_Entry] = deque()
+        self._lock = threading.Lock()
+        self._high_water = 0
+        self._coalesced = 0
+        self._dropped_overflow = 0
+        self._dropped_stale = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._entries)
+
+    def put(
+        self,
+        actions: list[Action],
+        repeat: bool = False,
+        timestamp: float | None = None,
+    ) -> None:
+        """Queue *actions* from the input thread.
+
+        *timestamp* is when the input happened (``time.monotonic()``); a
+        coalesced move keeps the oldest one. ``on_ready`` is called when the
+        queue goes from empty to non-empty, so the GUI is woken once per
+        drain, not once per action.
+        """
+        now = time.monotonic()
+        with self._lock:
+            was_empty = not self._entries
+            for action in actions:
+                self._put_locked(action, now, repeat, timestamp)
+            self._high_water = max(self._high_water, len(self._entries))
+            wake = was_empty and bool(self._entries)
+        if wake and self.on_ready is not None:
+            self.on_ready()
+
+    def drain(self) -> list[Action]:
+        """Take every queued action (GUI thread), dropping stale repeats."""
+        actions: list[Action] = []
+        self.drain_into(actions, [])
+        return actions
+
+    def drain_into(self, actions: list[Action], timestamps: list[float | None]) -> None:
+        """Like :meth:`drain`, appending to the caller's buffers.
+
+        ``timestamps`` gets each action's input timestamp at the same index.
+        The GUI reuses both lists, so a drain allocates nothing per action.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for entry in self._entries:
+                if entry.repeat and now - entry.queued_at > self.repeat_budget:
+                    self._dropped_stale += 1
+                    continue
+                for _ in range(entry.count):
+                    actions.append(entry.action)
+                    timestamps.append(entry.timestamp)
+            self._entries.clear()
+
+    def stats(self) -> ActionQueueStats:
+        with self._lock:
+            return ActionQueueStats(
+                depth=len(self._entries),
+                high_water=self._high_water,
+                coalesced=self._coalesced,
+                dropped_overflow=self._dropped_overflow,
+                dropped_stale=self._dropped_stale,
+            )
+
+    def _put_locked(
+        self, action: Action, now: float, repeat: bool, timestamp: float | None
+    ) -> None:
+        entries = self._entries
+        if action not in MOVES:
+            entries.append(_Entry(action, 1, now, False, timestamp))
+            self._trim_locked()
+            return
+        last = entries[-1] if entries else None
+        if last is not None and last.action == action and last.repeat == repeat:
+            last.count += 1
+            self._coalesced += 1
+            if last.timestamp is None:
+                last.timestamp = timestamp
+            return
+        entries.append(_Entry(action, 1, now, repeat, timestamp))
+        self._trim_locked()
+
+    def _trim_locked(self) -> None:
+        entries = self._entries
+        while len(entries) > self.max_size:
+            oldest_move = next((e for e in entries if e.action in MOVES), None)
+            if oldest_move is None:
+                return
+            entries.remove(oldest_move)
+            self._dropped_overflow += 1
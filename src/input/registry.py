@@ -0,0 +1,97 @@
+"""Identity of the connected input devices, described once when opened
+and kept by path, with mapping keys memoised per device name.
+"""
+
+import typing
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+
+from src.types.protocols.device import InputDeviceEvDevProtocol
+from src.types.schemas import DeviceMappingsModel
+
+
+class MappingIndex:
+    """Resolve a device name to its mapping key.
+
+    A key matches when it is a case-insensitive substring of the device
+    name; the first matching key in settings order wins.
+    """
+
+    def __init__(self, keys: typing.Iterable[str]) -> None:
+        self._keys = tuple((key.lower(), key) for key in keys)
+        self._resolved: dict[str, str | None] = {}
+
+    def resolve(self, device_name: str) -> str | None:
+        try:
+            return self._resolved[device_name]
+        except KeyError:
+            pass
+        device_lower = device_name.lower()
+        key = next((key for lower, key in self._keys if lower in device_lower), None)
+        self._resolved[device_name] = key
+        return key
+
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    path: str
+    name: str
+    vendor: int
+    product: int
+    mapping_key: str | None
+    tray: bool = False
+    capabilities: dict[int, list[int]] = field(default_factory=dict, compare=False)
+
+
+class DeviceRegistry:
+    def __init__(self, mappings: Mapping[str, DeviceMappingsModel]) -> None:
+        self.mappings = mappings
+        self.index = MappingIndex(mappings)
+        self._devices: dict[str, DeviceInfo] = {}
+        self._tray_count = 0
+
+    def describe(self, input_device: InputDeviceEvDevProtocol) -> DeviceInfo:
+        """Read the identity of an open device; does not register it."""
+        mapping_key = self.index.resolve(input_device.name)
+        mappings = self.mappings.get(mapping_key) if mapping_key else None
+        return DeviceInfo(
+            path=input_device.path,
+            name=input_device.name,
+            vendor=input_device.info.vendor,
+            product=input_device.info.product,
+            mapping_key=mapping_key,
+            tray=mappings is not None and mappings.tray,
+            capabilities=input_device.capabilities(absinfo=False),
+        )
+
+    def add(self, info: DeviceInfo) -> None:
+        self.remove(info.path)
+        self._devices[info.path] = info
+        self._tray_count += info.tray
+
+    def remove(self, path: str) -> DeviceInfo | None:
+        info = self._devices.pop(path, None)
+        if info is not None:
+            self._tray_count -= info.tray
+        return info
+
+    def get(self, path: str) -> DeviceInfo | None:
+        return self._devices.get(path)
+
+    def clear(self) -> None:
+        self._devices.clear()
+        self._tray_count = 0
+
+    @property
+    def has_tray_device(self) -> bool:
+        """Whether a connected device has a mapping with ``tray`` set."""
+        return self._tray_count > 0
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._devices
+
+    def __iter__(self) -> Iterator[DeviceInfo]:
+        return iter(list(self._devices.values()))
+
+    def __len__(self) -> int:
+        return len(self._devices)
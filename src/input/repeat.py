@@ -0,0 +1,101 @@
+"""Hold-to-repeat for navigation actions.
+
+Repeats are scheduled on the input thread from the kernel timestamp of the
+press: the first after ``delay``, then every ``interval``, which shrinks by
+``acceleration`` down to ``min_interval``. Deadlines are on the
+``time.monotonic()`` clock; the multiplexer sleeps in ``epoll`` until the
+nearest one.
+
+A :class:`RepeatGate` lets at most one repeat be in flight towards the GUI:
+while the GUI has not picked up the previous batch, due repeats are skipped
+rather than queued, so a busy GUI never receives a burst of stale moves.
+"""
+
+import threading
+import time
+import typing
+
+from src.input.actions import MOVES, Action
+from src.types.schemas import InputModel
+
+REPEATABLE_ACTIONS = frozenset(MOVES)
+
+
+class RepeatGate:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight = False
+        self.skipped = 0
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight:
+                self.skipped += 1
+                return False
+            self._in_flight = True
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight = False
+
+
+class HoldRepeater:
+    def __init__(
+        self,
+        delay: float,
+        interval: float,
+        min_interval: float,
+        acceleration: float,
+    ) -> None:
+        self.delay = delay
+        self.interval = interval
+        self.min_interval = min_interval
+        self.acceleration = acceleration
+        self.action: Action | None = None
+        self.source: typing.Hashable = None
+        self.deadline: float | None = None
+        self._current_interval = interval
+
+    @classmethod
+    def from_settings(cls, input_settings: InputModel) -> "HoldRepeater":
+        return cls(
+            delay=input_settings.repeat_delay,
+            interval=input_settings.repeat_interval,
+            min_interval=input_settings.repeat_min_interval,
+            acceleration=input_settings.repeat_acceleration,
+        )
+
+    def press(self, action: Action, source: typing.Hashable, timestamp: float) -> None:
+        """Start repeating *action* held since *timestamp* (monotonic)."""
+        if action not in REPEATABLE_ACTIONS:
+            return
+        self.action = action
+        self.source = source
+        self.deadline = timestamp + self.delay
+        self._current_interval = self.interval
+
+    def release(self, source: typing.Hashable) -> None:
+        if self.source == source:
+            self.cancel()
+
+    def cancel(self) -> None:
+        self.action = None
+        self.source = None
+        self.deadline = None
+
+    def poll(self, now: float) -> Action | None:
+        """Return the held action if a repeat is due at *now*."""
+        deadline = self.deadline
+        if deadline is None or now < deadline:
+            return None
+        interval = self._current_interval
+        # Never catch up on missed repeats: schedule from now if late.
+        self.deadline = max(deadline + interval, now + self.min_interval)
+        self._current_interval = max(self.min_interval, interval * self.acceleration)
+        return self.action
+
+
+def realtime_to_monotonic(timestamp: float) -> float:
+    """Convert an evdev ``CLOCK_REALTIME`` timestamp to ``time.monotonic()``."""
+    return timestamp - (time.time() - time.monotonic())
@@ -0,0 +1,336 @@
+"""Recorded input traces and their replay into the input pipeline.
+
+A trace is a compact binary file::
+
+    b"ALIT" | version: u16 | header length: u32 | header (JSON, UTF-8)
+    records: time_ns u64 | device u16 | type u16 | code u16 | value i32
+
+The JSON header describes each device (name, path, key codes and the
+``absinfo`` of its axes) so it can be rebuilt as a :class:`ReplayDevice`;
+record times are nanoseconds since the first recorded event.
+
+:class:`TraceReplayer` feeds a trace through :class:`DeviceEventWorker`
+without hardware or uinput, either on a virtual clock (deterministic, as
+fast as possible, hold repeats included) or in real time through an
+:class:`InputMultiplexer`, at the original speed or accelerated.
+"""
+
+import heapq
+import json
+import math
+import os
+import struct
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+
+from evdev import ecodes  # type: ignore[import]
+from evdev.device import AbsInfo, DeviceInfo  # type: ignore[import]
+from evdev.events import InputEvent  # type: ignore[import]
+
+from src.input.multiplexer import InputMultiplexer
+from src.input.queue import ActionSink
+from src.input.registry import MappingIndex
+from src.input.repeat import RepeatGate
+from src.input.worker import DeviceEventWorker
+from src.settings import Settings, get_settings
+from src.types.protocols.device import InputDeviceEvDevProtocol, InputEventProtocol
+
+settings: Settings = get_settings()
+
+MAGIC = b"ALIT"
+VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_RECORD = struct.Struct("<QHHHi")
+
+EV_SYN: int = ecodes.EV_SYN  # type: ignore
+EV_KEY: int = ecodes.EV_KEY  # type: ignore
+EV_ABS: int = ecodes.EV_ABS  # type: ignore
+SYN_REPORT: int = ecodes.SYN_REPORT  # type: ignore
+
+
+class TraceFormatError(ValueError):
+    pass
+
+
+class TraceEvent(typing.NamedTuple):
+    time_ns: int
+    device: int
+    type: int
+    code: int
+    value: int
+
+
+@dataclass(frozen=True)
+class TraceDevice:
+    name: str
+    path: str
+    keys: tuple[int, ...] = ()
+    # code -> (min, max, value)
+    axes: dict[int, tuple[int, int, int]] = field(
+        default_factory=dict[int, tuple[int, int, int]]
+    )
+
+    @classmethod
+    def from_input_device(cls, input_device: InputDeviceEvDevProtocol) -> "TraceDevice":
+        capabilities = input_device.capabilities(absinfo=False)
+        axes: dict[int, tuple[int, int, int]] = {}
+        for code in capabilities.get(EV_ABS, ()):
+            info = input_device.absinfo(code)
+            axes[code] = (info.min, info.max, info.value)
+        return cls(
+            input_device.name,
+            input_device.path,
+            tuple(capabilities.get(EV_KEY, ())),
+            axes,
+        )
+
+    def to_json(self) -> dict[str, typing.Any]:
+        return {
+            "name": self.name,
+            "path": self.path,
+            "keys": list(self.keys),
+            "axes": {str(code): list(info) for code, info in self.axes.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, typing.Any]) -> "TraceDevice":
+        axes = {int(code): tuple(info) for code, info in data.get("axes", {}).items()}
+        return cls(
+            data["name"],
+            data["path"],
+            tuple(data.get("keys", ())),
+            typing.cast(dict[int, tuple[int, int, int]], axes),
+        )
+
+
+@dataclass
+class Trace:
+    devices: list[TraceDevice]
+    events: list[TraceEvent]
+
+    @property
+    def duration(self) -> float:
+        return self.events[-1].time_ns / 1e9 if self.events else 0.0
+
+
+class TraceWriter:
+    """Writes a trace; event times are kept relative to the first one."""
+
+    def __init__(self, stream: typing.BinaryIO, devices: list[TraceDevice]) -> None:
+        self.stream = stream
+        self._origin_ns: int | None = None
+        header = json.dumps({"devices": [d.to_json() for d in devices]}).encode()
+        stream.write(_HEADER.pack(MAGIC, VERSION, len(header)))
+        stream.write(header)
+
+    def write(self, device: int, event: InputEventProtocol) -> None:
+        """Append an evdev *event* read from the *device*-th device."""
+        time_ns = event.sec * 1_000_000_000 + event.usec * 1_000
+        if self._origin_ns is None:
+            self._origin_ns = time_ns
+        self.write_record(
+            TraceEvent(
+                max(0, time_ns - self._origin_ns),
+                device,
+                event.type,
+                event.code,
+                event.value,
+            )
+        )
+
+    def write_record(self, record: TraceEvent) -> None:
+        self.stream.write(_RECORD.pack(*record))
+
+
+def write_trace(stream: typing.BinaryIO, trace: Trace) -> None:
+    writer = TraceWriter(stream, trace.devices)
+    for record in trace.events:
+        writer.write_record(record)
+
+
+def read_trace(stream: typing.BinaryIO) -> Trace:
+    head = stream.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        raise TraceFormatError("truncated trace header")
+    magic, version, header_length = _HEADER.unpack(head)
+    if magic != MAGIC:
+        raise TraceFormatError("not an input trace")
+    if version != VERSION:
+        raise TraceFormatError(f"unsupported trace version {version}")
+    header = json.loads(stream.read(header_length))
+    devices = [TraceDevice.from_json(d) for d in header["devices"]]
+    body = stream.read()
+    usable = len(body) - len(body) % _RECORD.size
+    events = [TraceEvent(*r) for r in _RECORD.iter_unpack(body[:usable])]
+    if any(event.device >= len(devices) for event in events):
+        raise TraceFormatError("record refers to an unknown device")
+    return Trace(devices, events)
+
+
+class ReplayDevice:
+    """An evdev-like device fed from a trace through a pipe, so ``epoll``
+    sees a real fd."""
+
+    def __init__(self, trace_device: TraceDevice) -> None:
+        self.name = trace_device.name
+        self.path = trace_device.path
+        self.info = DeviceInfo(0, 0, 0, 0)
+        self.trace_device = trace_device
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._pending: list[InputEvent] = []
+        self._lock = threading.Lock()
+
+    @property
+    def fd(self) -> int:
+        return self._read_fd
+
+    def push(self, events: list[InputEvent]) -> None:
+        with self._lock:
+            self._pending.extend(events)
+        os.write(self._write_fd, b"x")
+
+    def read(self) -> typing.Iterator[InputEvent]:
+        try:
+            os.read(self._read_fd, 4096)
+        except BlockingIOError:
+            pass
+        with self._lock:
+            events, self._pending = self._pending, []
+        if not events:
+            raise BlockingIOError
+        return iter(events)
+
+    def capabilities(
+        self, verbose: bool = False, absinfo: bool = True
+    ) -> dict[int, list[int]]:
+        capabilities = {EV_SYN: [0]}
+        if self.trace_device.keys:
+            capabilities[EV_KEY] = list(self.trace_device.keys)
+        if self.trace_device.axes:
+            capabilities[EV_ABS] = list(self.trace_device.axes)
+        return capabilities
+
+    def absinfo(self, axis_num: int) -> AbsInfo:
+        minimum, maximum, value = self.trace_device.axes[axis_num]
+        return AbsInfo(value, minimum, maximum, 0, 0, 0)
+
+    def input_props(self, verbose: bool = False) -> list[int]:
+        return []
+
+    def close(self) -> None:
+        for fd in (self._read_fd, self._write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._read_fd = self._write_fd = -1
+
+
+def _stamp(record: TraceEvent, timestamp: float) -> InputEvent:
+    sec = int(timestamp)
+    usec = int(round((timestamp - sec) * 1_000_000))
+    return InputEvent(sec, usec, record.type, record.code, record.value)
+
+
+class TraceReplayer:
+    """Replays a trace into one :class:`DeviceEventWorker` per device."""
+
+    def __init__(
+        self,
+        trace: Trace,
+        action_sink: ActionSink,
+        repeat_gate: RepeatGate | None = None,
+    ) -> None:
+        self.trace = trace
+        index = MappingIndex(settings.mappings)
+        self.devices = [ReplayDevice(device) for device in trace.devices]
+        self.workers = [
+            DeviceEventWorker(
+                device,
+                index.resolve(device.name) or device.name,
+                action_sink,
+                repeat_gate,
+                monotonic_clock=True,
+            )
+            for device in self.devices
+        ]
+        self.frames = 0
+
+    def _frames(self) -> typing.Iterator[tuple[int, list[TraceEvent]]]:
+        """Yield ``(device, events)`` per ``SYN_REPORT`` frame, in order."""
+        pending: dict[int, list[TraceEvent]] = {}
+        for record in self.trace.events:
+            frame = pending.setdefault(record.device, [])
+            frame.append(record)
+            if record.type == EV_SYN and record.code == SYN_REPORT:
+                yield record.device, pending.pop(record.device)
+
+    def run_virtual(self, start: float = 0.0) -> int:
+        """Replay on a virtual clock starting at *start*; deterministic.
+
+        Frames go straight to ``handle_events`` and due hold repeats are
+        ticked between them, so the result does not depend on scheduling.
+        Returns the number of frames replayed.
+        """
+        for device, records in self._frames():
+            now = start + records[-1].time_ns / 1e9
+            self._tick_until(now)
+            self.workers[device].handle_events(
+                [_stamp(record, start + record.time_ns / 1e9) for record in records]
+            )
+            self.frames += 1
+        self._tick_until(start + self.trace.duration)
+        return self.frames
+
+    def _tick_until(self, now: float) -> None:
+        deadlines = [
+            (deadline, index)
+            for index, worker in enumerate(self.workers)
+            if (deadline := worker.next_deadline()) is not None
+        ]
+        heapq.heapify(deadlines)
+        while deadlines and deadlines[0][0] <= now:
+            deadline, index = heapq.heappop(deadlines)
+            worker = self.workers[index]
+            worker.tick(deadline)
+            following = worker.next_deadline()
+            if following is not None:
+                heapq.heappush(deadlines, (following, index))
+
+    def run(
+        self,
+        multiplexer: InputMultiplexer,
+        speed: float = 1.0,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Replay in real time through *multiplexer*, *speed* times faster.
+
+        ``speed=math.inf`` pushes frames back to back. Events are stamped
+        with ``time.monotonic()`` when pushed, so latency is measured from
+        the moment the replayed input "happened"; hold repeats run on the
+        multiplexer's real clock. Returns the number of frames replayed.
+        """
+        for worker in self.workers:
+            multiplexer.add(worker)
+        started = time.monotonic()
+        for device, records in self._frames():
+            if stop is not None and stop.is_set():
+                break
+            if not math.isinf(speed):
+                delay = started + records[-1].time_ns / 1e9 / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            now = time.monotonic()
+            self.devices[device].push([_stamp(record, now) for record in records])
+            self.frames += 1
+        return self.frames
+
+    def close(self, multiplexer: InputMultiplexer | None = None) -> None:
+        for worker in self.workers:
+            if multiplexer is not None:
+                multiplexer.remove(worker)
+            else:
+                worker.close()
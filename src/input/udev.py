@@ -0,0 +1,68 @@
+"""udev filtering of input hotplug events and startup enumeration.
+
+Event nodes are selected by the :data:`UDEV_TAG` rule that ``install.py``
+installs, or by their ``ID_INPUT_*`` properties when it is missing.
+"""
+
+import glob
+import logging
+import os
+import typing
+
+from src.types.protocols.device import InputDevicePyDevProtocol
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+UDEV_TAG = "app_launcher"
+NAVIGATION_PROPERTIES: tuple[str, ...] = ("ID_INPUT_JOYSTICK", "ID_INPUT_KEY")
+UDEV_RULES_DIRS: tuple[str, ...] = (
+    "/etc/udev/rules.d",
+    "/run/udev/rules.d",
+    "/usr/lib/udev/rules.d",
+    "/lib/udev/rules.d",
+)
+UDEV_RULE = "".join(
+    f'SUBSYSTEM=="input", KERNEL=="event*", ENV{{{prop}}}=="1", TAG+="{UDEV_TAG}"\n'
+    for prop in NAVIGATION_PROPERTIES
+)
+
+
+def udev_tag_installed(rules_dirs: typing.Iterable[str] = UDEV_RULES_DIRS) -> bool:
+    """Whether a udev rule adds :data:`UDEV_TAG` to input nodes."""
+    needle = f'TAG+="{UDEV_TAG}"'
+    for rules_dir in rules_dirs:
+        for path in glob.glob(os.path.join(rules_dir, "*.rules")):
+            try:
+                with open(path) as rules:
+                    if needle in rules.read():
+                        return True
+            except OSError:
+                continue
+    return False
+
+
+def is_navigation_node(device: InputDevicePyDevProtocol) -> bool:
+    """An ``eventX`` node udev classified as a joystick or key device."""
+    device_node = device.device_node
+    if not device_node or not device_node.startswith("/dev/input/event"):
+        return False
+    return any(device.get(prop) == "1" for prop in NAVIGATION_PROPERTIES)
+
+
+def configure_monitor(monitor: typing.Any, use_tag: bool) -> None:
+    """Install the netlink socket filter on a ``pyudev.Monitor``."""
+    monitor.filter_by(subsystem="input")
+    if use_tag:
+        monitor.filter_by_tag(UDEV_TAG)
+
+
+def list_navigation_nodes(context: typing.Any, use_tag: bool) -> list[str]:
+    """Event nodes of joysticks and key devices, from the udev database."""
+    devices = context.list_devices(subsystem="input", sys_name="event*")
+    if use_tag:
+        devices = devices.match_tag(UDEV_TAG)
+    else:
+        # libudev ORs property matches, ANDs them with subsystem/sys_name.
+        for prop in NAVIGATION_PROPERTIES:
+            devices = devices.match_property(prop, "1")
+    return sorted(device.device_node for device in devices if device.device_node)
@@ -0,0 +1,243 @@
+"""Per-device translation of evdev events into launcher actions."""
+
+import fcntl
+import logging
+import struct
+import time
+import typing
+from collections.abc import Iterable
+
+from evdev import ecodes  # type: ignore[import]
+
+from src.input.actions import Action
+from src.input.analog import StickNavigator, build_stick_navigators
+from src.input.dispatch import DispatchTable, compile_dispatch_table
+from src.input.latency import get_latency_tracker
+from src.input.queue import ActionSink
+from src.input.repeat import (
+    REPEATABLE_ACTIONS,
+    HoldRepeater,
+    RepeatGate,
+    realtime_to_monotonic,
+)
+from src.settings import Settings, get_settings
+from src.types.protocols.device import InputDeviceEvDevProtocol, InputEventProtocol
+
+logger: logging.Logger = logging.getLogger(__name__)
+settings: Settings = get_settings()
+
+EV_SYN: int = ecodes.EV_SYN  # type: ignore
+EV_KEY: int = ecodes.EV_KEY  # type: ignore
+EV_ABS: int = ecodes.EV_ABS  # type: ignore
+SYN_REPORT: int = ecodes.SYN_REPORT  # type: ignore
+SYN_DROPPED: int = ecodes.SYN_DROPPED  # type: ignore
+
+# Bounded so one flooding device cannot starve the others on the thread.
+MAX_READS_PER_WAKEUP = 8
+
+# _IOW('E', 0xa0, int): select the clock used for event timestamps.
+EVIOCSCLOCKID = 0x400445A0
+
+
+def _use_monotonic_clock(fd: int) -> bool:
+    """Ask the kernel to stamp events with ``CLOCK_MONOTONIC``."""
+    try:
+        fcntl.ioctl(fd, EVIOCSCLOCKID, struct.pack("i", time.CLOCK_MONOTONIC))
+    except OSError:
+        return False
+    return True
+
+
+class DeviceEventWorker:
+    """Reads one device when the multiplexer reports it readable."""
+
+    def __init__(
+        self,
+        input_device: InputDeviceEvDevProtocol,
+        mapping_key: str,
+        action_sink: ActionSink,
+        repeat_gate: RepeatGate | None = None,
+        monotonic_clock: bool | None = None,
+    ) -> None:
+        self.input_device: InputDeviceEvDevProtocol = input_device
+        self.mapping_key = mapping_key
+        self.action_sink = action_sink
+        self.dispatch_table: DispatchTable = compile_dispatch_table(
+            settings.mappings.get(mapping_key)
+        )
+        self._sticks: dict[int, tuple[StickNavigator, bool]] = {}
+        if settings.input.stick_navigation:
+            self._sticks = build_stick_navigators(
+                input_device,
+                input_device.capabilities(absinfo=False).get(EV_ABS, ()),
+                settings.input.stick_deadzone,
+                settings.input.stick_hysteresis,
+            )
+        self._navigators = list(dict.fromkeys(n for n, _ in self._sticks.values()))
+        self.repeat_gate = repeat_gate
+        self._repeater: HoldRepeater | None = None
+        if settings.input.repeat_navigation:
+            self._repeater = HoldRepeater.from_settings(settings.input)
+        # Replayed events are already stamped on time.monotonic().
+        if monotonic_clock is None:
+            monotonic_clock = _use_monotonic_clock(input_device.fd)
+        self._monotonic_clock = monotonic_clock
+        self._frame_actions: list[Action] = []
+        self._frame_axes: dict[int, int] = {}
+        self._dropping = False
+        self._frame_hold: tuple[Action, typing.Hashable] | None = None
+        self._latency = get_latency_tracker()
+        # Counters for stress runs: reports seen, SYN_DROPPED overflows.
+        self.frames = 0
+        self.dropped_frames = 0
+        self._read_at = 0.0
+
+    @property
+    def path(self) -> str:
+        return self.input_device.path
+
+    def fileno(self) -> int:
+        return self.input_device.fd
+
+    def read(self) -> bool:
+        """Drain every pending event; ``False`` once the device is gone."""
+        try:
+            for _ in range(MAX_READS_PER_WAKEUP):
+                events = self.input_device.read()
+                self._read_at = time.monotonic()
+                self.handle_events(events)
+        except BlockingIOError:
+            pass
+        except OSError:
+            logger.warning(f"Device disconnected: {self.input_device.path}")
+            return False
+        return True
+
+    def next_deadline(self) -> float | None:
+        return self._repeater.deadline if self._repeater is not None else None
+
+    def tick(self, now: float) -> None:
+        """Emit a due hold repeat, unless the GUI has not taken the last one."""
+        if self._repeater is None:
+            return
+        action = self._repeater.poll(now)
+        if action is None:
+            return
+        if self.repeat_gate is not None and not self.repeat_gate.try_acquire():
+            logger.debug(f"[REPEAT] {action} skipped, GUI busy")
+            return
+        logger.debug(f"[REPEAT] {action} emitted")
+        self.action_sink.put([action], repeat=True, timestamp=now)
+
+    def close(self) -> None:
+        self.input_device.close()
+        logger.info(f"[DeviceEventWorker] Stopped for: {self.input_device.name}")
+
+    def handle_events(self, events: Iterable[InputEventProtocol]) -> None:
+        """Translate events frame by frame.
+
+        Within a ``SYN_REPORT`` frame only the last value of each absolute
+        axis counts, so a hat release+press collapses into one move. The
+        actions of a frame are emitted together, once, at its
+        ``SYN_REPORT``; frames without actions emit nothing. A frame may
+        span several reads. Directional presses start a hold repeat from
+        the frame's kernel timestamp and releases cancel it.
+        """
+        lookup = self.dispatch_table.get
+        repeater = self._repeater
+        frame_actions = self._frame_actions
+        frame_axes = self._frame_axes
+        for event in events:
+            ev_type = event.type
+            if ev_type == EV_SYN:
+                if event.code == SYN_REPORT:
+                    self.frames += 1
+                    if self._dropping:
+                        self._dropping = False
+                    else:
+                        self._flush_frame(event)
+                elif event.code == SYN_DROPPED:
+                    # The kernel buffer overflowed: discard up to the next
+                    # report instead of acting on a partial frame.
+                    self.dropped_frames += 1
+                    self._dropping = True
+                    frame_actions.clear()
+                    frame_axes.clear()
+                    self._frame_hold = None
+                    if repeater is not None:
+                        repeater.cancel()
+            elif self._dropping:
+                continue
+            elif ev_type == EV_ABS:
+                frame_axes[event.code] = event.value
+            else:
+                # Inlined dispatch_key(): this loop runs for every event.
+                action = lookup(
+                    (ev_type << 40) | (event.code << 20) | (event.value & 0xFFFFF)
+                )
+                if action is not None:
+                    frame_actions.append(action)
+                    if action in REPEATABLE_ACTIONS:
+                        self._frame_hold = (action, (ev_type, event.code))
+                elif (
+                    repeater is not None
+                    and event.value == 0
+                    and repeater.source == (ev_type, event.code)
+                ):
+                    repeater.cancel()
+
+    def _flush_frame(self, syn_event: InputEventProtocol) -> None:
+        frame_actions = self._frame_actions
+        frame_axes = self._frame_axes
+        repeater = self._repeater
+        if frame_axes:
+            lookup = self.dispatch_table.get
+            sticks = self._sticks
+            stick_moved = False
+            for code, value in frame_axes.items():
+                stick = sticks.get(code)
+                if stick is not None:
+                    navigator, is_x = stick
+                    if is_x:
+                        navigator.set_x(value)
+                    else:
+                        navigator.set_y(value)
+                    stick_moved = True
+                    continue
+                action = lookup((EV_ABS << 40) | (code << 20) | (value & 0xFFFFF))
+                if action is not None:
+                    frame_actions.append(action)
+                    self._frame_hold = (action, (EV_ABS, code))
+                elif repeater is not None and value == 0:
+                    repeater.release((EV_ABS, code))
+            frame_axes.clear()
+            if stick_moved:
+                now = self._timestamp(syn_event)
+                for navigator in self._navigators:
+                    action = navigator.update(now)
+                    if action is not None:
+                        frame_actions.append(action)
+                        self._frame_hold = (action, navigator)
+                    elif repeater is not None and navigator.direction is None:
+                        repeater.release(navigator)
+        if self._frame_hold is not None:
+            if repeater is not None:
+                action, source = self._frame_hold
+                repeater.press(action, source, self._timestamp(syn_event))
+            self._frame_hold = None
+        if frame_actions:
+            logger.debug(f"[ACTIONS] {frame_actions} emitted")
+            timestamp = self._timestamp(syn_event)
+            latency = self._latency
+            if latency.enabled:
+                latency.record("read", timestamp, self._read_at)
+            self.action_sink.put(frame_actions, timestamp=timestamp)
+            if latency.enabled:
+                latency.record("dispatch", timestamp)
+            frame_actions.clear()
+
+    def _timestamp(self, event: InputEventProtocol) -> float:
+        timestamp = event.sec + event.usec * 1e-6
+        if self._monotonic_clock:
+            return timestamp
+        return realtime_to_monotonic(timestamp)
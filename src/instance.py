@@ -1,43 +1,124 @@
+"""Single-instance lock and hand-off channel.
+
+The running launcher listens on an abstract-namespace Unix socket. Binding
+it is the lock: the kernel releases the name when the process dies, so no
+stale PID files are left behind. A second launch connects to the same name,
+sends a command (``show``) and exits; the running instance raises its
+window. Nothing here imports PySide6, which keeps the hand-off cheap.
+
+The running side never blocks on a client: accepted connections are
+non-blocking, and one whose command has not arrived yet stays pending until
+its descriptor (see :meth:`InstanceLock.pending_filenos`) turns readable.
+"""
+
+import errno
 import os
+import socket
 from logging import Logger, getLogger
 
-import psutil
-
 logger: Logger = getLogger(__name__)
 
+SHOW_COMMAND = "show"
+_MAX_COMMAND_SIZE = 64
+
 
-def create_pid_file_path() -> str:
-    pid_file = os.path.join(os.path.expanduser("~"), ".config", "app_launcher.pid")
-    logger.debug(f"PID file created: {pid_file}")
-    return pid_file
+def instance_socket_name() -> str:
+    return f"\0app_launcher-{os.getuid()}"
 
 
 def get_current_pid() -> int:
     return os.getpid()
 
 
-def check_pid_exist(pid: int) -> bool:
-    for process in psutil.process_iter(["name"]):
-        if process.pid == pid:
+class InstanceLock:
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name or instance_socket_name()
+        self._server: socket.socket | None = None
+        self._connections: dict[int, socket.socket] = {}
+
+    @property
+    def is_acquired(self) -> bool:
+        return self._server is not None
+
+    def acquire(self) -> bool:
+        """Bind the instance socket; ``False`` if another instance holds it."""
+        if self._server is not None:
             return True
-    return False
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+        try:
+            server.bind(self.name)
+        except OSError as e:
+            server.close()
+            if e.errno == errno.EADDRINUSE:
+                return False
+            raise
+        server.listen(4)
+        server.setblocking(False)
+        self._server = server
+        logger.info(f"Instance lock acquired by PID: {get_current_pid()}")
+        return True
 
+    def release(self) -> None:
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            logger.info("Instance lock released")
 
-def read_pid_file() -> int:
-    try:
-        with open(create_pid_file_path()) as pid_file:
-            return int(pid_file.read())
-    except FileNotFoundError:
-        return 0
+    def fileno(self) -> int:
+        if self._server is None:
+            raise RuntimeError("Instance lock not acquired")
+        return self._server.fileno()
 
+    def pending_filenos(self) -> list[int]:
+        """Descriptors of accepted connections still waiting for a command."""
+        return list(self._connections)
 
-def write_pid_file() -> None:
-    with open(create_pid_file_path(), "w") as pid_file:
-        pid_file.write(f"{get_current_pid()}\n")
-        pid_file.close()
+    def receive(self) -> list[str]:
+        """Accept new connections and return the commands sent so far."""
+        commands: list[str] = []
+        if self._server is None:
+            return commands
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            connection.setblocking(False)
+            self._connections[connection.fileno()] = connection
+        for fd, connection in list(self._connections.items()):
+            try:
+                data = connection.recv(_MAX_COMMAND_SIZE)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError as e:
+                logger.debug(f"Failed to read instance command: {e}")
+                data = b""
+            del self._connections[fd]
+            connection.close()
+            command = data.decode(errors="replace").strip()
+            if command:
+                logger.debug(f"Instance command received: {command}")
+                commands.append(command)
+        return commands
 
 
-def destroy_pid_file() -> None:
-    if os.path.exists(create_pid_file_path()):
-        os.remove(create_pid_file_path())
-        logger.info("PID file destroyed")
+def notify_running_instance(
+    command: str = SHOW_COMMAND,
+    name: str | None = None,
+    timeout: float = 1.0,
+) -> bool:
+    """Send *command* to the running instance; ``False`` if none answers."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+    client.settimeout(timeout)
+    try:
+        client.connect(name or instance_socket_name())
+        client.sendall(f"{command}\n".encode())
+    except OSError as e:
+        logger.debug(f"Running instance not reachable: {e}")
+        return False
+    finally:
+        client.close()
+    return True
@@ -0,0 +1,37 @@
+"""Process tracking used to block input while other front-ends run.
+
+The Qt-backed :class:`~src.process.index.ProcessIndex` lives in
+``src.process.index`` and is not re-exported here, so modules without a
+GUI dependency can import the matcher and ``/proc`` readers cheaply.
+"""
+
+from .matcher import ProcessMatcher, compile_matcher
+from .procfs import PROC_ROOT, list_pids, read_process
+from .scanner import ProcfsScanner, PsutilScanner, get_scanner
+from .snapshot import ProcessSnapshot
+from .tree import ProcessTree
+from .windows import (
+    WindowIndex,
+    WindowInfo,
+    WindowResolver,
+    get_window_index,
+    get_window_resolver,
+)
+
+__all__ = [
+    "PROC_ROOT",
+    "ProcessMatcher",
+    "ProcessSnapshot",
+    "ProcessTree",
+    "ProcfsScanner",
+    "PsutilScanner",
+    "WindowIndex",
+    "WindowInfo",
+    "WindowResolver",
+    "compile_matcher",
+    "get_scanner",
+    "get_window_index",
+    "get_window_resolver",
+    "list_pids",
+    "read_process",
+]
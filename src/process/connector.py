@@ -0,0 +1,130 @@
+"""Linux proc connector (netlink) client.
+
+Subscribes to kernel fork/exec/exit notifications so the process index only
+has to inspect PIDs that actually changed. Listening requires
+``CAP_NET_ADMIN``; callers must be ready for :class:`OSError` on
+:meth:`ProcConnector.open` and fall back to polling.
+"""
+
+import errno
+import logging
+import os
+import socket
+import struct
+from collections.abc import Iterator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT_HEADER = struct.Struct("=IIQ")
+_FORK_DATA = struct.Struct("=IIII")
+_PID_TGID = struct.Struct("=II")
+_OP = struct.Struct("=I")
+
+_EVENT_OFFSET = _NLMSGHDR.size + _CN_MSG.size
+_DATA_OFFSET = _EVENT_OFFSET + _PROC_EVENT_HEADER.size
+
+# (what, pid, tgid, parent_tgid)
+ProcEvent = tuple[int, int, int, int]
+
+
+class ProcConnectorOverrun(OSError):
+    """The kernel dropped events; the caller must resynchronise."""
+
+
+class ProcConnector:
+    def __init__(self, recv_size: int = 8192) -> None:
+        self._recv_size = recv_size
+        self._sock: socket.socket | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._sock is not None
+
+    def fileno(self) -> int:
+        if self._sock is None:
+            raise OSError(errno.EBADF, "proc connector is closed")
+        return self._sock.fileno()
+
+    def open(self) -> None:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+        try:
+            sock.bind((os.getpid(), CN_IDX_PROC))
+            sock.send(self._control_message(PROC_CN_MCAST_LISTEN))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        logger.info("Proc connector subscribed")
+
+    def close(self) -> None:
+        if self._sock is None:
+            return
+        try:
+            self._sock.send(self._control_message(PROC_CN_MCAST_IGNORE))
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+
+    def set_timeout(self, timeout: float | None) -> None:
+        if self._sock is not None:
+            self._sock.settimeout(timeout)
+
+    def read(self) -> list[ProcEvent]:
+        """Block for the next datagram and return the events it carries.
+
+        Raises :class:`TimeoutError` when a timeout is set and expires, and
+        :class:`ProcConnectorOverrun` when the socket buffer overflowed.
+        """
+        if self._sock is None:
+            raise OSError(errno.EBADF, "proc connector is closed")
+        try:
+            data = self._sock.recv(self._recv_size)
+        except OSError as e:
+            if e.errno == errno.ENOBUFS:
+                raise ProcConnectorOverrun(e.errno, "proc connector overrun") from e
+            raise
+        return list(parse_messages(data))
+
+    @staticmethod
+    def _control_message(op: int) -> bytes:
+        payload = _OP.pack(op)
+        cn_msg = _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0)
+        length = _NLMSGHDR.size + len(cn_msg) + len(payload)
+        header = _NLMSGHDR.pack(length, NLMSG_DONE, 0, 0, os.getpid())
+        return header + cn_msg + payload
+
+
+def parse_messages(data: bytes) -> Iterator[ProcEvent]:
+    """Decode the fork/exec/exit events contained in a netlink datagram."""
+    offset = 0
+    size = len(data)
+    while offset + _DATA_OFFSET <= size:
+        msg_len = _NLMSGHDR.unpack_from(data, offset)[0]
+        if msg_len < _DATA_OFFSET or offset + msg_len > size:
+            break
+        what = _PROC_EVENT_HEADER.unpack_from(data, offset + _EVENT_OFFSET)[0]
+        data_offset = offset + _DATA_OFFSET
+        if what == PROC_EVENT_FORK:
+            _, parent_tgid, child_pid, child_tgid = _FORK_DATA.unpack_from(
+                data, data_offset
+            )
+            yield (what, child_pid, child_tgid, parent_tgid)
+        elif what in (PROC_EVENT_EXEC, PROC_EVENT_EXIT):
+            pid, tgid = _PID_TGID.unpack_from(data, data_offset)
+            yield (what, pid, tgid, 0)
+        offset += (msg_len + 3) & ~3
@@ -0,0 +1,281 @@
+"""Long-lived index of running processes matching a watch list.
+
+The index is kept fresh from a background thread so that GUI code can ask
+"is anything from ``block_if_running`` alive?" without walking the process
+table on every input event.
+
+Updates are event driven when the Linux proc connector is available: only
+PIDs reported by ``PROC_EVENT_EXEC``/``PROC_EVENT_FORK`` are inspected and
+``PROC_EVENT_EXIT`` drops them. Without ``CAP_NET_ADMIN`` the index falls back
+to diffing the ``/proc`` PID list and reading only PIDs it has not seen yet,
+with a full rescan before ``max_staleness`` runs out so that a PID which
+execs long after it was first seen (``exec kodi`` from a shell) is caught.
+"""
+
+import logging
+import select
+import threading
+import time
+import typing
+from collections import Counter
+from functools import lru_cache
+
+from PySide6.QtCore import QObject, Signal  # type: ignore[import]
+
+from src.process.connector import (
+    PROC_EVENT_EXEC,
+    PROC_EVENT_EXIT,
+    PROC_EVENT_FORK,
+    ProcConnector,
+    ProcConnectorOverrun,
+    ProcEvent,
+)
+from src.process.matcher import compile_matcher
+from src.process.procfs import PROC_ROOT, list_pids, read_process
+from src.settings import get_settings
+from src.wakeup import Waker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ProcessIndex(QObject):
+    blocked_changed = Signal(bool)
+    running_changed = Signal(list)
+
+    def __init__(
+        self,
+        watch_list: list[str],
+        refresh_interval: float = 1.0,
+        max_staleness: float = 3.0,
+        proc_root: str = PROC_ROOT,
+        use_connector: bool = True,
+    ) -> None:
+        super().__init__()
+        self.watch_list: list[str] = list(watch_list)
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self.proc_root = proc_root
+        self.use_connector = use_connector
+        self.mode: str = "idle"
+        self._matcher = compile_matcher(tuple(self.watch_list))
+        self._matches: dict[int, frozenset[str]] = {}
+        self._term_counts: Counter[str] = Counter()
+        self._known: set[int] = set()
+        self._recheck: set[int] = set()
+        self._running: frozenset[str] = frozenset()
+        self._blocked = False
+        self._synced_at: float | None = None
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._waker: Waker | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running or not self.watch_list:
+            return
+        self._stop_event.clear()
+        self._waker = Waker()
+        self._thread = threading.Thread(
+            target=self._run, name="ProcessIndex", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._waker is not None:
+            self._waker.wake()
+        if self._thread is not None:
+            self._thread.join(timeout=self.refresh_interval + 1)
+            if self._thread.is_alive():
+                return  # still selecting on the waker; leave it open
+            self._thread = None
+        if self._waker is not None:
+            self._waker.close()
+            self._waker = None
+        self.mode = "idle"
+
+    def is_stale(self) -> bool:
+        """Whether the index has gone ``max_staleness`` without a full view.
+
+        A full view is a :meth:`refresh` or a live proc connector, which
+        reports every exec; incremental polls only look at new PIDs and do
+        not count.
+        """
+        if self._synced_at is None:
+            return True
+        return time.monotonic() - self._synced_at > self.max_staleness
+
+    def is_blocked(self) -> bool:
+        """Return the cached blocked state, refreshing only when stale."""
+        if not self.watch_list:
+            return False
+        if self.is_stale():
+            logger.debug("Process index stale, refreshing synchronously")
+            self.refresh()
+        return self._blocked
+
+    def running(self) -> list[str]:
+        if self.is_stale():
+            self.refresh()
+        return sorted(self._running)
+
+    def refresh(self) -> None:
+        """Full resynchronisation from the ``/proc`` PID list."""
+        with self._lock:
+            pids = list_pids(self.proc_root)
+            self._matches.clear()
+            self._term_counts.clear()
+            # PIDs caught mid-fork/exec may not be readable yet; give them
+            # the same second look as new PIDs in the next poll.
+            self._recheck = {pid for pid in pids if not self._inspect(pid)}
+            self._known = pids
+            self._touch()
+            self._publish()
+
+    def poll_once(self) -> None:
+        """Incremental ``/proc`` diff: read only PIDs not seen before.
+
+        PIDs first seen in the previous round are read once more, which
+        catches the usual fork-then-exec pattern of launchers.
+        """
+        with self._lock:
+            pids = list_pids(self.proc_root)
+            for pid in self._known - pids:
+                self._forget(pid)
+            new_pids = pids - self._known
+            for pid in new_pids | (self._recheck & pids):
+                self._inspect(pid)
+            self._recheck = {pid for pid in new_pids if pid not in self._matches}
+            self._known = pids
+            self._publish()
+
+    def handle_events(self, events: list[ProcEvent]) -> None:
+        with self._lock:
+            for what, pid, tgid, parent_tgid in events:
+                if what == PROC_EVENT_EXEC:
+                    self._inspect(tgid)
+                elif what == PROC_EVENT_EXIT:
+                    if pid == tgid:
+                        self._forget(tgid)
+                elif what == PROC_EVENT_FORK and pid == tgid:
+                    parent_terms = self._matches.get(parent_tgid)
+                    if parent_terms:
+                        self._set_match(tgid, parent_terms)
+            self._touch()
+            self._publish()
+
+    def _inspect(self, pid: int) -> bool:
+        """Update the match for *pid*; ``False`` if it could not be read."""
+        info = read_process(pid, self.proc_root)
+        if info is None:
+            self._forget(pid)
+            return False
+        terms = self._matcher.terms_for(self._matcher.match_bytes(*info))
+        if terms:
+            self._set_match(pid, frozenset(terms))
+        else:
+            self._forget(pid)
+        return True
+
+    def _set_match(self, pid: int, terms: frozenset[str]) -> None:
+        previous = self._matches.get(pid)
+        if previous == terms:
+            return
+        if previous:
+            self._term_counts.subtract(previous)
+        self._matches[pid] = terms
+        self._term_counts.update(terms)
+
+    def _forget(self, pid: int) -> None:
+        previous = self._matches.pop(pid, None)
+        if previous:
+            self._term_counts.subtract(previous)
+
+    def _publish(self) -> None:
+        running = frozenset(term for term, n in self._term_counts.items() if n > 0)
+        if running == self._running:
+            return
+        self._running = running
+        self.running_changed.emit(sorted(running))
+        blocked = bool(running)
+        if blocked != self._blocked:
+            self._blocked = blocked
+            logger.debug(f"Blocked state changed: {blocked} ({sorted(running)})")
+            self.blocked_changed.emit(blocked)
+
+    def _touch(self) -> None:
+        self._synced_at = time.monotonic()
+
+    def _run(self) -> None:
+        connector: ProcConnector | None = None
+        if self.use_connector:
+            connector = ProcConnector()
+            try:
+                connector.open()
+            except OSError as e:
+                logger.info(f"Proc connector unavailable ({e}), polling /proc")
+                connector = None
+        try:
+            self.refresh()
+            if connector is not None:
+                self.mode = "connector"
+                self._run_connector(connector)
+            else:
+                self.mode = "polling"
+                self._run_polling()
+        except Exception:
+            logger.exception("Process index stopped unexpectedly")
+        finally:
+            if connector is not None:
+                connector.close()
+
+    def _run_connector(self, connector: ProcConnector) -> None:
+        connector.set_timeout(self.refresh_interval)
+        waker = typing.cast(Waker, self._waker)
+        fds = [connector.fileno(), waker.fileno()]
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select(fds, [], [], self.refresh_interval)
+            if not readable:
+                self._touch()
+                continue
+            if fds[0] not in readable:
+                continue
+            try:
+                events = connector.read()
+            except TimeoutError:
+                self._touch()
+                continue
+            except ProcConnectorOverrun:
+                logger.warning("Proc connector overrun, resynchronising")
+                self.refresh()
+                continue
+            self.handle_events(events)
+
+    def _run_polling(self) -> None:
+        while not self._stop_event.wait(self.refresh_interval):
+            if self._rescan_due():
+                self.refresh()
+            else:
+                self.poll_once()
+
+    def _rescan_due(self) -> bool:
+        # Rescan one interval early, so queries never find the index stale.
+        if self._synced_at is None:
+            return True
+        age = time.monotonic() - self._synced_at
+        return age >= self.max_staleness - self.refresh_interval
+
+
+@lru_cache(maxsize=1)
+def get_process_index() -> ProcessIndex:
+    settings = get_settings()
+    return ProcessIndex(
+        watch_list=settings.block_if_running,
+        refresh_interval=settings.process_monitor.refresh_interval,
+        max_staleness=settings.process_monitor.max_staleness,
+        use_connector=settings.process_monitor.use_proc_connector,
+    )
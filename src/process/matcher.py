@@ -0,0 +1,138 @@
+"""Single-pass multi-pattern matching for process watch lists.
+
+A watch list is compiled once into an Aho-Corasick automaton, so a process
+name and command line are scanned a single time regardless of how many
+terms are watched. Matching keeps the semantics of the original nested
+loop: a term matches when it occurs in the name or command line, or when
+the (non-empty) name occurs in the term.
+
+Two automata are built from the same terms: one over ``str`` for psutil
+data and one over raw ``bytes`` for the ``/proc`` scanner, which matches
+without decoding. Byte matching lowercases ASCII only.
+"""
+
+import typing
+from collections import deque
+from collections.abc import Hashable, Iterable, Sequence
+from functools import lru_cache
+
+SEPARATOR = "\0"
+
+_Symbol = typing.TypeVar("_Symbol", bound=Hashable)
+_Text = typing.TypeVar("_Text", str, bytes)
+
+
+def _build_automaton(
+    patterns: Sequence[Sequence[_Symbol]],
+) -> tuple[list[dict[_Symbol, int]], list[int]]:
+    """Return the complete DFA transitions and output masks for *patterns*."""
+    goto: list[dict[_Symbol, int]] = [{}]
+    out: list[int] = [0]
+    for bit, pattern in enumerate(patterns):
+        state = 0
+        for symbol in pattern:
+            nxt = goto[state].get(symbol)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][symbol] = nxt
+                goto.append({})
+                out.append(0)
+            state = nxt
+        out[state] |= 1 << bit
+
+    # Breadth-first pass computing failure links and the full DFA, so
+    # scanning never has to follow failure chains.
+    fail = [0] * len(goto)
+    delta: list[dict[_Symbol, int]] = [dict(row) for row in goto]
+    queue: deque[int] = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        out[state] |= out[fail[state]]
+        inherited = delta[fail[state]]
+        row = delta[state]
+        for symbol, nxt in goto[state].items():
+            fail[nxt] = inherited.get(symbol, 0)
+            queue.append(nxt)
+        for symbol, nxt in inherited.items():
+            row.setdefault(symbol, nxt)
+    return delta, out
+
+
+def _substring_masks(patterns: Sequence[_Text]) -> dict[_Text, int]:
+    masks: dict[_Text, int] = {}
+    for bit, pattern in enumerate(patterns):
+        for start in range(len(pattern)):
+            for end in range(start + 1, len(pattern) + 1):
+                sub = pattern[start:end]
+                masks[sub] = masks.get(sub, 0) | 1 << bit
+    return masks
+
+
+class ProcessMatcher:
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: tuple[str, ...] = tuple(terms)
+        self.full_mask: int = (1 << len(self.terms)) - 1
+        lowered = [term.lower() for term in self.terms]
+        encoded = [term.encode() for term in lowered]
+        self._delta, self._out = _build_automaton(lowered)
+        self._delta_bytes, self._out_bytes = _build_automaton(encoded)
+        self._substrings = _substring_masks(lowered)
+        self._substrings_bytes = _substring_masks(encoded)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def scan(self, text: str) -> int:
+        """Return a bitmask of the terms occurring in lowercased *text*."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        found = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            found |= out[state]
+        return found
+
+    def scan_bytes(self, data: bytes) -> int:
+        """Byte-level :meth:`scan` for ASCII-lowercased *data*."""
+        delta = self._delta_bytes
+        out = self._out_bytes
+        state = 0
+        found = 0
+        for byte in data:
+            state = delta[state].get(byte, 0)
+            found |= out[state]
+        return found
+
+    def match(self, name: str, cmdline: str) -> int:
+        """Bitmask of terms matching one process (name and cmdline)."""
+        name = name.lower()
+        found = self.scan(f"{name}{SEPARATOR}{cmdline.lower()}")
+        if name:
+            found |= self._substrings.get(name, 0)
+        return found
+
+    def match_bytes(self, name: bytes, cmdline: bytes) -> int:
+        """:meth:`match` over raw ``comm``/``cmdline`` bytes.
+
+        NUL separators in *cmdline* are treated like the spaces psutil
+        callers join arguments with.
+        """
+        name = name.lower()
+        found = self.scan_bytes(
+            b"%s\0%s" % (name, cmdline.replace(b"\0", b" ").lower())
+        )
+        if name:
+            found |= self._substrings_bytes.get(name, 0)
+        return found
+
+    def match_terms(self, name: str, cmdline: str) -> set[str]:
+        return self.terms_for(self.match(name, cmdline))
+
+    def terms_for(self, mask: int) -> set[str]:
+        return {term for bit, term in enumerate(self.terms) if mask >> bit & 1}
+
+
+@lru_cache(maxsize=16)
+def compile_matcher(terms: tuple[str, ...]) -> ProcessMatcher:
+    return ProcessMatcher(terms)
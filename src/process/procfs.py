@@ -0,0 +1,89 @@
+"""Minimal readers for ``/proc/<pid>`` entries.
+
+Everything is returned as raw bytes; callers match with
+:meth:`ProcessMatcher.match_bytes` instead of decoding.
+"""
+
+import os
+
+PROC_ROOT = "/proc"
+READ_CHUNK = 4096
+
+
+def list_pids(root: str = PROC_ROOT) -> set[int]:
+    try:
+        return {int(name) for name in os.listdir(root) if name.isdigit()}
+    except OSError:
+        return set()
+
+
+def read_file(path: str) -> bytes:
+    """Read a small procfs file without creating a Python file object."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, READ_CHUNK)
+        if len(data) < READ_CHUNK:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, READ_CHUNK):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def read_process(pid: int | str, root: str = PROC_ROOT) -> tuple[bytes, bytes] | None:
+    """Return raw ``(comm, cmdline)`` for *pid* or ``None`` if it is gone.
+
+    ``cmdline`` keeps its NUL separators.
+    """
+    base = f"{root}/{pid}"
+    try:
+        name = read_file(f"{base}/comm").rstrip(b"\n")
+        cmdline = read_file(f"{base}/cmdline").rstrip(b"\0")
+    except OSError:
+        return None
+    return name, cmdline
+
+
+def read_process_entry(
+    pid: int | str, root: str = PROC_ROOT
+) -> tuple[int, bytes, bytes] | None:
+    """Return raw ``(ppid, comm, cmdline)`` for *pid* or ``None``.
+
+    ``comm`` comes from ``stat`` along with the parent PID, so this costs
+    the same two reads as :func:`read_process`.
+    """
+    base = f"{root}/{pid}"
+    try:
+        stat = read_file(f"{base}/stat")
+        cmdline = read_file(f"{base}/cmdline").rstrip(b"\0")
+    except OSError:
+        return None
+    parsed = parse_stat(stat)
+    if parsed is None:
+        return None
+    ppid, name = parsed
+    return ppid, name, cmdline
+
+
+def read_ppid(pid: int | str, root: str = PROC_ROOT) -> int | None:
+    """Return the parent PID from ``/proc/<pid>/stat`` or ``None``."""
+    try:
+        stat = read_file(f"{root}/{pid}/stat")
+    except OSError:
+        return None
+    parsed = parse_stat(stat)
+    return parsed[0] if parsed is not None else None
+
+
+def parse_stat(stat: bytes) -> tuple[int, bytes] | None:
+    """Return ``(ppid, comm)`` from the contents of ``/proc/<pid>/stat``."""
+    # The command name may contain spaces and parentheses; fields after the
+    # last ")" are "state ppid ...".
+    close = stat.rfind(b")")
+    fields = stat[close + 2 :].split(b" ", 2)
+    try:
+        return int(fields[1]), stat[stat.find(b"(") + 1 : close]
+    except (IndexError, ValueError):
+        return None
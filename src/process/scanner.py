@@ -0,0 +1,95 @@
+"""Process table scanners behind a common API.
+
+``ProcfsScanner`` walks ``/proc`` with :func:`os.scandir` and matches raw
+``comm``/``cmdline`` bytes, without building a psutil ``Process`` per PID.
+``PsutilScanner`` keeps the portable psutil path. The backend used by
+``check_running_processes`` and ``focus_process`` is selected with
+``process_monitor.scanner``; the background ``ProcessIndex`` always reads
+``/proc`` directly, as its incremental diff is built on per-PID reads.
+"""
+
+import logging
+import os
+from collections.abc import Iterator
+from functools import lru_cache
+
+import psutil
+
+from src.process.matcher import ProcessMatcher
+from src.process.procfs import PROC_ROOT, read_process, read_process_entry
+from src.settings import get_settings
+from src.types.protocols.process import ProcessScannerProtocol
+from src.types.schemas import ProcessScannerBackend
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PsutilScanner:
+    def iter_processes(self) -> Iterator[tuple[int, int, bytes, bytes]]:
+        for proc in psutil.process_iter(["name", "cmdline", "pid", "ppid"]):
+            try:
+                name = (proc.info.get("name") or "").encode()
+                cmdline = "\0".join(proc.info.get("cmdline") or []).encode()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            yield proc.info["pid"], proc.info.get("ppid") or 0, name, cmdline
+
+    def find(self, matcher: ProcessMatcher) -> int:
+        matched = 0
+        for proc in psutil.process_iter(["name", "cmdline"]):
+            try:
+                name = proc.info.get("name") or ""
+                cmdline = " ".join(proc.info.get("cmdline") or [])
+                matched |= matcher.match(name, cmdline)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if matched == matcher.full_mask:
+                break
+        return matched
+
+
+class ProcfsScanner:
+    def __init__(self, root: str = PROC_ROOT) -> None:
+        self.root = root
+
+    def iter_processes(self) -> Iterator[tuple[int, int, bytes, bytes]]:
+        root = self.root
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                info = read_process_entry(entry.name, root)
+                if info is not None:
+                    yield int(entry.name), *info
+
+    def find(self, matcher: ProcessMatcher) -> int:
+        matched = 0
+        match_bytes = matcher.match_bytes
+        full_mask = matcher.full_mask
+        root = self.root
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                info = read_process(entry.name, root)
+                if info is None:
+                    continue
+                matched |= match_bytes(*info)
+                if matched == full_mask:
+                    break
+        return matched
+
+
+def create_scanner(backend: ProcessScannerBackend) -> ProcessScannerProtocol:
+    if backend == ProcessScannerBackend.PSUTIL:
+        return PsutilScanner()
+    return ProcfsScanner()
+
+
+@lru_cache(maxsize=1)
+def get_scanner() -> ProcessScannerProtocol:
+    backend = get_settings().process_monitor.scanner
+    if backend == ProcessScannerBackend.PROCFS and not os.path.isdir(PROC_ROOT):
+        logger.warning("/proc not available, using psutil process scanner")
+        backend = ProcessScannerBackend.PSUTIL
+    return create_scanner(backend)
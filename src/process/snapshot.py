@@ -0,0 +1,54 @@
+"""Process table captured once per user action.
+
+One controller press may need the blocked state, the PID of the app to
+focus and (after a launch) nothing else. A :class:`ProcessSnapshot` is
+created when the action arrives, passed down the pipeline, and scans the
+process table at most once, the first time something asks for it; the
+parent PIDs for window lookup come from that same pass.
+"""
+
+from src.process.matcher import ProcessMatcher
+from src.process.scanner import get_scanner
+from src.process.tree import ProcessTree
+from src.types.protocols.process import ProcessScannerProtocol
+
+
+class ProcessSnapshot:
+    def __init__(self, scanner: ProcessScannerProtocol | None = None) -> None:
+        self._scanner = scanner
+        self._processes: list[tuple[int, int, bytes, bytes]] | None = None
+        self._tree: ProcessTree | None = None
+        self.blocked: bool | None = None
+
+    @property
+    def is_captured(self) -> bool:
+        return self._processes is not None
+
+    def processes(self) -> list[tuple[int, int, bytes, bytes]]:
+        """``(pid, ppid, comm, cmdline)`` of every process, captured once."""
+        if self._processes is None:
+            scanner = self._scanner or get_scanner()
+            self._processes = list(scanner.iter_processes())
+        return self._processes
+
+    def tree(self) -> ProcessTree:
+        """PID parent/children map built from the captured processes."""
+        if self._tree is None:
+            self._tree = ProcessTree(
+                {pid: ppid for pid, ppid, _, _ in self.processes()}
+            )
+        return self._tree
+
+    def find(self, matcher: ProcessMatcher) -> int:
+        matched = 0
+        for _, _, name, cmdline in self.processes():
+            matched |= matcher.match_bytes(name, cmdline)
+            if matched == matcher.full_mask:
+                break
+        return matched
+
+    def find_pid(self, matcher: ProcessMatcher) -> int | None:
+        for pid, _, name, cmdline in self.processes():
+            if matcher.match_bytes(name, cmdline):
+                return pid
+        return None
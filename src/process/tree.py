@@ -0,0 +1,41 @@
+"""PID to parent/children map used to find windows of wrapped commands.
+
+For ``x-terminal-emulator -e emulationstation`` the matched process is
+``emulationstation`` but the window belongs to its terminal parent, so
+window lookup walks descendants and a few ancestors of the matched PID.
+"""
+
+import os
+from collections import deque
+from collections.abc import Iterator
+
+
+class ProcessTree:
+    def __init__(self, parents: dict[int, int]) -> None:
+        self.parents = parents
+        self.children: dict[int, list[int]] = {}
+        for pid, ppid in parents.items():
+            self.children.setdefault(ppid, []).append(pid)
+
+    def ancestors(self, pid: int, limit: int = 3) -> Iterator[int]:
+        """Yield up to *limit* ancestors, stopping before init and ourselves."""
+        own_pid = os.getpid()
+        current = pid
+        for _ in range(limit):
+            parent = self.parents.get(current)
+            if parent is None or parent <= 1 or parent == own_pid:
+                return
+            yield parent
+            current = parent
+
+    def descendants(self, pid: int) -> Iterator[int]:
+        """Yield descendants breadth first (children before grandchildren)."""
+        queue: deque[int] = deque(self.children.get(pid, ()))
+        seen: set[int] = {pid}
+        while queue:
+            child = queue.popleft()
+            if child in seen:
+                continue
+            seen.add(child)
+            yield child
+            queue.extend(self.children.get(child, ()))
@@ -0,0 +1,269 @@
+"""In-process index of X11 top-level windows by PID, followed from
+``_NET_CLIENT_LIST`` changes and activated with ``_NET_ACTIVE_WINDOW``.
+
+Requires ``python-xlib`` and an X display; otherwise the index reports
+itself unavailable.
+"""
+
+import logging
+import select
+import threading
+import typing
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from Xlib import X as xconst  # type: ignore[import]
+    from Xlib import Xatom as xatom  # type: ignore[import]
+    from Xlib import display as xdisplay  # type: ignore[import]
+    from Xlib import error as xerror  # type: ignore[import]
+    from Xlib.protocol import event as xevent  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on the environment
+    # Every name stays bound; nothing below runs once ``start`` has seen
+    # ``xdisplay is None``.
+    xconst = xatom = xdisplay = xerror = xevent = typing.cast(typing.Any, None)
+
+from src.process.tree import ProcessTree
+from src.wakeup import Waker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_NET_ACTIVE_WINDOW_SOURCE_PAGER = 2
+
+
+@dataclass(frozen=True)
+class WindowInfo:
+    window_id: int
+    pid: int | None
+    wm_class: tuple[str, ...]
+
+
+class WindowIndex:
+    def __init__(self, display_name: str | None = None) -> None:
+        self.display_name = display_name
+        self._windows: dict[int, WindowInfo] = {}
+        self._by_pid: dict[int, list[int]] = {}
+        self._lock = threading.Lock()
+        self._request_lock = threading.Lock()
+        self._request_display: typing.Any = None
+        self._stop_event = threading.Event()
+        self._waker: Waker | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Connect to X and start following the client list.
+
+        Returns ``False`` when X11 access is not possible.
+        """
+        if self.is_running:
+            return True
+        if xdisplay is None:
+            logger.info("python-xlib not installed, window index disabled")
+            return False
+        try:
+            event_display = xdisplay.Display(self.display_name)
+            self._request_display = xdisplay.Display(self.display_name)
+        except Exception as e:
+            logger.info(f"X display unavailable, window index disabled: {e}")
+            return False
+        self._stop_event.clear()
+        self._waker = Waker()
+        self._thread = threading.Thread(
+            target=self._run, args=(event_display,), name="WindowIndex", daemon=True
+        )
+        self._thread.start()
+        logger.info("Window index started")
+        return True
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._waker is not None:
+            self._waker.wake()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            if self._thread.is_alive():
+                return  # still selecting on the waker; leave it open
+            self._thread = None
+        if self._waker is not None:
+            self._waker.close()
+            self._waker = None
+        with self._request_lock:
+            if self._request_display is not None:
+                self._request_display.close()
+                self._request_display = None
+
+    def windows(self) -> list[WindowInfo]:
+        with self._lock:
+            return list(self._windows.values())
+
+    def windows_for_pid(self, pid: int) -> list[int]:
+        with self._lock:
+            return list(self._by_pid.get(pid, ()))
+
+    def has_window(self, window_id: int) -> bool:
+        with self._lock:
+            return window_id in self._windows
+
+    def activate(self, window_id: int) -> bool:
+        """Ask the window manager to raise and focus *window_id*."""
+        with self._request_lock:
+            display = self._request_display
+            if display is None:
+                return False
+            try:
+                root = display.screen().root
+                window = display.create_resource_object("window", window_id)
+                message = xevent.ClientMessage(
+                    window=window,
+                    client_type=display.intern_atom("_NET_ACTIVE_WINDOW"),
+                    data=(
+                        32,
+                        [_NET_ACTIVE_WINDOW_SOURCE_PAGER, xconst.CurrentTime, 0, 0, 0],
+                    ),
+                )
+                root.send_event(
+                    message,
+                    event_mask=xconst.SubstructureRedirectMask
+                    | xconst.SubstructureNotifyMask,
+                )
+                display.flush()
+            except xerror.XError as e:
+                logger.debug(f"Failed to activate window {window_id:#x}: {e}")
+                return False
+        logger.debug(f"Activated window {window_id:#x}")
+        return True
+
+    def apply_client_list(
+        self,
+        window_ids: list[int],
+        read_window: typing.Callable[[int], WindowInfo | None],
+    ) -> None:
+        """Sync the index with a new ``_NET_CLIENT_LIST``.
+
+        Only windows not already indexed are queried through *read_window*,
+        outside the lock (they cost X round trips); the maps are swapped
+        under it. Called from the event thread only.
+        """
+        known = self._windows
+        windows: dict[int, WindowInfo] = {}
+        for window_id in window_ids:
+            info = known.get(window_id) or read_window(window_id)
+            if info is not None:
+                windows[window_id] = info
+        by_pid: dict[int, list[int]] = {}
+        for info in windows.values():
+            if info.pid is not None:
+                by_pid.setdefault(info.pid, []).append(info.window_id)
+        with self._lock:
+            self._windows = windows
+            self._by_pid = by_pid
+
+    def _run(self, display: typing.Any) -> None:
+        root = display.screen().root
+        client_list_atom = display.intern_atom("_NET_CLIENT_LIST")
+        pid_atom = display.intern_atom("_NET_WM_PID")
+
+        def read_window(window_id: int) -> WindowInfo | None:
+            window = display.create_resource_object("window", window_id)
+            try:
+                pid_prop = window.get_full_property(pid_atom, xatom.CARDINAL)
+                wm_class = window.get_wm_class() or ()
+            except xerror.XError:
+                return None
+            pid = int(pid_prop.value[0]) if pid_prop and len(pid_prop.value) else None
+            return WindowInfo(window_id, pid, tuple(wm_class))
+
+        def reload_client_list() -> None:
+            prop = root.get_full_property(client_list_atom, xconst.AnyPropertyType)
+            window_ids = [int(w) for w in prop.value] if prop else []
+            self.apply_client_list(window_ids, read_window)
+
+        try:
+            root.change_attributes(event_mask=xconst.PropertyChangeMask)
+            reload_client_list()
+            waker = typing.cast(Waker, self._waker)
+            fds = [display.fileno(), waker.fileno()]
+            while not self._stop_event.is_set():
+                if not display.pending_events():
+                    readable, _, _ = select.select(fds, [], [])
+                    if fds[0] not in readable:
+                        continue
+                event = display.next_event()
+                if (
+                    event.type == xconst.PropertyNotify
+                    and event.atom == client_list_atom
+                ):
+                    reload_client_list()
+        except Exception:
+            logger.exception("Window index stopped unexpectedly")
+        finally:
+            display.close()
+
+
+class WindowResolver:
+    """Map a matched PID to the window that actually represents the app.
+
+    Resolved windows are remembered per app entry; while the window stays
+    in the client list, later focus requests for that entry skip the
+    process search entirely.
+    """
+
+    def __init__(self, window_index: WindowIndex, max_ancestors: int = 3) -> None:
+        self.window_index = window_index
+        self.max_ancestors = max_ancestors
+        self._remembered: dict[str, int] = {}
+
+    def remembered(self, key: str) -> int | None:
+        window_id = self._remembered.get(key)
+        if window_id is None:
+            return None
+        if not self.window_index.has_window(window_id):
+            del self._remembered[key]
+            return None
+        return window_id
+
+    def forget(self, key: str) -> None:
+        self._remembered.pop(key, None)
+
+    def resolve(
+        self,
+        pid: int,
+        tree: typing.Callable[[], ProcessTree],
+        key: str | None = None,
+    ) -> int | None:
+        """Return a window for *pid*, its descendants or its ancestors.
+
+        *tree* is only called when *pid* itself owns no window.
+        """
+        window_id = self._first_window([pid])
+        if window_id is None:
+            process_tree = tree()
+            window_id = self._first_window(process_tree.descendants(pid))
+            if window_id is None:
+                window_id = self._first_window(
+                    process_tree.ancestors(pid, self.max_ancestors)
+                )
+        if window_id is not None and key is not None:
+            self._remembered[key] = window_id
+        return window_id
+
+    def _first_window(self, pids: typing.Iterable[int]) -> int | None:
+        for candidate in pids:
+            window_ids = self.window_index.windows_for_pid(candidate)
+            if window_ids:
+                return window_ids[0]
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_window_index() -> WindowIndex:
+    return WindowIndex()
+
+
+@lru_cache(maxsize=1)
+def get_window_resolver() -> WindowResolver:
+    return WindowResolver(get_window_index())
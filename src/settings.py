@@ -16,8 +16,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from src.default_settings import (
     DEFAULT_APPS,
     DEFAULT_BLOCK_IF_RUNNING,
+    DEFAULT_INPUT,
     DEFAULT_MAPPINGS,
     DEFAULT_MENU,
+    DEFAULT_PROCESS_MONITOR,
     DEFAULT_TRAY,
     DEFAULT_WINDOW,
 )
@@ -25,7 +27,9 @@ from src.types.schemas import (
     AppsModel,
     DeviceMappingsModel,
     IconsModel,
+    InputModel,
     MenuModel,
+    ProcessMonitorModel,
     WindowModel,
 )
 
@@ -107,6 +111,8 @@ class Settings(BaseSettings):
             block_if_running=json_data.get(
                 "block_if_running", DEFAULT_BLOCK_IF_RUNNING
             ),
+            process_monitor=json_data.get("process_monitor", DEFAULT_PROCESS_MONITOR),
+            input=json_data.get("input", DEFAULT_INPUT),
         )
 
     app_name: str = "App Launcher"
@@ -116,6 +122,8 @@ class Settings(BaseSettings):
     tray: IconsModel = Field(default=DEFAULT_TRAY)
     window: WindowModel = Field(default=DEFAULT_WINDOW)
     block_if_running: list[str] = Field(default=DEFAULT_BLOCK_IF_RUNNING)
+    process_monitor: ProcessMonitorModel = Field(default=DEFAULT_PROCESS_MONITOR)
+    input: InputModel = Field(default=DEFAULT_INPUT)
     icons_directory: pathlib.Path | str | None = Field(default=None)
 
     @field_validator("icons_directory", mode="before")
@@ -8,12 +8,16 @@ from .protocols import (
     InputEventProtocol,
     KeyEventProtocol,
     ProcessRunnerProtocol,
+    ProcessScannerProtocol,
 )
 from .schemas import (
     AppsModel,
     DeviceMappingsModel,
     IconsModel,
+    InputModel,
     MenuModel,
+    ProcessMonitorModel,
+    ProcessScannerBackend,
     WindowMode,
     WindowModel,
 )
@@ -28,11 +32,16 @@ __all__ = [
     "CommandValidatorProtocol",
     "ProcessRunnerProtocol",
     "EnvironmentCleanerProtocol",
+    # Protocols - Process
+    "ProcessScannerProtocol",
     # Schemas
     "AppsModel",
     "DeviceMappingsModel",
     "IconsModel",
+    "InputModel",
     "MenuModel",
+    "ProcessMonitorModel",
+    "ProcessScannerBackend",
     "WindowModel",
     "WindowMode",
 ]
@@ -11,6 +11,7 @@ from .device import (
     InputEventProtocol,
     KeyEventProtocol,
 )
+from .process import ProcessScannerProtocol
 
 __all__ = [
     "InputEventProtocol",
@@ -20,4 +21,5 @@ __all__ = [
     "CommandValidatorProtocol",
     "ProcessRunnerProtocol",
     "EnvironmentCleanerProtocol",
+    "ProcessScannerProtocol",
 ]
@@ -13,15 +13,17 @@ class InputEventProtocol(typing.Protocol):
     def code(self) -> int: ...
     @property
     def value(self) -> int: ...
-
-    keystate: int
-    scancode: int
+    @property
+    def sec(self) -> int: ...
+    @property
+    def usec(self) -> int: ...
 
 
 class KeyEventProtocol(InputEventProtocol):
     """Protocol for keyboard key events."""
 
-    pass
+    keystate: int
+    scancode: int
 
 
 class InputDeviceEvDevProtocol(typing.Protocol):
@@ -31,8 +33,18 @@ class InputDeviceEvDevProtocol(typing.Protocol):
     def name(self) -> str: ...
     @property
     def path(self) -> str: ...
-
-    def read_loop(self) -> Iterator[InputEventProtocol]: ...
+    @property
+    def fd(self) -> int: ...
+    @property
+    def info(self) -> typing.Any: ...
+
+    def read(self) -> Iterator[InputEventProtocol]: ...
+    def close(self) -> None: ...
+    def capabilities(
+        self, verbose: bool = False, absinfo: bool = True
+    ) -> dict[typing.Any, typing.Any]: ...
+    def input_props(self, verbose: bool = False) -> list[typing.Any]: ...
+    def absinfo(self, axis_num: int) -> typing.Any: ...
 
 
 class InputDevicePyDevProtocol(typing.Protocol):
@@ -0,0 +1,14 @@
+"""Protocols for process table scanning."""
+
+import typing
+from collections.abc import Iterator
+
+if typing.TYPE_CHECKING:
+    from src.process.matcher import ProcessMatcher
+
+
+class ProcessScannerProtocol(typing.Protocol):
+    """Protocol for process table scanners (procfs, psutil)."""
+
+    def iter_processes(self) -> Iterator[tuple[int, int, bytes, bytes]]: ...
+    def find(self, matcher: "ProcessMatcher") -> int: ...
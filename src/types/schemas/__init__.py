@@ -4,7 +4,10 @@ from .settings import (
     AppsModel,
     DeviceMappingsModel,
     IconsModel,
+    InputModel,
     MenuModel,
+    ProcessMonitorModel,
+    ProcessScannerBackend,
     WindowMode,
     WindowModel,
 )
@@ -13,7 +16,10 @@ __all__ = [
     "AppsModel",
     "DeviceMappingsModel",
     "IconsModel",
+    "InputModel",
     "MenuModel",
+    "ProcessMonitorModel",
+    "ProcessScannerBackend",
     "WindowModel",
     "WindowMode",
 ]
@@ -13,6 +13,13 @@ class WindowMode(str, Enum):
     FULLSCREEN = "fullscreen"
 
 
+class ProcessScannerBackend(str, Enum):
+    """Process table scanner implementations."""
+
+    PROCFS = "procfs"
+    PSUTIL = "psutil"
+
+
 class AppsModel(BaseModel):
     """Application entry configuration."""
 
@@ -51,3 +58,33 @@ class MenuModel(BaseModel):
 
     hide: str
     settings: str
+
+
+class ProcessMonitorModel(BaseModel):
+    """Background process index configuration (seconds)."""
+
+    refresh_interval: float = 1.0
+    max_staleness: float = 3.0
+    use_proc_connector: bool = True
+    # Used by one-shot lookups and snapshots; the index always reads /proc.
+    scanner: ProcessScannerBackend = ProcessScannerBackend.PROCFS
+
+
+class InputModel(BaseModel):
+    """Input layer tuning.
+
+    Stick values are fractions of full deflection, repeat values seconds.
+    """
+
+    stick_navigation: bool = True
+    stick_deadzone: float = 0.5
+    stick_hysteresis: float = 0.15
+    repeat_navigation: bool = True
+    repeat_delay: float = 0.4
+    repeat_interval: float = 0.15
+    repeat_min_interval: float = 0.05
+    repeat_acceleration: float = 0.85
+    queue_size: int = 32
+    repeat_latency_budget: float = 0.15
+    latency_tracing: bool = False
+    hotplug_debounce: float = 0.25
@@ -1,33 +1,31 @@
 import logging
 import shlex
 import subprocess
+from collections.abc import Callable, Iterator
 
-import psutil
+from src.process.matcher import compile_matcher
+from src.process.scanner import get_scanner
+from src.process.snapshot import ProcessSnapshot
+from src.process.tree import ProcessTree
+from src.process.windows import get_window_index, get_window_resolver
+from src.types.protocols.process import ProcessScannerProtocol
 
 logger = logging.getLogger(__name__)
 
 
-def check_running_processes(search_process: list[str]) -> list[str]:
+def check_running_processes(
+    search_process: list[str],
+    scanner: ProcessScannerProtocol | None = None,
+) -> list[str]:
     if not search_process:
         return []
 
-    search_lower = [p.lower() for p in search_process]
-    matched: set[str] = set()
+    matcher = compile_matcher(tuple(search_process))
+    matched = (scanner or get_scanner()).find(matcher)
+    return list(matcher.terms_for(matched))
 
-    for proc in psutil.process_iter(["name", "cmdline"]):
-        try:
-            name = (proc.info.get("name") or "").lower()
-            cmdline = " ".join(proc.info.get("cmdline") or []).lower()
-            for term_lower, term_orig in zip(search_lower, search_process, strict=True):
-                if term_lower in name or name in term_lower or term_lower in cmdline:
-                    matched.add(term_orig)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
 
-    return list(matched)
-
-
-def _extract_process_name(cmd: list[str] | str) -> str:
+def extract_process_name(cmd: list[str] | str) -> str:
     """Extract the likely target process name from a launcher command.
 
     For wrapped commands (e.g. ``x-terminal-emulator -e emulationstation``)
@@ -42,49 +40,94 @@ def _extract_process_name(cmd: list[str] | str) -> str:
     return parts[0].rsplit("/", 1)[-1]
 
 
-def _focus_process(search: str) -> bool:
+def focus_process(
+    search: str,
+    scanner: ProcessScannerProtocol | None = None,
+    snapshot: ProcessSnapshot | None = None,
+    app_key: str | None = None,
+) -> bool:
     """Find a running process matching *search* and bring its window to front.
 
+    When *snapshot* is given the PID is looked up in it instead of scanning
+    the process table again. With *app_key* the resolved window is
+    remembered, and a remembered window that still exists is activated
+    without any process lookup.
+
     Returns ``True`` if the process was found (even if focusing failed),
     ``False`` if no matching process exists.
     """
-    search_lower = search.lower()
-    pid: int | None = None
-
-    for proc in psutil.process_iter(["name", "cmdline", "pid"]):
-        try:
-            name = (proc.info.get("name") or "").lower()
-            cmdline = " ".join(proc.info.get("cmdline") or []).lower()
-            if search_lower in name or name in search_lower or search_lower in cmdline:
-                pid = proc.info["pid"]
-                break
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    window_index = get_window_index()
+    resolver = get_window_resolver()
+    if app_key is not None and window_index.is_running:
+        window_id = resolver.remembered(app_key)
+        if window_id is not None and window_index.activate(window_id):
+            return True
+
+    matcher = compile_matcher((search,))
+    if snapshot is None:
+        snapshot = ProcessSnapshot(scanner)
+    pid = snapshot.find_pid(matcher)
 
     if pid is None:
+        if app_key is not None:
+            resolver.forget(app_key)
         return False
 
+    if window_index.is_running:
+        window_id = resolver.resolve(pid, snapshot.tree, key=app_key)
+        if window_id is not None:
+            window_index.activate(window_id)
+        else:
+            logger.debug(f"No window found for PID {pid} or its relatives ({search})")
+        return True
+
+    if not _activate_with_tools(pid, snapshot.tree):
+        logger.debug(f"No window found for PID {pid} or its relatives ({search})")
+    return True
+
+
+def _window_candidates(
+    pid: int, tree: Callable[[], ProcessTree], max_ancestors: int = 3
+) -> Iterator[int]:
+    """*pid*, then its descendants, then a few ancestors (as the resolver)."""
+    yield pid
+    process_tree = tree()
+    yield from process_tree.descendants(pid)
+    yield from process_tree.ancestors(pid, max_ancestors)
+
+
+def _activate_with_tools(pid: int, tree: Callable[[], ProcessTree]) -> bool:
+    """Activate the first window of *pid* or a relative via xdotool/wmctrl."""
     try:
-        subprocess.run(
-            ["xdotool", "search", "--pid", str(pid), "windowactivate"],
-            capture_output=True,
-            timeout=2,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        try:
+        for candidate in _window_candidates(pid, tree):
             result = subprocess.run(
-                ["wmctrl", "-l", "-p"], capture_output=True, text=True, timeout=2
+                ["xdotool", "search", "--pid", str(candidate), "windowactivate"],
+                capture_output=True,
+                timeout=2,
             )
-            for line in result.stdout.splitlines():
-                parts = line.split(None, 2)
-                if len(parts) >= 2 and parts[1] == str(pid):
-                    subprocess.run(
-                        ["wmctrl", "-i", "-a", parts[0]],
-                        capture_output=True,
-                        timeout=2,
-                    )
-                    break
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-            pass
+            if result.returncode == 0:
+                return True
+        return False
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
 
-    return True
+    try:
+        result = subprocess.run(
+            ["wmctrl", "-l", "-p"], capture_output=True, text=True, timeout=2
+        )
+        # "<window id> <desktop> <pid> <host> <title>"
+        windows: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split(None, 3)
+            if len(parts) >= 3:
+                windows.setdefault(parts[2], parts[0])
+        for candidate in _window_candidates(pid, tree):
+            window_id = windows.get(str(candidate))
+            if window_id is not None:
+                subprocess.run(
+                    ["wmctrl", "-i", "-a", window_id], capture_output=True, timeout=2
+                )
+                return True
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        pass
+    return False
@@ -0,0 +1,37 @@
+"""Wake a thread blocked in ``select``/``poll``/``epoll``.
+
+Background loops wait on their fds plus a :class:`Waker`, so ``stop()``
+interrupts the wait at once rather than after its timeout, keeping quit
+within :data:`SHUTDOWN_BUDGET`. The GUI thread watches one with a
+``QSocketNotifier`` to learn that input actions are queued.
+"""
+
+import os
+
+# Target for the whole quit sequence (all background threads joined).
+SHUTDOWN_BUDGET = 0.05
+
+
+class Waker:
+    """An ``eventfd`` that becomes readable when :meth:`wake` is called."""
+
+    def __init__(self) -> None:
+        self._fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def wake(self) -> None:
+        if self._fd >= 0:
+            os.eventfd_write(self._fd, 1)
+
+    def clear(self) -> None:
+        try:
+            os.eventfd_read(self._fd)
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
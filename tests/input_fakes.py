@@ -0,0 +1,104 @@
+"""Fake evdev devices backed by a pipe, so ``epoll`` sees real fds."""
+
+import os
+
+from evdev import ecodes
+from evdev.device import AbsInfo, DeviceInfo
+from evdev.events import InputEvent
+
+
+def key(code: int, value: int = 1, sec: int = 0, usec: int = 0) -> InputEvent:
+    return InputEvent(sec, usec, ecodes.EV_KEY, code, value)
+
+
+def absolute(code: int, value: int, sec: int = 0, usec: int = 0) -> InputEvent:
+    return InputEvent(sec, usec, ecodes.EV_ABS, code, value)
+
+
+def syn(sec: int = 0, usec: int = 0) -> InputEvent:
+    return InputEvent(sec, usec, ecodes.EV_SYN, ecodes.SYN_REPORT, 0)
+
+
+class FakeInputDevice:
+    def __init__(
+        self,
+        name: str = "Microsoft X-Box 360 pad",
+        path: str = "",
+        keys: list[int] | None = None,
+        axes: list[int] | None = None,
+        props: list[int] | None = None,
+        vendor: int = 0x045E,
+        product: int = 0x028E,
+    ) -> None:
+        self.name = name
+        self.info = DeviceInfo(0x03, vendor, product, 0x0110)
+        self.keys = keys if keys is not None else [ecodes.BTN_A, ecodes.BTN_MODE]
+        self.axes = axes if axes is not None else [ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y]
+        self.props = props or []
+        self.path = path or f"/dev/input/event-fake-{id(self)}"
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._pending: list[InputEvent] = []
+        self.closed = False
+        self.disconnected = False
+
+    @property
+    def fd(self) -> int:
+        return self._read_fd
+
+    def push(self, *events: InputEvent) -> None:
+        self._pending.extend(events)
+        os.write(self._write_fd, b"x")
+
+    def disconnect(self) -> None:
+        self.disconnected = True
+        os.write(self._write_fd, b"x")
+
+    def read(self):
+        try:
+            os.read(self._read_fd, 4096)
+        except BlockingIOError:
+            pass
+        if self.disconnected:
+            raise OSError(19, "No such device")
+        if not self._pending:
+            raise BlockingIOError
+        events, self._pending = self._pending, []
+        return iter(events)
+
+    def capabilities(self, verbose: bool = False, absinfo: bool = True):
+        capabilities = {ecodes.EV_SYN: [0]}
+        if self.keys:
+            capabilities[ecodes.EV_KEY] = list(self.keys)
+        if self.axes:
+            capabilities[ecodes.EV_ABS] = list(self.axes)
+        return capabilities
+
+    def absinfo(self, axis_num: int) -> AbsInfo:
+        if axis_num in (ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y):
+            return AbsInfo(0, -1, 1, 0, 0, 0)
+        return AbsInfo(0, -32768, 32767, 16, 128, 0)
+
+    def input_props(self, verbose: bool = False):
+        return list(self.props)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+
+
+class RecordingSink:
+    """Action sink that keeps every batch the worker puts."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def put(
+        self,
+        actions: list[str],
+        repeat: bool = False,
+        timestamp: float | None = None,
+    ) -> None:
+        self.batches.append(list(actions))
@@ -0,0 +1,33 @@
+"""Synthetic ``/proc`` trees for process scanning tests."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class ProcTreeTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.proc_root = tempfile.mkdtemp(prefix="proc-")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.proc_root, ignore_errors=True)
+
+    def add_process(
+        self,
+        pid: int,
+        name: str,
+        cmdline: list[str] | None = None,
+        ppid: int = 1,
+    ):
+        entry = Path(self.proc_root, str(pid))
+        entry.mkdir(exist_ok=True)
+        entry.joinpath("comm").write_bytes(name.encode() + b"\n")
+        args = cmdline if cmdline is not None else [name]
+        entry.joinpath("cmdline").write_bytes(b"\0".join(a.encode() for a in args))
+        entry.joinpath("stat").write_bytes(
+            f"{pid} ({name}) S {ppid} {pid} {pid} 0 -1 4194560 0 0\n".encode()
+        )
+
+    def remove_process(self, pid: int) -> None:
+        shutil.rmtree(Path(self.proc_root, str(pid)))
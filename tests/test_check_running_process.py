@@ -1,7 +1,14 @@
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from src.utils import _extract_process_name, check_running_processes
+from proc_tree import ProcTreeTestCase
+
+from src.gui.action_manager import ActionManager
+from src.process.matcher import compile_matcher
+from src.process.scanner import ProcfsScanner, PsutilScanner
+from src.process.snapshot import ProcessSnapshot
+from src.utils import check_running_processes, extract_process_name, focus_process
 
 
 class TestCheckRunningProcess(unittest.TestCase):
@@ -10,7 +17,7 @@ class TestCheckRunningProcess(unittest.TestCase):
         proc.info = {"name": name, "cmdline": cmdline or [name]}
         return proc
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_returns_matching_processes(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("kodi"),
@@ -18,39 +25,47 @@ class TestCheckRunningProcess(unittest.TestCase):
             self._make_process("python"),
         ]
         result = list(
-            check_running_processes(search_process=["kodi", "emulationstation"])
+            check_running_processes(
+                search_process=["kodi", "emulationstation"], scanner=PsutilScanner()
+            )
         )
         self.assertCountEqual(result, ["kodi", "emulationstation"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_returns_empty_when_none_match(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("firefox"),
             self._make_process("python"),
         ]
-        result = list(check_running_processes(search_process=["kodi"]))
+        result = list(
+            check_running_processes(search_process=["kodi"], scanner=PsutilScanner())
+        )
         self.assertEqual(result, [])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_case_insensitive_process_name(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("Kodi"),
             self._make_process("EMULATIONSTATION"),
         ]
         result = list(
-            check_running_processes(search_process=["kodi", "emulationstation"])
+            check_running_processes(
+                search_process=["kodi", "emulationstation"], scanner=PsutilScanner()
+            )
         )
         self.assertCountEqual(result, ["kodi", "emulationstation"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_case_insensitive_search(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("kodi"),
         ]
-        result = list(check_running_processes(search_process=["Kodi"]))
+        result = list(
+            check_running_processes(search_process=["Kodi"], scanner=PsutilScanner())
+        )
         self.assertEqual(result, ["Kodi"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_matches_via_cmdline_wrapper(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process(
@@ -58,54 +73,198 @@ class TestCheckRunningProcess(unittest.TestCase):
                 cmdline=["x-terminal-emulator", "-e", "emulationstation"],
             ),
         ]
-        result = check_running_processes(search_process=["emulationstation"])
+        result = check_running_processes(
+            search_process=["emulationstation"], scanner=PsutilScanner()
+        )
         self.assertEqual(result, ["emulationstation"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_matches_substring_in_cmdline(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("moonlight-qt", cmdline=["moonlight-qt"]),
         ]
-        result = check_running_processes(search_process=["moonlight"])
+        result = check_running_processes(
+            search_process=["moonlight"], scanner=PsutilScanner()
+        )
         self.assertEqual(result, ["moonlight"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_deduplicates_matches(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("kodi", cmdline=["kodi"]),
             self._make_process("firefox", cmdline=["kodi-wayland"]),
         ]
-        result = check_running_processes(search_process=["kodi"])
+        result = check_running_processes(
+            search_process=["kodi"], scanner=PsutilScanner()
+        )
         self.assertEqual(result, ["kodi"])
 
-    @patch("src.utils.psutil.process_iter")
+    @patch("src.process.scanner.psutil.process_iter")
     def test_no_match_when_term_absent(self, mock_process_iter):
         mock_process_iter.return_value = [
             self._make_process("firefox", cmdline=["firefox", "https://x.com"]),
         ]
-        result = check_running_processes(search_process=["kodi", "emulationstation"])
+        result = check_running_processes(
+            search_process=["kodi", "emulationstation"], scanner=PsutilScanner()
+        )
         self.assertEqual(result, [])
 
 
+class TestProcfsScanner(ProcTreeTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.scanner = ProcfsScanner(root=self.proc_root)
+
+    def test_returns_matching_processes(self):
+        self.add_process(1, "kodi")
+        self.add_process(2, "emulationstatio", ["/usr/bin/emulationstation"])
+        self.add_process(3, "python")
+        result = check_running_processes(
+            search_process=["kodi", "emulationstation", "retroarch"],
+            scanner=self.scanner,
+        )
+        self.assertCountEqual(result, ["kodi", "emulationstation"])
+
+    def test_case_insensitive_bytes(self):
+        self.add_process(1, "Kodi")
+        result = check_running_processes(search_process=["KODI"], scanner=self.scanner)
+        self.assertEqual(result, ["KODI"])
+
+    def test_matches_cmdline_across_arguments(self):
+        self.add_process(
+            1, "moonlight-qt", ["/usr/bin/moonlight-qt", "stream", "nitro"]
+        )
+        result = check_running_processes(
+            search_process=["moonlight-qt stream"], scanner=self.scanner
+        )
+        self.assertEqual(result, ["moonlight-qt stream"])
+
+    def test_skips_non_pid_entries_and_vanished_processes(self):
+        self.add_process(1, "kodi")
+        Path(self.proc_root, "self").mkdir()
+        Path(self.proc_root, "2").mkdir()
+        result = check_running_processes(search_process=["kodi"], scanner=self.scanner)
+        self.assertEqual(result, ["kodi"])
+
+
+class TestProcessSnapshot(ProcTreeTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.scanner = ProcfsScanner(root=self.proc_root)
+        self.scanner.iter_processes = MagicMock(  # type: ignore[method-assign]
+            side_effect=self.scanner.iter_processes
+        )
+
+    def test_scans_once_per_snapshot(self):
+        self.add_process(5, "x-terminal-emul", ["x-terminal-emulator", "-e", "kodi"])
+        snapshot = ProcessSnapshot(scanner=self.scanner)
+
+        self.assertFalse(snapshot.is_captured)
+        self.assertTrue(snapshot.find(compile_matcher(("kodi", "pegasus"))))
+        self.assertEqual(snapshot.find_pid(compile_matcher(("kodi",))), 5)
+        self.assertIsNone(snapshot.find_pid(compile_matcher(("pegasus",))))
+        self.scanner.iter_processes.assert_called_once()
+
+    def test_tree_comes_from_the_same_scan(self):
+        self.add_process(5, "x-terminal-emul")
+        self.add_process(6, "kodi", ppid=5)
+        snapshot = ProcessSnapshot(scanner=self.scanner)
+
+        self.assertEqual(snapshot.find_pid(compile_matcher(("kodi",))), 6)
+        self.assertEqual(list(snapshot.tree().ancestors(6)), [5])
+        self.scanner.iter_processes.assert_called_once()
+
+    @patch("src.utils.subprocess.run")
+    def test_focus_process_uses_snapshot(self, mock_run):
+        self.add_process(5, "kodi")
+        snapshot = ProcessSnapshot(scanner=self.scanner)
+        snapshot.processes()
+
+        self.assertTrue(focus_process("kodi", snapshot=snapshot))
+        self.assertFalse(focus_process("pegasus", snapshot=snapshot))
+        self.scanner.iter_processes.assert_called_once()
+        self.assertIn("5", mock_run.call_args.args[0])
+
+    @patch("src.gui.action_manager.get_process_index")
+    def test_blocked_state_is_memoized(self, mock_get_index):
+        mock_get_index.return_value.is_stale.return_value = False
+        mock_get_index.return_value.is_blocked.return_value = False
+        snapshot = ProcessSnapshot(scanner=self.scanner)
+
+        self.assertFalse(ActionManager.is_blocked(snapshot))
+        self.assertFalse(ActionManager.is_blocked(snapshot))
+        mock_get_index.return_value.is_blocked.assert_called_once()
+        self.scanner.iter_processes.assert_not_called()
+
+    @patch("src.gui.action_manager.get_process_index")
+    def test_stale_index_answers_from_snapshot(self, mock_get_index):
+        mock_get_index.return_value.is_stale.return_value = True
+        mock_get_index.return_value.watch_list = ["kodi"]
+        self.add_process(5, "kodi")
+        snapshot = ProcessSnapshot(scanner=self.scanner)
+
+        self.assertTrue(ActionManager.is_blocked(snapshot))
+        self.assertEqual(snapshot.find_pid(compile_matcher(("kodi",))), 5)
+        mock_get_index.return_value.is_blocked.assert_not_called()
+        self.scanner.iter_processes.assert_called_once()
+
+
+class TestFocusFallback(ProcTreeTestCase):
+    """Focusing through xdotool/wmctrl when the X window index is not running."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # 100 terminal -> 101 sh -> 102 emulationstation, window on 100.
+        self.add_process(100, "x-terminal-emul", ppid=50)
+        self.add_process(101, "sh", ppid=100)
+        self.add_process(102, "emulationstatio", ppid=101)
+        self.snapshot = ProcessSnapshot(ProcfsScanner(root=self.proc_root))
+
+    @patch("src.utils.subprocess.run")
+    def test_xdotool_tries_relatives_until_a_window_is_found(self, mock_run):
+        def run(args, **kwargs):
+            return MagicMock(returncode=0 if args[3] == "100" else 1)
+
+        mock_run.side_effect = run
+
+        self.assertTrue(focus_process("emulationstatio", snapshot=self.snapshot))
+        tried = [call.args[0][3] for call in mock_run.call_args_list]
+        self.assertEqual(tried, ["102", "101", "100"])
+
+    @patch("src.utils.subprocess.run")
+    def test_wmctrl_matches_relatives(self, mock_run):
+        def run(args, **kwargs):
+            if args[0] == "xdotool":
+                raise FileNotFoundError
+            return MagicMock(stdout="0x01 0 100 host Terminal\n0x02 0 7 host Other\n")
+
+        mock_run.side_effect = run
+
+        self.assertTrue(focus_process("emulationstatio", snapshot=self.snapshot))
+        mock_run.assert_called_with(
+            ["wmctrl", "-i", "-a", "0x01"], capture_output=True, timeout=2
+        )
+
+
 class TestExtractProcessName(unittest.TestCase):
     def test_wrapper_with_e_flag(self):
         cmd = ["x-terminal-emulator", "-e", "emulationstation"]
-        self.assertEqual(_extract_process_name(cmd), "emulationstation")
+        self.assertEqual(extract_process_name(cmd), "emulationstation")
 
     def test_plain_executable_string(self):
         self.assertEqual(
-            _extract_process_name("/usr/bin/moonlight-qt stream nitro app 'Pegasus'"),
+            extract_process_name("/usr/bin/moonlight-qt stream nitro app 'Pegasus'"),
             "moonlight-qt",
         )
 
     def test_plain_executable_list(self):
         self.assertEqual(
-            _extract_process_name(["/usr/bin/firefox", "https://x.com"]),
+            extract_process_name(["/usr/bin/firefox", "https://x.com"]),
             "firefox",
         )
 
     def test_simple_string(self):
-        self.assertEqual(_extract_process_name("subl"), "subl")
+        self.assertEqual(extract_process_name("subl"), "subl")
 
 
 if __name__ == "__main__":
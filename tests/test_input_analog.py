@@ -0,0 +1,142 @@
+import random
+import unittest
+
+from evdev import ecodes
+from input_fakes import FakeInputDevice, RecordingSink, absolute, syn
+
+from src.input import Action, DeviceEventWorker
+from src.input.analog import SWITCH_INTERVAL, AxisRange, StickNavigator
+
+XBOX = "Microsoft X-Box 360 pad"
+FULL = 32767
+
+
+class TestStickNavigator(unittest.TestCase):
+    def setUp(self) -> None:
+        axis = AxisRange.from_absinfo(-32768, 32767)
+        self.stick = StickNavigator(axis, axis, deadzone=0.5, hysteresis=0.15)
+        self.axis = axis
+        self.now = 0.0
+
+    def move(self, x: float, y: float, dt: float = 1.0) -> str | None:
+        self.now += dt
+        self.stick.set_x(int(x * FULL))
+        self.stick.set_y(int(y * FULL))
+        return self.stick.update(self.now)
+
+    def test_deadzone(self):
+        self.assertIsNone(self.move(0.3, 0.2))
+        self.assertEqual(self.move(0.6, 0.1), Action.RIGHT)
+
+    def test_fires_once_per_deflection(self):
+        self.assertEqual(self.move(0.0, -0.9), Action.UP)
+        self.assertIsNone(self.move(0.1, -1.0))
+        self.assertIsNone(self.move(0.0, 0.0))
+        self.assertEqual(self.move(0.0, -0.9), Action.UP)
+
+    def test_hysteresis(self):
+        self.assertEqual(self.move(0.55, 0.0), Action.RIGHT)
+        # Below the deadzone but above the release threshold: still held.
+        self.assertIsNone(self.move(0.45, 0.0))
+        self.assertIsNone(self.move(0.55, 0.0))
+        self.assertIsNone(self.move(0.3, 0.0))
+        self.assertEqual(self.move(0.55, 0.0), Action.RIGHT)
+
+    def test_switching_direction_needs_clear_push(self):
+        self.assertEqual(self.move(0.8, 0.0), Action.RIGHT)
+        self.assertIsNone(self.move(0.4, 0.45))
+        self.assertEqual(self.move(0.2, 0.8), Action.DOWN)
+
+    def test_noisy_diagonal_does_not_chatter(self):
+        noise = random.Random(7)
+        actions = []
+        # One second at 250 Hz resting on the up-right diagonal.
+        for _ in range(250):
+            self.stick.set_x(23000 + noise.randint(-40, 40))
+            self.stick.set_y(-23000 + noise.randint(-40, 40))
+            self.now += 0.004
+            action = self.stick.update(self.now)
+            if action is not None:
+                actions.append(action)
+
+        # Whichever neighbour wins the first frame is held for the second.
+        self.assertEqual(len(actions), 1)
+        self.assertIn(actions[0], (Action.RIGHT, Action.UP))
+
+    def test_switches_are_rate_limited(self):
+        self.assertEqual(self.move(0.9, 0.0), Action.RIGHT)
+        self.assertIsNone(self.move(0.0, 0.9, dt=SWITCH_INTERVAL / 2))
+        self.assertEqual(self.move(0.0, 0.9, dt=SWITCH_INTERVAL), Action.DOWN)
+        self.assertIsNone(self.move(-0.9, 0.0, dt=0.004))
+
+    def test_normalize_clamps(self):
+        axis = AxisRange.from_absinfo(0, 255)
+        self.assertEqual(axis.normalize(0), -1.0)
+        self.assertEqual(axis.normalize(300), 1.0)
+
+
+class TestWorkerSticks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sink = RecordingSink()
+        self.batches = self.sink.batches
+        self.device = FakeInputDevice(
+            XBOX,
+            axes=[
+                ecodes.ABS_X,
+                ecodes.ABS_Y,
+                ecodes.ABS_RX,
+                ecodes.ABS_RY,
+                ecodes.ABS_HAT0X,
+                ecodes.ABS_HAT0Y,
+            ],
+        )
+        self.worker = DeviceEventWorker(self.device, XBOX, self.sink)
+
+    def tearDown(self) -> None:
+        self.device.close()
+
+    def test_stream_emits_discrete_moves(self):
+        events = []
+        # A 250 Hz sweep to the right and back, then a flick of the right
+        # stick down.
+        for step in list(range(0, 33)) + list(range(32, -1, -1)):
+            events += [absolute(ecodes.ABS_X, step * 1000), syn()]
+        events += [absolute(ecodes.ABS_RY, 30000), syn()]
+
+        self.worker.handle_events(events)
+
+        self.assertEqual(self.batches, [[Action.RIGHT], [Action.DOWN]])
+
+    def test_noisy_diagonal_stream(self):
+        noise = random.Random(3)
+        events = []
+        for frame in range(250):
+            usec = frame * 4000
+            events += [
+                absolute(ecodes.ABS_X, 23000 + noise.randint(-40, 40)),
+                absolute(ecodes.ABS_Y, -23000 + noise.randint(-40, 40)),
+                syn(usec // 1_000_000, usec % 1_000_000),
+            ]
+
+        self.worker.handle_events(events)
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertIn(self.batches[0], ([Action.RIGHT], [Action.UP]))
+
+    def test_sticks_disabled(self):
+        from src.input import worker as worker_module
+
+        settings = worker_module.settings
+        original = settings.input.stick_navigation
+        settings.input.stick_navigation = False
+        try:
+            worker = DeviceEventWorker(self.device, XBOX, self.sink)
+        finally:
+            settings.input.stick_navigation = original
+        worker.handle_events([absolute(ecodes.ABS_X, FULL), syn()])
+
+        self.assertEqual(self.batches, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
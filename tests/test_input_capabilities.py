@@ -0,0 +1,52 @@
+import unittest
+
+from evdev import ecodes
+from input_fakes import FakeInputDevice
+
+from src.input import has_navigation_capabilities
+from src.types.schemas import DeviceMappingsModel
+
+MAPPING = DeviceMappingsModel(buttons={"304": "enter", "316": "toggle_view"})
+
+
+class TestNavigationCapabilities(unittest.TestCase):
+    def check(self, **kwargs) -> bool:
+        device = FakeInputDevice("Wireless Controller", **kwargs)
+        try:
+            return has_navigation_capabilities(device, MAPPING)
+        finally:
+            device.close()
+
+    def test_gamepad_node(self):
+        self.assertTrue(self.check())
+
+    def test_hat_only_node(self):
+        self.assertTrue(self.check(keys=[]))
+
+    def test_mapped_key_only_node(self):
+        self.assertTrue(self.check(keys=[ecodes.BTN_MODE], axes=[]))
+
+    def test_motion_sensor_node(self):
+        self.assertFalse(
+            self.check(
+                keys=[],
+                axes=[ecodes.ABS_X, ecodes.ABS_Y, ecodes.ABS_Z, ecodes.ABS_RX],
+                props=[ecodes.INPUT_PROP_ACCELEROMETER],
+            )
+        )
+
+    def test_accelerometer_is_excluded_even_with_keys(self):
+        self.assertFalse(self.check(props=[ecodes.INPUT_PROP_ACCELEROMETER]))
+
+    def test_touchpad_node(self):
+        self.assertFalse(
+            self.check(
+                keys=[ecodes.BTN_LEFT, ecodes.BTN_TOUCH, ecodes.BTN_TOOL_FINGER],
+                axes=[ecodes.ABS_X, ecodes.ABS_Y, ecodes.ABS_MT_POSITION_X],
+                props=[ecodes.INPUT_PROP_POINTER, ecodes.INPUT_PROP_BUTTONPAD],
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from evdev import ecodes
+
+from src.input.actions import Action
+from src.input.dispatch import compile_dispatch_table, dispatch_key, parse_code
+from src.types.schemas import DeviceMappingsModel
+
+
+class TestDispatchTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = compile_dispatch_table(
+            DeviceMappingsModel(buttons={"304": "enter", "BTN_MODE": "toggle_view"})
+        )
+
+    def lookup(self, ev_type: int, code: int, value: int) -> Action | None:
+        return self.table.get(dispatch_key(ev_type, code, value))
+
+    def test_key_press_only(self):
+        self.assertEqual(self.lookup(ecodes.EV_KEY, 304, 1), Action.ENTER)
+        self.assertIsNone(self.lookup(ecodes.EV_KEY, 304, 0))
+        self.assertIsNone(self.lookup(ecodes.EV_KEY, 304, 2))
+
+    def test_named_codes(self):
+        self.assertEqual(
+            self.lookup(ecodes.EV_KEY, ecodes.BTN_MODE, 1), Action.TOGGLE_VIEW
+        )
+        self.assertEqual(parse_code("28"), 28)
+        self.assertIsNone(parse_code("NOT_A_KEY"))
+
+    def test_hat_axes(self):
+        self.assertEqual(self.lookup(ecodes.EV_ABS, ecodes.ABS_HAT0X, -1), Action.LEFT)
+        self.assertEqual(self.lookup(ecodes.EV_ABS, ecodes.ABS_HAT0Y, 1), Action.DOWN)
+        self.assertIsNone(self.lookup(ecodes.EV_ABS, ecodes.ABS_HAT0Y, 0))
+
+    def test_keys_do_not_collide_with_axes(self):
+        table = compile_dispatch_table(DeviceMappingsModel(buttons={"28": "enter"}))
+        self.assertIsNone(table.get(dispatch_key(ecodes.EV_ABS, 28, 1)))
+
+    def test_unknown_code_is_skipped(self):
+        table = compile_dispatch_table(
+            DeviceMappingsModel(buttons={"BOGUS": "enter", "28": "enter"})
+        )
+        self.assertEqual(
+            table[dispatch_key(ecodes.EV_KEY, 28, 1)],
+            Action.ENTER,
+        )
+
+    def test_unknown_action_is_skipped(self):
+        table = compile_dispatch_table(
+            DeviceMappingsModel(buttons={"28": "button_enter", "29": "ENTER"})
+        )
+        self.assertNotIn(dispatch_key(ecodes.EV_KEY, 28, 1), table)
+        self.assertIs(table[dispatch_key(ecodes.EV_KEY, 29, 1)], Action.ENTER)
+
+    def test_hats_without_mapping(self):
+        self.assertEqual(len(compile_dispatch_table(None)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
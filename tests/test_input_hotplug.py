@@ -0,0 +1,59 @@
+import unittest
+
+from src.input.hotplug import HotplugBatch
+
+PAD = "/dev/input/event5"
+PAD_JS = "/dev/input/event6"
+
+
+class TestHotplugBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch = HotplugBatch()
+
+    def test_first_event_opens_the_batch(self):
+        self.assertTrue(self.batch.record("add", PAD))
+        self.assertFalse(self.batch.record("add", PAD_JS))
+        self.assertFalse(self.batch.record("change", PAD))
+        self.assertEqual(len(self.batch), 2)
+
+    def test_ignores_other_actions(self):
+        self.assertFalse(self.batch.record("change", PAD))
+        self.assertFalse(self.batch.plan(set()))
+
+    def test_burst_starts_each_node_once(self):
+        for _ in range(3):
+            self.batch.record("add", PAD)
+        plan = self.batch.plan(set())
+
+        self.assertEqual(plan.start, [PAD])
+        self.assertEqual(plan.stop, [])
+        self.assertEqual(len(self.batch), 0)
+
+    def test_flap_ending_connected_restarts_reader(self):
+        self.batch.record("remove", PAD)
+        self.batch.record("add", PAD)
+        plan = self.batch.plan({PAD})
+
+        self.assertEqual((plan.stop, plan.start), ([PAD], [PAD]))
+
+    def test_flap_ending_disconnected(self):
+        self.batch.record("add", PAD)
+        self.batch.record("remove", PAD)
+
+        self.assertFalse(self.batch.plan(set()))
+
+    def test_running_node_is_not_restarted_by_add(self):
+        self.batch.record("add", PAD)
+
+        self.assertFalse(self.batch.plan({PAD}))
+
+    def test_remove_stops_running_node(self):
+        self.batch.record("remove", PAD)
+        self.batch.record("remove", PAD_JS)
+        plan = self.batch.plan({PAD})
+
+        self.assertEqual((plan.stop, plan.start), ([PAD], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import time
+import unittest
+
+from evdev import ecodes
+from input_fakes import FakeInputDevice, key, syn
+
+from src.input import Action, ActionQueue, DeviceEventWorker, LatencyTracker
+from src.input.latency import LatencyHistogram
+
+XBOX = "Microsoft X-Box 360 pad"
+
+
+def drain_timed(queue: ActionQueue) -> list[tuple[Action, float | None]]:
+    actions: list[Action] = []
+    timestamps: list[float | None] = []
+    queue.drain_into(actions, timestamps)
+    return list(zip(actions, timestamps, strict=True))
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for latency_us in (10, 20, 30, 1000):
+            histogram.record(latency_us)
+
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.percentile(0.5), 32)
+        self.assertEqual(histogram.percentile(0.99), 1000)
+        self.assertEqual(histogram.max_us, 1000)
+        self.assertEqual(histogram.mean_us, 265)
+
+    def test_overflow_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.record(5_000_000)
+
+        self.assertEqual(histogram.buckets[-1], 1)
+        self.assertEqual(histogram.percentile(0.5), 5_000_000)
+
+
+class TestLatencyTracker(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        tracker = LatencyTracker()
+        tracker.record("read", 0.0, 1.0)
+        tracker.begin(0.0)
+        tracker.focus()
+        tracker.paint()
+
+        self.assertTrue(all(not h.count for h in tracker.histograms().values()))
+
+    def test_gui_stages_follow_the_action(self):
+        tracker = LatencyTracker(enabled=True)
+        tracker.begin(100.0)
+        tracker.focus()
+        tracker.end()
+        tracker.begin(None)
+        tracker.focus()
+        tracker.end()
+        tracker.paint()
+        tracker.paint()
+
+        histograms = tracker.histograms()
+        self.assertEqual(histograms["action_handler"].count, 1)
+        self.assertEqual(histograms["focus"].count, 1)
+        self.assertEqual(histograms["paint"].count, 1)
+
+    def test_paint_measures_oldest_focus(self):
+        tracker = LatencyTracker(enabled=True)
+        now = time.monotonic()
+        for origin in (now - 0.5, now - 0.1):
+            tracker.begin(origin)
+            tracker.focus()
+            tracker.end()
+        tracker.paint()
+
+        paint = tracker.histograms()["paint"]
+        self.assertEqual(paint.count, 1)
+        self.assertGreaterEqual(paint.max_us, 500_000)
+
+    def test_dump_lists_every_stage(self):
+        tracker = LatencyTracker(enabled=True)
+        tracker.record("read", 1.0, 1.001)
+        dump = tracker.dump()
+
+        for stage in ("read", "dispatch", "queue", "action_handler", "paint"):
+            self.assertIn(stage, dump)
+
+
+class TestTimestampPropagation(unittest.TestCase):
+    def test_frame_timestamp_reaches_the_queue(self):
+        device = FakeInputDevice(XBOX)
+        queue = ActionQueue()
+        worker = DeviceEventWorker(device, XBOX, queue)
+        worker._monotonic_clock = True
+        worker.handle_events([key(ecodes.BTN_A), syn(12, 500_000)])
+        device.close()
+
+        self.assertEqual(drain_timed(queue), [(Action.ENTER, 12.5)])
+
+    def test_coalesced_moves_keep_oldest_timestamp(self):
+        queue = ActionQueue()
+        queue.put([Action.DOWN], timestamp=1.0)
+        queue.put([Action.DOWN], timestamp=2.0)
+
+        self.assertEqual(drain_timed(queue), [(Action.DOWN, 1.0), (Action.DOWN, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
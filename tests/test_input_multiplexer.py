@@ -0,0 +1,141 @@
+import threading
+import time
+import unittest
+
+from evdev import ecodes
+from input_fakes import FakeInputDevice, key, syn
+
+from src.input import Action, DeviceEventWorker, InputMultiplexer
+from src.wakeup import SHUTDOWN_BUDGET
+
+XBOX = "Microsoft X-Box 360 pad"
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class PathSink:
+    def __init__(self, test: "TestInputMultiplexer", path: str) -> None:
+        self.test = test
+        self.path = path
+
+    def put(
+        self,
+        actions: list[Action],
+        repeat: bool = False,
+        timestamp: float | None = None,
+    ) -> None:
+        with self.test.lock:
+            self.test.actions.extend((self.path, action) for action in actions)
+
+
+class TestInputMultiplexer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.actions: list[tuple[str, str]] = []
+        self.closed: list[str] = []
+        self.multiplexer = InputMultiplexer(
+            on_reader_closed=lambda reader: self.closed.append(reader.path)
+        )
+
+    def tearDown(self) -> None:
+        self.multiplexer.stop()
+
+    def add_device(self, index: int) -> tuple[FakeInputDevice, DeviceEventWorker]:
+        device = FakeInputDevice(XBOX, path=f"/dev/input/event{index}")
+
+        worker = DeviceEventWorker(device, XBOX, PathSink(self, device.path))
+        self.multiplexer.add(worker)
+        return device, worker
+
+    def test_many_devices_share_one_thread(self):
+        threads_before = threading.active_count()
+        devices = [self.add_device(i)[0] for i in range(24)]
+        for device in devices:
+            device.push(key(ecodes.BTN_A), syn())
+
+        self.assertTrue(wait_for(lambda: len(self.actions) == 24))
+        self.assertEqual(threading.active_count(), threads_before + 1)
+        self.assertEqual(self.multiplexer.reader_count, 24)
+
+    def test_remove_closes_reader(self):
+        device, worker = self.add_device(0)
+        self.assertTrue(wait_for(lambda: self.multiplexer.reader_count == 1))
+
+        self.multiplexer.remove(worker)
+
+        self.assertTrue(wait_for(lambda: device.closed))
+        self.assertEqual(self.multiplexer.reader_count, 0)
+        self.assertEqual(self.closed, [])
+
+    def test_disconnected_reader_is_dropped(self):
+        device, _ = self.add_device(0)
+        device.disconnect()
+
+        self.assertTrue(wait_for(lambda: self.closed == [device.path]))
+        self.assertTrue(device.closed)
+
+    def test_stop_closes_all_readers(self):
+        devices = [self.add_device(i)[0] for i in range(3)]
+        self.assertTrue(wait_for(lambda: self.multiplexer.reader_count == 3))
+
+        self.multiplexer.stop()
+
+        self.assertFalse(self.multiplexer.is_running)
+        self.assertTrue(all(device.closed for device in devices))
+
+    def test_failing_reader_is_detached_alone(self):
+        class FailingSink:
+            def put(self, actions, repeat=False, timestamp=None) -> None:
+                raise RuntimeError("boom")
+
+        broken = FakeInputDevice(XBOX, path="/dev/input/event9")
+        self.multiplexer.add(DeviceEventWorker(broken, XBOX, FailingSink()))
+        device, _ = self.add_device(0)
+        broken.push(key(ecodes.BTN_A), syn())
+
+        self.assertTrue(wait_for(lambda: self.closed == [broken.path]))
+        device.push(key(ecodes.BTN_A), syn())
+        self.assertTrue(wait_for(lambda: len(self.actions) == 1))
+        self.assertTrue(self.multiplexer.is_running)
+
+    def test_adding_a_reader_twice_keeps_running(self):
+        device, worker = self.add_device(0)
+        self.multiplexer.add(worker)
+        device.push(key(ecodes.BTN_A), syn())
+
+        self.assertTrue(wait_for(lambda: len(self.actions) == 1))
+        self.assertTrue(self.multiplexer.is_running)
+        self.assertEqual(self.multiplexer.reader_count, 1)
+
+    def test_remove_after_thread_died_closes_reader(self):
+        self.add_device(0)
+        thread = self.multiplexer._thread
+        assert thread is not None
+        self.multiplexer._post("stop", None)  # the thread ends, stop() not called
+        thread.join(1)
+        device = FakeInputDevice(XBOX, path="/dev/input/event1")
+
+        self.multiplexer.remove(DeviceEventWorker(device, XBOX, PathSink(self, "")))
+
+        self.assertTrue(device.closed)
+
+    def test_stop_is_within_shutdown_budget(self):
+        for i in range(8):
+            self.add_device(i)
+        self.assertTrue(wait_for(lambda: self.multiplexer.reader_count == 8))
+
+        start = time.perf_counter()
+        self.multiplexer.stop()
+
+        self.assertLess(time.perf_counter() - start, SHUTDOWN_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
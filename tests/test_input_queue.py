@@ -0,0 +1,137 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtCore import QCoreApplication
+
+from src.gui.components.device_monitor import DeviceMonitor
+from src.input import Action, ActionQueue
+
+
+class TestActionQueue(unittest.TestCase):
+    def test_runs_of_the_same_move_coalesce(self):
+        queue = ActionQueue()
+        queue.put([Action.RIGHT, Action.RIGHT, Action.RIGHT, Action.DOWN])
+
+        self.assertEqual(queue.depth, 2)
+        self.assertEqual(
+            queue.drain(), [Action.RIGHT, Action.RIGHT, Action.RIGHT, Action.DOWN]
+        )
+        self.assertEqual(queue.stats().coalesced, 2)
+
+    def test_moves_keep_their_order(self):
+        queue = ActionQueue()
+        queue.put([Action.DOWN, Action.RIGHT, Action.DOWN])
+        queue.put([Action.LEFT])
+        queue.put([Action.RIGHT])
+
+        self.assertEqual(
+            queue.drain(),
+            [Action.DOWN, Action.RIGHT, Action.DOWN, Action.LEFT, Action.RIGHT],
+        )
+
+    def test_moves_do_not_merge_across_other_actions(self):
+        queue = ActionQueue()
+        queue.put([Action.DOWN, Action.ENTER, Action.UP])
+
+        self.assertEqual(queue.drain(), [Action.DOWN, Action.ENTER, Action.UP])
+
+    def test_overflow_drops_oldest_moves_only(self):
+        queue = ActionQueue(max_size=3)
+        queue.put(
+            [Action.LEFT, Action.ENTER, Action.RIGHT, Action.TOGGLE_VIEW, Action.DOWN]
+        )
+
+        self.assertEqual(queue.drain(), [Action.ENTER, Action.TOGGLE_VIEW, Action.DOWN])
+        self.assertEqual(queue.stats().dropped_overflow, 2)
+
+    def test_overflow_never_drops_commands(self):
+        queue = ActionQueue(max_size=2)
+        queue.put([Action.ENTER, Action.TOGGLE_VIEW, Action.ENTER])
+
+        self.assertEqual(
+            queue.drain(), [Action.ENTER, Action.TOGGLE_VIEW, Action.ENTER]
+        )
+
+    def test_stale_repeats_are_dropped(self):
+        queue = ActionQueue(repeat_budget=0.01)
+        queue.put([Action.DOWN], repeat=True)
+        queue.put([Action.ENTER])
+        time.sleep(0.02)
+
+        self.assertEqual(queue.drain(), [Action.ENTER])
+        self.assertEqual(queue.stats().dropped_stale, 1)
+
+    def test_repeats_do_not_merge_with_presses(self):
+        queue = ActionQueue(repeat_budget=0.01)
+        queue.put([Action.DOWN])
+        queue.put([Action.DOWN], repeat=True)
+        time.sleep(0.02)
+
+        self.assertEqual(queue.drain(), [Action.DOWN])
+
+    def test_on_ready_once_per_drain(self):
+        wakeups: list[None] = []
+        queue = ActionQueue(on_ready=lambda: wakeups.append(None))
+        queue.put([Action.UP])
+        queue.put([Action.ENTER])
+        self.assertEqual(len(wakeups), 1)
+
+        queue.drain()
+        queue.put([Action.ENTER])
+        self.assertEqual(len(wakeups), 2)
+
+    def test_high_water(self):
+        queue = ActionQueue()
+        queue.put([Action.ENTER, Action.TOGGLE_VIEW, Action.ENTER])
+        queue.drain()
+
+        stats = queue.stats()
+        self.assertEqual(stats.depth, 0)
+        self.assertEqual(stats.high_water, 3)
+
+
+class TestGuiHandoff(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.monitor = DeviceMonitor()
+        self.batches: list[list] = []
+        self.buffers: list[int] = []
+        self.monitor.on_actions = self.on_actions
+
+    def tearDown(self) -> None:
+        self.monitor.stop_all()
+
+    def on_actions(self, actions: list, timestamps: list) -> None:
+        self.buffers.append(id(actions))
+        self.batches.append(list(zip(actions, timestamps, strict=True)))
+
+    def process_events_until(self, count: int) -> None:
+        deadline = time.monotonic() + 2
+        while len(self.batches) < count and time.monotonic() < deadline:
+            self.app.processEvents()
+
+    def test_put_wakes_gui_through_eventfd(self):
+        self.monitor.action_queue.put([Action.LEFT, Action.ENTER], timestamp=1.0)
+        self.process_events_until(1)
+        self.monitor.action_queue.put([Action.DOWN])
+        self.process_events_until(2)
+
+        self.assertEqual(
+            self.batches,
+            [[(Action.LEFT, 1.0), (Action.ENTER, 1.0)], [(Action.DOWN, None)]],
+        )
+        # Every drain hands over the same, reused buffers.
+        self.assertEqual(len(set(self.buffers)), 1)
+
+    def test_waker_stays_open_while_the_input_thread_runs(self):
+        with patch.object(self.monitor.multiplexer, "stop", return_value=False):
+            self.monitor.stop_all()
+
+        self.assertGreaterEqual(self.monitor.action_waker.fileno(), 0)
+        self.monitor.stop_all()
+        self.assertEqual(self.monitor.action_waker.fileno(), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
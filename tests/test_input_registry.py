@@ -0,0 +1,75 @@
+import unittest
+
+from input_fakes import FakeInputDevice
+
+from src.input import DeviceRegistry, MappingIndex
+from src.types.schemas import DeviceMappingsModel
+
+
+class TestMappingIndex(unittest.TestCase):
+    def test_case_insensitive_substring(self):
+        index = MappingIndex(["X-Box 360 pad"])
+
+        self.assertEqual(index.resolve("Microsoft X-BOX 360 pad"), "X-Box 360 pad")
+        self.assertIsNone(index.resolve("AT Translated Set 2 keyboard"))
+
+    def test_first_key_in_settings_order_wins(self):
+        index = MappingIndex(["Controller", "Wireless Controller"])
+
+        self.assertEqual(index.resolve("Wireless Controller"), "Controller")
+
+    def test_resolution_is_memoised(self):
+        index = MappingIndex(["pad"])
+        index.resolve("Some pad")
+        index._keys = ()
+
+        self.assertEqual(index.resolve("Some pad"), "pad")
+
+
+class TestDeviceRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = DeviceRegistry(
+            {
+                "X-Box 360 pad": DeviceMappingsModel(buttons={}, tray=True),
+                "Keyboard": DeviceMappingsModel(buttons={}),
+            }
+        )
+        self.devices: list[FakeInputDevice] = []
+
+    def tearDown(self) -> None:
+        for device in self.devices:
+            device.close()
+
+    def describe(self, name: str, path: str):
+        device = FakeInputDevice(name, path=path)
+        self.devices.append(device)
+        return self.registry.describe(device)
+
+    def test_describe_caches_identity(self):
+        info = self.describe("Microsoft X-Box 360 pad", "/dev/input/event3")
+
+        self.assertEqual(info.mapping_key, "X-Box 360 pad")
+        self.assertEqual((info.vendor, info.product), (0x045E, 0x028E))
+        self.assertTrue(info.tray)
+        self.assertIn(3, info.capabilities)
+        self.assertNotIn("/dev/input/event3", self.registry)
+
+    def test_tray_status_tracks_add_and_remove(self):
+        pad = self.describe("Microsoft X-Box 360 pad", "/dev/input/event3")
+        keyboard = self.describe("USB Keyboard", "/dev/input/event4")
+        self.registry.add(keyboard)
+        self.assertFalse(self.registry.has_tray_device)
+
+        self.registry.add(pad)
+        self.registry.add(pad)
+        self.assertTrue(self.registry.has_tray_device)
+        self.assertEqual(len(self.registry), 2)
+
+        self.assertEqual(self.registry.remove(pad.path), pad)
+        self.assertIsNone(self.registry.remove(pad.path))
+        self.assertFalse(self.registry.has_tray_device)
+        self.assertEqual([info.name for info in self.registry], ["USB Keyboard"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import time
+import unittest
+
+from evdev import ecodes
+from evdev.events import InputEvent
+from input_fakes import FakeInputDevice, RecordingSink, absolute, key, syn
+
+from src.input import (
+    Action,
+    DeviceEventWorker,
+    HoldRepeater,
+    InputMultiplexer,
+    RepeatGate,
+)
+from src.input.repeat import realtime_to_monotonic
+
+XBOX = "Microsoft X-Box 360 pad"
+
+
+class TestHoldRepeater(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repeater = HoldRepeater(
+            delay=0.4, interval=0.2, min_interval=0.05, acceleration=0.5
+        )
+
+    def test_schedule_accelerates(self):
+        self.repeater.press(Action.DOWN, "hat", 10.0)
+
+        self.assertIsNone(self.repeater.poll(10.39))
+        self.assertEqual(self.repeater.poll(10.4), Action.DOWN)
+        self.assertAlmostEqual(self.repeater.deadline, 10.6)
+        self.assertEqual(self.repeater.poll(10.6), Action.DOWN)
+        self.assertAlmostEqual(self.repeater.deadline, 10.7)
+        self.assertEqual(self.repeater.poll(10.7), Action.DOWN)
+        self.assertAlmostEqual(self.repeater.deadline, 10.75)
+
+    def test_late_poll_does_not_catch_up(self):
+        self.repeater.press(Action.LEFT, "hat", 10.0)
+
+        self.assertEqual(self.repeater.poll(12.0), Action.LEFT)
+        self.assertIsNone(self.repeater.poll(12.0))
+        self.assertAlmostEqual(self.repeater.deadline, 12.05)
+
+    def test_release_only_from_holding_source(self):
+        self.repeater.press(Action.UP, "stick", 0.0)
+        self.repeater.release("hat")
+        self.assertEqual(self.repeater.action, Action.UP)
+        self.repeater.release("stick")
+        self.assertIsNone(self.repeater.deadline)
+
+    def test_non_directional_actions_do_not_repeat(self):
+        self.repeater.press(Action.ENTER, "key", 0.0)
+        self.assertIsNone(self.repeater.deadline)
+
+
+class TestRepeatGate(unittest.TestCase):
+    def test_one_in_flight(self):
+        gate = RepeatGate()
+        self.assertTrue(gate.try_acquire())
+        self.assertFalse(gate.try_acquire())
+        gate.release()
+        self.assertTrue(gate.try_acquire())
+        self.assertEqual(gate.skipped, 1)
+
+
+class TestWorkerRepeat(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sink = RecordingSink()
+        self.batches = self.sink.batches
+        self.gate = RepeatGate()
+        self.device = FakeInputDevice(XBOX)
+        self.worker = DeviceEventWorker(self.device, XBOX, self.sink, self.gate)
+        self.sec = int(time.time())
+        self.pressed_at = realtime_to_monotonic(self.sec)
+
+    def tearDown(self) -> None:
+        self.device.close()
+
+    def test_hat_hold_repeats_until_release(self):
+        self.worker.handle_events(
+            [absolute(ecodes.ABS_HAT0Y, 1, self.sec), syn(self.sec)]
+        )
+        deadline = self.worker.next_deadline()
+        self.assertAlmostEqual(deadline, self.pressed_at + 0.4, places=2)
+
+        self.worker.tick(deadline)
+        self.gate.release()
+        self.worker.tick(self.worker.next_deadline())
+        self.worker.handle_events(
+            [absolute(ecodes.ABS_HAT0Y, 0, self.sec + 1), syn(self.sec + 1)]
+        )
+
+        self.assertEqual(self.batches, [[Action.DOWN], [Action.DOWN], [Action.DOWN]])
+        self.assertIsNone(self.worker.next_deadline())
+
+    def test_busy_gui_skips_repeats(self):
+        self.worker.handle_events([key(ecodes.BTN_A), absolute(ecodes.ABS_HAT0X, -1)])
+        self.worker.handle_events([syn(self.sec)])
+        for _ in range(5):
+            self.worker.tick(self.worker.next_deadline())
+
+        self.assertEqual(self.batches, [[Action.ENTER, Action.LEFT], [Action.LEFT]])
+        self.assertEqual(self.gate.skipped, 4)
+
+    def test_dropped_events_cancel_hold(self):
+        dropped = InputEvent(self.sec, 0, ecodes.EV_SYN, ecodes.SYN_DROPPED, 0)
+        self.worker.handle_events([absolute(ecodes.ABS_HAT0X, 1), syn(self.sec)])
+        self.worker.handle_events([dropped, syn(self.sec)])
+
+        self.assertIsNone(self.worker.next_deadline())
+
+
+class TestMultiplexerTimers(unittest.TestCase):
+    def test_repeats_scheduled_on_input_thread(self):
+        sink = RecordingSink()
+        batches = sink.batches
+        device = FakeInputDevice(XBOX)
+        worker = DeviceEventWorker(device, XBOX, sink)
+        worker._repeater = HoldRepeater(0.05, 0.02, 0.02, 1.0)
+        multiplexer = InputMultiplexer()
+        multiplexer.add(worker)
+        try:
+            device.push(
+                absolute(ecodes.ABS_HAT0X, 1, *divmod_now()), syn(*divmod_now())
+            )
+            time.sleep(0.2)
+            device.push(absolute(ecodes.ABS_HAT0X, 0), syn(*divmod_now()))
+            time.sleep(0.05)
+        finally:
+            multiplexer.stop()
+
+        self.assertGreaterEqual(len(batches), 4)
+        self.assertTrue(all(batch == [Action.RIGHT] for batch in batches))
+        count = len(batches)
+        time.sleep(0.05)
+        self.assertEqual(len(batches), count)
+
+
+def divmod_now() -> tuple[int, int]:
+    now = time.time()
+    return int(now), int((now % 1) * 1_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import math
+import time
+import unittest
+
+from evdev import ecodes
+from input_fakes import FakeInputDevice, RecordingSink, key, syn
+
+from src.input import Action, HoldRepeater, InputMultiplexer
+from src.input.trace import (
+    Trace,
+    TraceDevice,
+    TraceEvent,
+    TraceFormatError,
+    TraceReplayer,
+    TraceWriter,
+    read_trace,
+    write_trace,
+)
+
+XBOX = "Microsoft X-Box 360 pad"
+PAD = TraceDevice(
+    XBOX,
+    "/dev/input/event-replay0",
+    (ecodes.BTN_A, ecodes.BTN_MODE),
+    {ecodes.ABS_HAT0X: (-1, 1, 0), ecodes.ABS_HAT0Y: (-1, 1, 0)},
+)
+
+
+def frame(time: float, *changes: tuple[int, int, int]) -> list[TraceEvent]:
+    time_ns = int(time * 1e9)
+    return [TraceEvent(time_ns, 0, *change) for change in changes] + [
+        TraceEvent(time_ns, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0)
+    ]
+
+
+def hold_trace() -> Trace:
+    return Trace(
+        [PAD],
+        frame(0.0, (ecodes.EV_KEY, ecodes.BTN_A, 1))
+        + frame(0.05, (ecodes.EV_KEY, ecodes.BTN_A, 0))
+        + frame(0.1, (ecodes.EV_ABS, ecodes.ABS_HAT0X, 1))
+        + frame(1.0, (ecodes.EV_ABS, ecodes.ABS_HAT0X, 0)),
+    )
+
+
+class TestTraceFormat(unittest.TestCase):
+    def test_round_trip(self):
+        trace = hold_trace()
+        stream = io.BytesIO()
+        write_trace(stream, trace)
+        stream.seek(0)
+
+        self.assertEqual(read_trace(stream), trace)
+
+    def test_writer_keeps_times_relative(self):
+        device = FakeInputDevice(XBOX, axes=[ecodes.ABS_HAT0X])
+        stream = io.BytesIO()
+        writer = TraceWriter(stream, [TraceDevice.from_input_device(device)])
+        for event in (key(ecodes.BTN_A, sec=100), syn(100, 250_000)):
+            writer.write(0, event)
+        device.close()
+        stream.seek(0)
+        trace = read_trace(stream)
+
+        self.assertEqual([e.time_ns for e in trace.events], [0, 250_000_000])
+        self.assertEqual(trace.devices[0].axes, {ecodes.ABS_HAT0X: (-1, 1, 0)})
+
+    def test_rejects_foreign_files(self):
+        with self.assertRaises(TraceFormatError):
+            read_trace(io.BytesIO(b"\x7fELF" + bytes(16)))
+
+    def test_ignores_truncated_record(self):
+        stream = io.BytesIO()
+        write_trace(stream, hold_trace())
+        truncated = io.BytesIO(stream.getvalue()[:-3])
+
+        self.assertEqual(len(read_trace(truncated).events), 7)
+
+
+class TestTraceReplay(unittest.TestCase):
+    def test_virtual_replay_is_deterministic(self):
+        runs = []
+        for _ in range(2):
+            sink = RecordingSink()
+            replayer = TraceReplayer(hold_trace(), sink)
+            replayer.workers[0]._repeater = HoldRepeater(0.4, 0.15, 0.05, 1.0)
+            self.assertEqual(replayer.run_virtual(), 4)
+            replayer.close()
+            runs.append(sink.batches)
+
+        # Held from 0.1 s to 1.0 s: repeats at 0.5, 0.65, 0.8, 0.95.
+        self.assertEqual(
+            runs[0], [[Action.ENTER], [Action.RIGHT]] + [[Action.RIGHT]] * 4
+        )
+        self.assertEqual(runs[0], runs[1])
+
+    def test_realtime_replay_through_multiplexer(self):
+        sink = RecordingSink()
+        replayer = TraceReplayer(
+            Trace([PAD], frame(0.0, (ecodes.EV_KEY, ecodes.BTN_A, 1))), sink
+        )
+        multiplexer = InputMultiplexer()
+        try:
+            self.assertEqual(replayer.run(multiplexer, speed=math.inf), 1)
+            deadline = time.monotonic() + 2.0
+            while not sink.batches and time.monotonic() < deadline:
+                time.sleep(0.005)
+        finally:
+            multiplexer.stop()
+            replayer.close(multiplexer)
+
+        self.assertEqual(sink.batches, [[Action.ENTER]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+from src.input.udev import (
+    UDEV_RULE,
+    UDEV_TAG,
+    configure_monitor,
+    is_navigation_node,
+    list_navigation_nodes,
+    udev_tag_installed,
+)
+
+
+class FakeUdevDevice(dict):
+    def __init__(self, device_node: str | None, **properties: str) -> None:
+        super().__init__(properties)
+        self.device_node = device_node
+
+
+class FakeEnumerator:
+    def __init__(self, devices: list[FakeUdevDevice]) -> None:
+        self.devices = devices
+        self.calls: list[tuple] = []
+
+    def match_tag(self, tag: str) -> "FakeEnumerator":
+        self.calls.append(("tag", tag))
+        return self
+
+    def match_property(self, prop: str, value: str) -> "FakeEnumerator":
+        self.calls.append(("property", prop, value))
+        return self
+
+    def __iter__(self):
+        return iter(self.devices)
+
+
+class FakeContext:
+    def __init__(self, devices: list[FakeUdevDevice]) -> None:
+        self.enumerator = FakeEnumerator(devices)
+        self.query: dict = {}
+
+    def list_devices(self, **kwargs) -> FakeEnumerator:
+        self.query = kwargs
+        return self.enumerator
+
+
+class FakeMonitor:
+    def __init__(self) -> None:
+        self.filters: list[tuple] = []
+
+    def filter_by(self, subsystem: str, device_type: str | None = None) -> None:
+        self.filters.append(("subsystem", subsystem))
+
+    def filter_by_tag(self, tag: str) -> None:
+        self.filters.append(("tag", tag))
+
+
+class TestUdevFiltering(unittest.TestCase):
+    def test_navigation_nodes(self):
+        self.assertTrue(
+            is_navigation_node(
+                FakeUdevDevice("/dev/input/event5", ID_INPUT_JOYSTICK="1")
+            )
+        )
+        self.assertTrue(
+            is_navigation_node(FakeUdevDevice("/dev/input/event2", ID_INPUT_KEY="1"))
+        )
+        self.assertFalse(
+            is_navigation_node(FakeUdevDevice("/dev/input/event7", ID_INPUT_MOUSE="1"))
+        )
+        self.assertFalse(
+            is_navigation_node(FakeUdevDevice("/dev/input/js0", ID_INPUT_JOYSTICK="1"))
+        )
+        self.assertFalse(is_navigation_node(FakeUdevDevice(None, ID_INPUT_KEY="1")))
+
+    def test_tag_rule_detection(self):
+        with tempfile.TemporaryDirectory() as rules_dir:
+            self.assertFalse(udev_tag_installed([rules_dir]))
+            with open(os.path.join(rules_dir, "99-input.rules"), "w") as rules:
+                rules.write(UDEV_RULE)
+            self.assertTrue(udev_tag_installed([rules_dir, "/nonexistent"]))
+
+    def test_monitor_filters_by_tag_only_when_installed(self):
+        monitor = FakeMonitor()
+        configure_monitor(monitor, use_tag=False)
+        self.assertEqual(monitor.filters, [("subsystem", "input")])
+
+        monitor = FakeMonitor()
+        configure_monitor(monitor, use_tag=True)
+        self.assertEqual(monitor.filters, [("subsystem", "input"), ("tag", UDEV_TAG)])
+
+    def test_enumeration_by_tag(self):
+        context = FakeContext(
+            [FakeUdevDevice("/dev/input/event9"), FakeUdevDevice("/dev/input/event3")]
+        )
+        nodes = list_navigation_nodes(context, use_tag=True)
+
+        self.assertEqual(nodes, ["/dev/input/event3", "/dev/input/event9"])
+        self.assertEqual(context.query, {"subsystem": "input", "sys_name": "event*"})
+        self.assertEqual(context.enumerator.calls, [("tag", UDEV_TAG)])
+
+    def test_enumeration_by_properties(self):
+        context = FakeContext([FakeUdevDevice(None)])
+
+        self.assertEqual(list_navigation_nodes(context, use_tag=False), [])
+        self.assertEqual(
+            context.enumerator.calls,
+            [
+                ("property", "ID_INPUT_JOYSTICK", "1"),
+                ("property", "ID_INPUT_KEY", "1"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
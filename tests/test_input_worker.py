@@ -0,0 +1,110 @@
+import unittest
+
+from evdev import ecodes
+from evdev.events import InputEvent
+from input_fakes import FakeInputDevice, RecordingSink, absolute, key, syn
+
+from src.input import Action, DeviceEventWorker
+
+XBOX = "Microsoft X-Box 360 pad"
+
+
+class WorkerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sink = RecordingSink()
+        self.batches = self.sink.batches
+        self.device = FakeInputDevice(XBOX)
+        self.worker = DeviceEventWorker(self.device, XBOX, self.sink)
+
+    def tearDown(self) -> None:
+        self.device.close()
+
+
+class TestDeviceEventWorker(WorkerTestCase):
+    def test_maps_buttons_and_hat(self):
+        self.worker.handle_events(
+            [
+                key(ecodes.BTN_A),
+                syn(),
+                key(ecodes.BTN_A, 0),
+                syn(),
+                key(ecodes.BTN_MODE),
+                key(ecodes.BTN_X),
+                syn(),
+                absolute(ecodes.ABS_HAT0X, 1),
+                syn(),
+                absolute(ecodes.ABS_HAT0X, 0),
+                syn(),
+                absolute(ecodes.ABS_HAT0Y, -1),
+                syn(),
+            ]
+        )
+
+        self.assertEqual(
+            self.batches,
+            [[Action.ENTER], [Action.TOGGLE_VIEW], [Action.RIGHT], [Action.UP]],
+        )
+
+    def test_read_reports_disconnect(self):
+        self.assertTrue(self.worker.read())
+        self.device.disconnect()
+        self.assertFalse(self.worker.read())
+
+
+class TestFrameBatching(WorkerTestCase):
+    def test_one_batch_per_frame(self):
+        self.worker.handle_events(
+            [key(ecodes.BTN_A), absolute(ecodes.ABS_HAT0X, -1), syn()]
+        )
+
+        self.assertEqual(self.batches, [[Action.ENTER, Action.LEFT]])
+
+    def test_hat_release_and_press_collapse(self):
+        self.worker.handle_events(
+            [
+                absolute(ecodes.ABS_HAT0X, 0),
+                absolute(ecodes.ABS_HAT0X, 1),
+                absolute(ecodes.ABS_X, 1200),
+                absolute(ecodes.ABS_X, 1300),
+                syn(),
+            ]
+        )
+
+        self.assertEqual(self.batches, [[Action.RIGHT]])
+
+    def test_frames_without_actions_emit_nothing(self):
+        self.worker.handle_events(
+            [absolute(ecodes.ABS_X, v) for v in range(100)] + [syn()] * 10
+        )
+
+        self.assertEqual(self.batches, [])
+
+    def test_frame_spans_reads(self):
+        self.device.push(key(ecodes.BTN_A))
+        self.worker.read()
+        self.assertEqual(self.batches, [])
+
+        self.device.push(syn())
+        self.worker.read()
+        self.assertEqual(self.batches, [[Action.ENTER]])
+
+    def test_dropped_frame_is_discarded(self):
+        dropped = InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_DROPPED, 0)
+        self.worker.handle_events(
+            [
+                key(ecodes.BTN_A),
+                dropped,
+                key(ecodes.BTN_MODE),
+                syn(),
+                absolute(ecodes.ABS_HAT0Y, 1),
+                syn(),
+            ]
+        )
+
+        self.assertEqual(self.batches, [[Action.DOWN]])
+        self.assertEqual(self.worker.frames, 2)
+        self.assertEqual(self.worker.dropped_frames, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+
+from src.instance import InstanceLock, instance_socket_name, notify_running_instance
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestInstanceLock(unittest.TestCase):
+    def setUp(self) -> None:
+        self.name = f"\0app_launcher-test-{os.getpid()}-{time.monotonic_ns()}"
+        self.lock = InstanceLock(self.name)
+
+    def tearDown(self) -> None:
+        self.lock.release()
+
+    def test_second_lock_fails_while_held(self):
+        self.assertTrue(self.lock.acquire())
+        other = InstanceLock(self.name)
+
+        self.assertFalse(other.acquire())
+        self.lock.release()
+        self.assertTrue(other.acquire())
+        other.release()
+
+    def test_notify_delivers_command(self):
+        self.lock.acquire()
+
+        self.assertTrue(notify_running_instance("show", name=self.name))
+        self.assertTrue(notify_running_instance("show", name=self.name))
+        self.assertEqual(self.lock.receive(), ["show", "show"])
+        self.assertEqual(self.lock.receive(), [])
+
+    def test_receive_does_not_wait_for_a_silent_client(self):
+        self.lock.acquire()
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(self.name)
+        started = time.monotonic()
+
+        self.assertEqual(self.lock.receive(), [])
+        self.assertLess(time.monotonic() - started, 0.05)
+        self.assertEqual(len(self.lock.pending_filenos()), 1)
+
+        client.sendall(b"show\n")
+        client.close()
+        self.assertEqual(self.lock.receive(), ["show"])
+        self.assertEqual(self.lock.pending_filenos(), [])
+
+    def test_notify_without_instance(self):
+        self.assertFalse(notify_running_instance("show", name=self.name))
+
+    def test_handoff_does_not_import_qt(self):
+        self.lock.acquire()
+        code = (
+            "import sys\n"
+            "from src.instance import InstanceLock, notify_running_instance\n"
+            f"name = {self.name!r}\n"
+            "assert not InstanceLock(name).acquire()\n"
+            "assert notify_running_instance('show', name=name)\n"
+            "assert not any(m.startswith('PySide6') for m in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(self.lock.receive(), ["show"])
+
+    def test_second_launch_skips_logging_setup(self):
+        lock = InstanceLock(instance_socket_name())
+        if not lock.acquire():
+            self.skipTest("a launcher instance is running")
+        try:
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "main.py"],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(lock.receive(), ["show"])
+        finally:
+            lock.release()
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        imported = {
+            line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+        }
+        self.assertNotIn("src.log", imported)
+        self.assertNotIn("pydantic", imported)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.gui.launch_service import LaunchJob, LaunchService
+from src.types.schemas import AppsModel
+from src.wakeup import SHUTDOWN_BUDGET
+
+KODI = AppsModel(cmd="kodi", enabled=True, icon="kodi.ico")
+
+
+class TestLaunchService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.executor = MagicMock()
+        self.service = LaunchService(executor_factory=lambda: self.executor)
+        self.progress: list[str] = []
+        self.launched: list[str] = []
+        self.service.progress.connect(self.progress.append)
+        self.service.launched.connect(self.launched.append)
+
+    def tearDown(self) -> None:
+        self.service.stop()
+
+    @patch("src.gui.launch_service.focus_process", return_value=False)
+    @patch("src.gui.launch_service.ActionManager.is_blocked", return_value=True)
+    def test_blocked(self, _blocked, mock_focus):
+        self.service.run_job(LaunchJob("kodi", KODI))
+
+        self.assertEqual(self.progress, ["Blocked by running process"])
+        mock_focus.assert_not_called()
+        self.executor.execute.assert_not_called()
+
+    @patch("src.gui.launch_service.focus_process", return_value=True)
+    @patch("src.gui.launch_service.ActionManager.is_blocked", return_value=False)
+    def test_focuses_running_app(self, _blocked, _focus):
+        self.service.run_job(LaunchJob("kodi", KODI))
+
+        self.assertEqual(self.progress[-1], "Focused kodi")
+        self.executor.execute.assert_not_called()
+
+    @patch("src.gui.launch_service.focus_process", return_value=False)
+    @patch("src.gui.launch_service.ActionManager.is_blocked", return_value=False)
+    def test_launches_and_reports(self, _blocked, _focus):
+        self.executor.execute.side_effect = lambda **kw: kw["on_success"]()
+
+        self.service.run_job(LaunchJob("kodi", KODI))
+
+        self.assertEqual(self.launched, ["kodi"])
+        self.assertEqual(self.executor.execute.call_args.kwargs["command"], "kodi")
+
+    @patch("src.gui.launch_service.focus_process", return_value=False)
+    @patch("src.gui.launch_service.ActionManager.is_blocked", return_value=False)
+    def test_cancelled_job_is_silent(self, _blocked, _focus):
+        job = LaunchJob("kodi", KODI)
+        job.cancelled.set()
+
+        self.service.run_job(job)
+
+        self.assertEqual(self.progress, [])
+        self.executor.execute.assert_not_called()
+
+    @patch("src.gui.launch_service.focus_process", return_value=False)
+    @patch("src.gui.launch_service.ActionManager.is_blocked")
+    def test_new_request_cancels_running_one(self, mock_blocked, _focus):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_check(_snapshot):
+            started.set()
+            release.wait(2)
+            return False
+
+        mock_blocked.side_effect = slow_check
+        first = self.service.request("kodi", KODI)
+        self.assertTrue(started.wait(2))
+        second = self.service.request("kodi", KODI)
+        release.set()
+
+        self.assertTrue(first.cancelled.is_set())
+        self.assertFalse(second.cancelled.is_set())
+
+    @patch("src.gui.launch_service.focus_process", return_value=False)
+    @patch("src.gui.launch_service.ActionManager.is_blocked")
+    def test_stop_does_not_wait_for_running_job(self, mock_blocked, _focus):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_check(_snapshot):
+            started.set()
+            release.wait(2)
+            return False
+
+        mock_blocked.side_effect = slow_check
+        job = self.service.request("kodi", KODI)
+        self.assertTrue(started.wait(2))
+
+        start = time.perf_counter()
+        self.service.stop(timeout=SHUTDOWN_BUDGET)
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        self.assertTrue(job.cancelled.is_set())
+        self.assertLess(elapsed, SHUTDOWN_BUDGET * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import os
+import socket
+import struct
+import time
+import unittest
+from unittest.mock import patch
+
+from proc_tree import ProcTreeTestCase
+
+from src.process.connector import (
+    PROC_EVENT_EXEC,
+    PROC_EVENT_EXIT,
+    PROC_EVENT_FORK,
+    parse_messages,
+)
+from src.process.index import ProcessIndex
+from src.wakeup import SHUTDOWN_BUDGET
+
+
+class ProcessIndexTestCase(ProcTreeTestCase):
+    def make_index(self, **kwargs) -> ProcessIndex:
+        kwargs.setdefault("max_staleness", 60)
+        return ProcessIndex(
+            watch_list=["kodi", "emulationstation"],
+            proc_root=self.proc_root,
+            use_connector=False,
+            **kwargs,
+        )
+
+
+class TestProcessIndex(ProcessIndexTestCase):
+    def test_first_query_refreshes_synchronously(self):
+        self.add_process(10, "kodi")
+        index = self.make_index()
+
+        self.assertTrue(index.is_blocked())
+        self.assertEqual(index.running(), ["kodi"])
+
+    def test_fresh_index_does_not_rescan(self):
+        index = self.make_index()
+        index.refresh()
+        self.add_process(10, "kodi")
+
+        self.assertFalse(index.is_blocked())
+
+    def test_stale_index_rescans(self):
+        index = self.make_index(max_staleness=0)
+        index.refresh()
+        self.add_process(10, "kodi")
+        time.sleep(0.001)
+
+        self.assertTrue(index.is_blocked())
+
+    def test_incremental_poll_does_not_reset_staleness(self):
+        index = self.make_index(max_staleness=0.01)
+        index.refresh()
+        time.sleep(0.02)
+        index.poll_once()
+
+        self.assertTrue(index.is_stale())
+
+    def test_empty_watch_list_never_blocks(self):
+        self.add_process(10, "kodi")
+        index = ProcessIndex(watch_list=[], proc_root=self.proc_root)
+
+        self.assertFalse(index.is_blocked())
+
+    def test_matches_wrapped_command(self):
+        self.add_process(
+            10, "x-terminal-emul", ["x-terminal-emulator", "-e", "emulationstation"]
+        )
+        index = self.make_index()
+
+        self.assertEqual(index.running(), ["emulationstation"])
+
+    def test_blocked_changed_emitted_on_flip_only(self):
+        index = self.make_index()
+        received: list[bool] = []
+        index.blocked_changed.connect(received.append)
+
+        index.refresh()
+        self.add_process(10, "kodi")
+        index.poll_once()
+        self.add_process(11, "kodi")
+        index.poll_once()
+        self.remove_process(10)
+        index.poll_once()
+        self.remove_process(11)
+        index.poll_once()
+
+        self.assertEqual(received, [True, False])
+
+
+class TestProcessIndexPolling(ProcessIndexTestCase):
+    def test_poll_reads_only_new_pids(self):
+        self.add_process(10, "bash")
+        index = self.make_index()
+        index.refresh()
+        index.poll_once()
+        # An old PID changing its cmdline is not re-read by the diff.
+        self.add_process(10, "kodi")
+        index.poll_once()
+
+        self.assertFalse(index.is_blocked())
+
+    def test_poll_rechecks_young_pids_after_exec(self):
+        index = self.make_index()
+        index.refresh()
+        self.add_process(20, "bash")
+        index.poll_once()
+        self.add_process(20, "kodi")
+        index.poll_once()
+
+        self.assertTrue(index.is_blocked())
+
+    def test_refresh_rechecks_unreadable_pids(self):
+        self.add_process(50, "kodi")
+        comm = os.path.join(self.proc_root, "50", "comm")
+        os.rename(comm, comm + ".tmp")
+        index = self.make_index()
+        index.refresh()
+        os.rename(comm + ".tmp", comm)
+        index.poll_once()
+
+        self.assertTrue(index.is_blocked())
+
+    def test_background_polling_thread(self):
+        index = self.make_index(refresh_interval=0.01)
+        index.start()
+        try:
+            self.add_process(30, "kodi")
+            deadline = time.monotonic() + 2
+            while not index._blocked and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(index.mode, "polling")
+            self.assertTrue(index.is_blocked())
+        finally:
+            index.stop()
+        self.assertFalse(index.is_running)
+
+    def test_background_polling_rescans_existing_pids(self):
+        self.add_process(40, "bash")
+        index = self.make_index(refresh_interval=0.01, max_staleness=0.05)
+        index.start()
+        try:
+            time.sleep(0.03)
+            # An old shell running `exec kodi`: the PID is not new.
+            self.add_process(40, "kodi")
+            deadline = time.monotonic() + 2
+            while not index._blocked and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(index._blocked)
+        finally:
+            index.stop()
+
+
+class IdleConnector:
+    """A proc connector that never delivers an event."""
+
+    def __init__(self) -> None:
+        self.sock, self.peer = socket.socketpair()
+
+    def open(self) -> None:
+        pass
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def set_timeout(self, timeout: float | None) -> None:
+        pass
+
+    def read(self) -> list:
+        return []
+
+    def close(self) -> None:
+        self.sock.close()
+        self.peer.close()
+
+
+class TestProcessIndexStop(ProcessIndexTestCase):
+    @patch("src.process.index.ProcConnector", IdleConnector)
+    def test_connector_thread_stops_within_shutdown_budget(self):
+        index = ProcessIndex(
+            watch_list=["kodi"], proc_root=self.proc_root, refresh_interval=5
+        )
+        index.start()
+        deadline = time.monotonic() + 2
+        while index.mode != "connector" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(index.mode, "connector")
+
+        start = time.perf_counter()
+        index.stop()
+
+        self.assertLess(time.perf_counter() - start, SHUTDOWN_BUDGET)
+        self.assertFalse(index.is_running)
+        self.assertIsNone(index._waker)
+
+
+class TestProcessIndexEvents(ProcessIndexTestCase):
+    def test_exec_and_exit_events(self):
+        index = self.make_index()
+        index.refresh()
+        self.add_process(40, "kodi")
+
+        index.handle_events([(PROC_EVENT_EXEC, 40, 40, 0)])
+        self.assertTrue(index.is_blocked())
+
+        index.handle_events([(PROC_EVENT_EXIT, 41, 40, 0)])
+        self.assertTrue(index.is_blocked())
+
+        index.handle_events([(PROC_EVENT_EXIT, 40, 40, 0)])
+        self.assertFalse(index.is_blocked())
+
+    def test_fork_inherits_parent_match(self):
+        self.add_process(40, "kodi")
+        index = self.make_index()
+        index.refresh()
+
+        index.handle_events([(PROC_EVENT_FORK, 41, 41, 40)])
+        index.handle_events([(PROC_EVENT_EXIT, 40, 40, 0)])
+
+        self.assertTrue(index.is_blocked())
+
+    def test_parse_messages(self):
+        def message(what: int, data: bytes) -> bytes:
+            event = struct.pack("=IIQ", what, 0, 0) + data
+            cn_msg = struct.pack("=IIIIHH", 1, 1, 0, 0, len(event), 0)
+            length = 16 + len(cn_msg) + len(event)
+            return struct.pack("=IHHII", length, 3, 0, 0, 0) + cn_msg + event
+
+        data = message(PROC_EVENT_FORK, struct.pack("=IIII", 1, 1, 7, 7))
+        data += message(PROC_EVENT_EXEC, struct.pack("=II", 7, 7))
+        data += message(PROC_EVENT_EXIT, struct.pack("=IIII", 7, 7, 0, 17))
+
+        self.assertEqual(
+            list(parse_messages(data)),
+            [
+                (PROC_EVENT_FORK, 7, 7, 1),
+                (PROC_EVENT_EXEC, 7, 7, 0),
+                (PROC_EVENT_EXIT, 7, 7, 0),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
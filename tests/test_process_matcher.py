@@ -0,0 +1,85 @@
+import random
+import string
+import unittest
+
+from src.process.matcher import ProcessMatcher, compile_matcher
+
+
+def naive_match(name: str, cmdline: str, terms: list[str]) -> set[str]:
+    name = name.lower()
+    cmdline = cmdline.lower()
+    return {
+        term
+        for term in terms
+        if term.lower() in name
+        or (name and name in term.lower())
+        or term.lower() in cmdline
+    }
+
+
+class TestProcessMatcher(unittest.TestCase):
+    def test_term_in_name(self):
+        matcher = ProcessMatcher(["kodi"])
+        self.assertEqual(matcher.match_terms("kodi.bin", ""), {"kodi"})
+
+    def test_name_in_term(self):
+        matcher = ProcessMatcher(["emulationstation"])
+        self.assertEqual(matcher.match_terms("emulationstat", ""), {"emulationstation"})
+
+    def test_term_in_cmdline(self):
+        matcher = ProcessMatcher(["emulationstation"])
+        self.assertEqual(
+            matcher.match_terms(
+                "x-terminal", "x-terminal-emulator -e emulationstation"
+            ),
+            {"emulationstation"},
+        )
+
+    def test_empty_name_matches_nothing(self):
+        matcher = ProcessMatcher(["kodi"])
+        self.assertEqual(matcher.match_terms("", ""), set())
+
+    def test_overlapping_terms(self):
+        matcher = ProcessMatcher(["retro", "retroarch", "arch", "he"])
+        self.assertEqual(
+            matcher.match_terms("bash", "/usr/bin/retroarch --help"),
+            {"retro", "retroarch", "arch", "he"},
+        )
+
+    def test_failure_links(self):
+        matcher = ProcessMatcher(["abcd", "bce", "cde"])
+        self.assertEqual(matcher.match_terms("x", "xbcde"), {"cde"})
+
+    def test_case_insensitive_keeps_original_terms(self):
+        matcher = ProcessMatcher(["Kodi", "kodi"])
+        self.assertEqual(matcher.match_terms("KODI", ""), {"Kodi", "kodi"})
+
+    def test_term_cannot_span_name_and_cmdline(self):
+        matcher = ProcessMatcher(["odiarg"])
+        self.assertEqual(matcher.match_terms("kodi", "arg"), set())
+
+    def test_matches_naive_implementation(self):
+        rng = random.Random(1234)
+        alphabet = "abcde-"
+
+        def word(low: int, high: int) -> str:
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(low, high)))
+
+        for _ in range(200):
+            terms = [word(1, 4) for _ in range(rng.randint(1, 8))]
+            name = word(0, 6)
+            cmdline = " ".join(word(1, 10) for _ in range(3))
+            matcher = ProcessMatcher(terms)
+            self.assertEqual(
+                matcher.match_terms(name, cmdline),
+                naive_match(name, cmdline, terms),
+                (terms, name, cmdline),
+            )
+
+    def test_compile_matcher_is_cached(self):
+        terms = tuple(string.ascii_lowercase)
+        self.assertIs(compile_matcher(terms), compile_matcher(terms))
+
+
+if __name__ == "__main__":
+    unittest.main()
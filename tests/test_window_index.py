@@ -0,0 +1,223 @@
+import os
+import shutil
+import subprocess
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from proc_tree import ProcTreeTestCase
+
+from src.process.procfs import read_ppid
+from src.process.scanner import ProcfsScanner
+from src.process.snapshot import ProcessSnapshot
+from src.process.tree import ProcessTree
+from src.process.windows import WindowIndex, WindowInfo, WindowResolver, xdisplay
+from src.wakeup import SHUTDOWN_BUDGET, Waker
+
+XVFB_DISPLAY = ":87"
+
+
+class TestWindowIndexClientList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = WindowIndex()
+        self.reads: list[int] = []
+
+    def read_window(self, window_id: int) -> WindowInfo | None:
+        self.reads.append(window_id)
+        if window_id == 0xDEAD:
+            return None
+        return WindowInfo(window_id, window_id // 0x10, ("app", "App"))
+
+    def test_indexes_windows_by_pid(self):
+        self.index.apply_client_list([0x100, 0x101, 0x200], self.read_window)
+
+        self.assertEqual(self.index.windows_for_pid(0x10), [0x100, 0x101])
+        self.assertEqual(self.index.windows_for_pid(0x20), [0x200])
+        self.assertEqual(self.index.windows_for_pid(0x30), [])
+
+    def test_only_new_windows_are_read(self):
+        self.index.apply_client_list([0x100, 0x200], self.read_window)
+        self.index.apply_client_list([0x100, 0x200, 0x300], self.read_window)
+
+        self.assertEqual(self.reads, [0x100, 0x200, 0x300])
+
+    def test_removed_and_vanished_windows_are_dropped(self):
+        self.index.apply_client_list([0x100, 0x200], self.read_window)
+        self.index.apply_client_list([0x200, 0xDEAD], self.read_window)
+
+        self.assertFalse(self.index.has_window(0x100))
+        self.assertFalse(self.index.has_window(0xDEAD))
+        self.assertEqual(self.index.windows_for_pid(0x10), [])
+
+    def test_windows_are_read_without_holding_the_lock(self):
+        def read_window(window_id: int) -> WindowInfo | None:
+            # A focus request on another thread must not wait on X round trips.
+            self.assertFalse(self.index._lock.locked())
+            return self.read_window(window_id)
+
+        self.index.apply_client_list([0x100, 0x200], read_window)
+
+        self.assertEqual(self.index.windows_for_pid(0x10), [0x100])
+
+    def test_activate_without_display_fails(self):
+        self.assertFalse(self.index.activate(0x100))
+
+
+class IdleDisplay:
+    """An X display connection that never receives an event."""
+
+    def __init__(self) -> None:
+        self.read_fd, self.write_fd = os.pipe()
+        root = SimpleNamespace(
+            change_attributes=lambda **kwargs: None,
+            get_full_property=lambda *args: None,
+        )
+        self.screen = lambda: SimpleNamespace(root=root)
+        self.closed = False
+
+    def intern_atom(self, name: str) -> int:
+        return 1
+
+    def fileno(self) -> int:
+        return self.read_fd
+
+    def pending_events(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+        self.closed = True
+
+
+@unittest.skipUnless(xdisplay is not None, "requires python-xlib")
+class TestWindowIndexStop(unittest.TestCase):
+    def test_event_thread_stops_within_shutdown_budget(self):
+        index = WindowIndex()
+        display = IdleDisplay()
+        index._waker = waker = Waker()
+        index._thread = threading.Thread(target=index._run, args=(display,))
+        index._thread.start()
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        index.stop()
+
+        self.assertLess(time.perf_counter() - start, SHUTDOWN_BUDGET)
+        self.assertTrue(display.closed)
+        self.assertEqual(waker.fileno(), -1)
+
+
+class TestWindowResolver(ProcTreeTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # 100 terminal -> 101 bash -> 102 emulationstation; 200 kodi.
+        self.add_process(100, "x-terminal-emul", ppid=50)
+        self.add_process(101, "bash", ppid=100)
+        self.add_process(102, "emulationstatio", ppid=101)
+        self.add_process(200, "kodi", ppid=50)
+        self.add_process(201, "kodi-helper", ppid=200)
+        self.index = WindowIndex()
+        self.windows = {0xA: 100, 0xB: 201}
+        self.index.apply_client_list(
+            list(self.windows),
+            lambda wid: WindowInfo(wid, self.windows[wid], ()),
+        )
+        self.resolver = WindowResolver(self.index)
+        self.tree_calls = 0
+
+    def tree(self) -> ProcessTree:
+        self.tree_calls += 1
+        return ProcessSnapshot(ProcfsScanner(root=self.proc_root)).tree()
+
+    def test_read_ppid_with_parentheses_in_name(self):
+        self.add_process(300, "weird) (name", ppid=42)
+        self.assertEqual(read_ppid(300, self.proc_root), 42)
+        self.assertIsNone(read_ppid(301, self.proc_root))
+
+    def test_tree_walks(self):
+        tree = self.tree()
+        self.assertEqual(list(tree.ancestors(102)), [101, 100, 50])
+        self.assertEqual(list(tree.ancestors(102, limit=1)), [101])
+        self.assertEqual(list(tree.descendants(100)), [101, 102])
+
+    def test_direct_window_skips_tree(self):
+        self.assertEqual(self.resolver.resolve(100, self.tree), 0xA)
+        self.assertEqual(self.tree_calls, 0)
+
+    def test_wrapped_command_resolves_to_ancestor(self):
+        self.assertEqual(self.resolver.resolve(102, self.tree), 0xA)
+
+    def test_resolves_to_descendant(self):
+        self.assertEqual(self.resolver.resolve(200, self.tree), 0xB)
+
+    def test_remembers_window_per_app(self):
+        self.resolver.resolve(102, self.tree, key="retropie")
+        self.assertEqual(self.resolver.remembered("retropie"), 0xA)
+        self.assertIsNone(self.resolver.remembered("kodi"))
+
+    def test_forgets_closed_window(self):
+        self.resolver.resolve(102, self.tree, key="retropie")
+        self.index.apply_client_list([0xB], lambda wid: None)
+        self.assertIsNone(self.resolver.remembered("retropie"))
+
+
+@unittest.skipUnless(
+    xdisplay is not None and shutil.which("Xvfb"), "requires python-xlib and Xvfb"
+)
+class TestWindowIndexXvfb(unittest.TestCase):
+    def setUp(self) -> None:
+        self.xvfb = subprocess.Popen(
+            ["Xvfb", XVFB_DISPLAY, "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 5
+        while not os.path.exists(f"/tmp/.X11-unix/X{XVFB_DISPLAY[1:]}"):
+            if time.monotonic() > deadline:
+                self.fail("Xvfb did not start")
+            time.sleep(0.05)
+        self.display = xdisplay.Display(XVFB_DISPLAY)
+        self.index = WindowIndex(XVFB_DISPLAY)
+
+    def tearDown(self) -> None:
+        self.index.stop()
+        self.display.close()
+        self.xvfb.terminate()
+        self.xvfb.wait()
+
+    def publish_client(self, pid: int) -> int:
+        from Xlib import X, Xatom
+
+        root = self.display.screen().root
+        window = root.create_window(0, 0, 10, 10, 0, X.CopyFromParent)
+        window.set_wm_class("app", "App")
+        window.change_property(
+            self.display.intern_atom("_NET_WM_PID"), Xatom.CARDINAL, 32, [pid]
+        )
+        root.change_property(
+            self.display.intern_atom("_NET_CLIENT_LIST"), Xatom.WINDOW, 32, [window.id]
+        )
+        self.display.flush()
+        return window.id
+
+    def wait_for(self, predicate) -> None:
+        deadline = time.monotonic() + 2
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_follows_client_list_and_activates(self):
+        self.assertTrue(self.index.start())
+        window_id = self.publish_client(4242)
+
+        self.wait_for(lambda: self.index.has_window(window_id))
+        self.assertEqual(self.index.windows_for_pid(4242), [window_id])
+
+        start = time.perf_counter()
+        self.assertTrue(self.index.activate(window_id))
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()